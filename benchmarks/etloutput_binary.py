@@ -0,0 +1,78 @@
+"""
+Benchmark loading an etl output serialized with `to_bytes()` against creating it
+from the JSON of its pages, with `Token`s and with compact tokens, using the pages in
+`tests/data` repeated to the requested page count.
+
+    python benchmarks/etloutput_binary.py --pages 100
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from itertools import cycle, islice
+from pathlib import Path
+
+from indico_toolkit.etloutput import EtlOutput
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data" / "etloutput"
+
+
+def benchmark(load: "Callable[[], object]", repeat: int) -> float:
+    """
+    Return the fastest of `repeat` times to call `load`.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Only folders with tables, so that every page has text, tokens, and tables.
+    folders = sorted(path.parent for path in DATA_FOLDER.glob("**/tables_0.json"))
+    page_files = [
+        (folder, page)
+        for folder in folders
+        for page in range(len(list(folder.glob("page_*_text.txt"))))
+    ]
+    pages = list(islice(cycle(page_files), args.pages))
+    text_pages = [
+        (folder / f"page_{page}_text.txt").read_text() for folder, page in pages
+    ]
+    token_pages = [
+        (folder / f"page_{page}_tokens.json").read_bytes() for folder, page in pages
+    ]
+    table_pages = [
+        (folder / f"tables_{page}.json").read_bytes() for folder, page in pages
+    ]
+    print(f"{args.pages} pages")
+
+    for compact_tokens in (False, True):
+
+        def from_json() -> EtlOutput:
+            return EtlOutput.from_pages(
+                text_pages, token_pages, table_pages, compact_tokens=compact_tokens
+            )
+
+        data = from_json().to_bytes()
+        json_seconds = benchmark(from_json, args.repeat)
+        bytes_seconds = benchmark(lambda: EtlOutput.from_bytes(data), args.repeat)
+        tokens = "compact tokens" if compact_tokens else "tokens"
+        print(
+            f"  {tokens:<16} from JSON {json_seconds * 1000:>8.1f} ms  "
+            f"from bytes {bytes_seconds * 1000:>8.1f} ms "
+            f"{json_seconds / bytes_seconds:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark decoding the pages of a large etl output serially and in a process pool,
+using the pages in `tests/data` repeated to the requested page count.
+
+    python benchmarks/etloutput_decode.py --pages 500 --workers 8
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import cycle, islice
+from pathlib import Path
+
+from indico_toolkit.etloutput import EtlOutput
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data" / "etloutput"
+
+
+def benchmark(
+    token_pages: "list[bytes]",
+    table_pages: "list[bytes]",
+    executor: "Executor | None",
+    repeat: int,
+) -> float:
+    """
+    Return the fastest of `repeat` times to decode every page.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        EtlOutput.from_pages((), token_pages, table_pages, executor=executor)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    token_files = sorted(DATA_FOLDER.glob("**/page_*_tokens.json"))
+    table_files = sorted(DATA_FOLDER.glob("**/tables_*.json"))
+    token_pages = [path.read_bytes() for path in islice(cycle(token_files), args.pages)]
+    table_pages = [path.read_bytes() for path in islice(cycle(table_files), args.pages)]
+    print(f"{args.pages} pages, {args.workers} workers")
+
+    serial = benchmark(token_pages, table_pages, None, args.repeat)
+    print(f"  {'serial':<8} {serial * 1000:>8.1f} ms")
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        # Start the workers before timing.
+        EtlOutput.from_pages((), token_pages, table_pages, executor=executor)
+        pooled = benchmark(token_pages, table_pages, executor, args.repeat)
+
+    print(f"  {'pooled':<8} {pooled * 1000:>8.1f} ms {serial / pooled:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
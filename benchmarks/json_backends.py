@@ -0,0 +1,70 @@
+"""
+Benchmark the JSON backends available to `set_json_backend()` on the result files and
+etl outputs in `tests/data`.
+
+    python benchmarks/json_backends.py
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from indico_toolkit.etloutput.utils import JSON_BACKENDS, JsonLoader, json_loader
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data"
+
+
+def benchmark(loads: "JsonLoader", files: "list[bytes]", repeat: int) -> float:
+    """
+    Return the fastest of `repeat` times to decode every file in `files`.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for data in files:
+            loads(data)
+
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    groups = {
+        "results": [path.read_bytes() for path in DATA_FOLDER.glob("results/*.json")],
+        "etloutput": [
+            path.read_bytes() for path in DATA_FOLDER.glob("etloutput/**/*.json")
+        ],
+    }
+
+    for group, files in groups.items():
+        size = sum(map(len, files)) / 2**20
+        print(f"{group}: {len(files)} files, {size:.1f} MiB")
+
+        # The stdlib path before backends were pluggable decoded bytes to str first.
+        baseline = benchmark(lambda data: json.loads(data.decode()), files, args.repeat)
+        print(f"  {'json (str)':<12} {baseline * 1000:>8.1f} ms")
+
+        for backend in JSON_BACKENDS:
+            try:
+                loads = json_loader(backend)
+            except ImportError:
+                print(f"  {backend:<12} not installed")
+                continue
+
+            seconds = benchmark(loads, files, args.repeat)
+            print(
+                f"  {backend:<12} {seconds * 1000:>8.1f} ms "
+                f"{baseline / seconds:>5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
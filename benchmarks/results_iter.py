@@ -0,0 +1,71 @@
+"""
+Benchmark peak memory of iterating over the documents of a result file opened in
+binary mode with `iter_documents()` against reading it and loading it with `load()`.
+Peak memory includes the file's contents once they're read.
+
+Documents are synthesized as in `results_load.py` and written to a temporary file.
+
+    python benchmarks/results_iter.py --documents 500 --predictions 50000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from results_load import synthesize
+
+from indico_toolkit import results
+
+
+def load(path: Path) -> int:
+    return len(results.load(path.read_bytes()).predictions)
+
+
+def iterate(path: Path) -> int:
+    with path.open("rb") as file:
+        return sum(len(predictions) for _, predictions in results.iter_documents(file))
+
+
+def benchmark(function: "Callable[[Path], int]", path: Path) -> "tuple[float, int]":
+    """
+    Return the time and peak traced memory in bytes to call `function`, measured in
+    separate calls because tracing slows it down.
+    """
+    start = time.perf_counter()
+    function(path)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--predictions", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "result.json"
+        path.write_text(synthesize(args.documents, args.predictions))
+        print(
+            f"{args.documents} documents {load(path)} predictions "
+            f"{path.stat().st_size / 2**20:.1f} MiB"
+        )
+
+        for name, function in (("load()", load), ("iter_documents()", iterate)):
+            seconds, peak = benchmark(function, path)
+            print(
+                f"  {name:<18} {seconds * 1000:>9.1f} ms "
+                f"{peak / 2**20:>8.1f} MiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark loading result files with many documents and predictions.
+
+Documents from a test result file are replicated with new IDs and their extractions
+repeated to reach the target number of predictions, then loaded at several sizes
+to show how loading time scales.
+
+    python benchmarks/results_load.py --documents 500 --predictions 50000
+"""
+
+import argparse
+import json
+import time
+from copy import deepcopy
+from pathlib import Path
+
+from indico_toolkit.results import Result
+
+RESULT_FILE = (
+    Path(__file__).parent.parent
+    / "tests"
+    / "data"
+    / "results"
+    / "classify_extract_accepted.json"
+)
+
+
+def synthesize(documents: int, predictions: int) -> str:
+    """
+    Return a result file as JSON with `documents` documents and about `predictions`
+    predictions in total.
+    """
+    result = json.loads(RESULT_FILE.read_text())
+    template = result["submission_results"][0]
+    per_document = max(predictions // documents, 1)
+    submission_results = []
+
+    for document_id in range(1, documents + 1):
+        document = deepcopy(template)
+        document["submissionfile_id"] = document_id
+
+        for stage in document["model_results"].values():
+            per_task = max(per_document // (2 * len(stage)), 1)
+
+            for task_id, task_predictions in stage.items():
+                if task_predictions:
+                    repeats = per_task // len(task_predictions) + 1
+                    stage[task_id] = (task_predictions * repeats)[:per_task]
+
+        submission_results.append(document)
+
+    result["submission_results"] = submission_results
+    result["errored_files"] = {}
+    return json.dumps(result)
+
+
+def benchmark(documents: int, predictions: int, repeat: int) -> "tuple[float, int]":
+    """
+    Return the fastest of `repeat` loads, excluding JSON parsing, and the number of
+    predictions loaded.
+    """
+    result_json = synthesize(documents, predictions)
+    timings = []
+
+    for _ in range(repeat):
+        result_dict = json.loads(result_json)
+        start = time.perf_counter()
+        result = Result.from_dict(result_dict)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), len(result.predictions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--predictions", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for scale in (8, 4, 2, 1):
+        documents = max(args.documents // scale, 1)
+        predictions = args.predictions // scale
+        seconds, predictions = benchmark(documents, predictions, args.repeat)
+        microseconds = seconds / predictions * 1e6
+        print(
+            f"{documents:>6} documents {predictions:>8} predictions "
+            f"{seconds * 1000:>9.1f} ms {microseconds:>6.2f} µs/prediction"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark decoding the token dictionaries in `tests/data` with `Token.from_dict()`,
+which checks well-formed tokens against a schema in one step, against checking each
+field with `get()`, as it does for malformed tokens. Tokens are repeated to the
+requested count.
+
+    python benchmarks/token_decode.py --tokens 10000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from itertools import cycle, islice
+from pathlib import Path
+
+from indico_toolkit.etloutput import Box, Span, Token
+from indico_toolkit.etloutput.utils import get
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data" / "etloutput"
+
+
+def token_from_dict_with_get(token: object) -> Token:
+    """
+    Decode a token dictionary by checking each field with `get()`.
+    """
+    page = get(token, int, "page_num")
+    position = get(token, dict, "position")
+    doc_offset = get(token, dict, "doc_offset")
+
+    return Token(
+        text=get(token, str, "text"),
+        box=Box(
+            page=page,
+            top=get(position, int, "top"),
+            left=get(position, int, "left"),
+            right=get(position, int, "right"),
+            bottom=get(position, int, "bottom"),
+        ),
+        span=Span(
+            page=page,
+            start=get(doc_offset, int, "start"),
+            end=get(doc_offset, int, "end"),
+        ),
+    )
+
+
+def benchmark(
+    from_dict: "Callable[[object], Token]", tokens: "list[object]", repeat: int
+) -> float:
+    """
+    Return the fastest of `repeat` times to decode every token.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list(map(from_dict, tokens))
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    token_dicts = [
+        token
+        for path in sorted(DATA_FOLDER.glob("**/page_*_tokens.json"))
+        for token in json.loads(path.read_bytes())
+    ]
+    tokens = list(islice(cycle(token_dicts), args.tokens))
+    print(f"{len(tokens)} tokens")
+
+    baseline = benchmark(token_from_dict_with_get, tokens, args.repeat)
+    print(f"  {'get()':<12} {baseline * 1000:>8.1f} ms")
+
+    seconds = benchmark(Token.from_dict, tokens, args.repeat)
+    print(
+        f"  {'from_dict()':<12} {seconds * 1000:>8.1f} ms {baseline / seconds:>5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark the memory held by tokens as `Token`s against `TokenColumns`, using the
+token pages in `tests/data` repeated to the requested token count.
+
+Each page is decoded from its own copy of the JSON so that tokens don't share text,
+and memory is measured after the token dictionaries are freed, such that it's only
+what the tokens themselves hold.
+
+    python benchmarks/token_memory.py --tokens 100000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable, Sequence
+from itertools import cycle
+from pathlib import Path
+
+from indico_toolkit.etloutput import Token, TokenColumns
+from indico_toolkit.etloutput.etloutput import tokens_from_dicts
+
+DATA_FOLDER = Path(__file__).parent.parent / "tests" / "data" / "etloutput"
+
+
+def benchmark(
+    from_dicts: "Callable[[list[object]], Sequence[Token]]",
+    pages: "list[bytes]",
+    token_count: int,
+) -> int:
+    """
+    Return the memory in bytes held by tokens created from `pages` until there are
+    `token_count` tokens.
+    """
+    tracemalloc.start()
+    tokens: "list[Sequence[Token]]" = []
+    count = 0
+
+    for page in cycle(pages):
+        if count >= token_count:
+            break
+
+        token_dicts = json.loads(page)
+        tokens.append(from_dicts(token_dicts))
+        count += len(token_dicts)
+        del token_dicts
+
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pages = [
+        path.read_bytes() for path in sorted(DATA_FOLDER.glob("**/page_*_tokens.json"))
+    ]
+    print(f"{args.tokens} tokens")
+
+    token_size = benchmark(tokens_from_dicts, pages, args.tokens)
+    column_size = benchmark(TokenColumns.from_dicts, pages, args.tokens)
+    print(f"  {'Token':<14} {token_size / 2**20:>8.1f} MiB")
+    print(
+        f"  {'TokenColumns':<14} {column_size / 2**20:>8.1f} MiB "
+        f"{token_size / column_size:>5.1f}x less"
+    )
+
+
+if __name__ == "__main__":
+    main()
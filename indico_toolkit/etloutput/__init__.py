@@ -1,24 +1,37 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, TypeAlias, TypeVar
 
 from .box import NULL_BOX, Box
+from .cache import EtlOutputCache
 from .cell import NULL_CELL, Cell, CellType
+from .columns import TokenColumns
 from .etloutput import EtlOutput
+from .lazy import LazyEtlOutput
+from .mapped import MappedEtlOutput, MappedText
 from .range import NULL_RANGE, Range
 from .span import NULL_SPAN, Span
 from .table import NULL_TABLE, Table
 from .token import NULL_TOKEN, Token
-from .utils import get, has, json_loaded, str_decoded
+from .utils import get, has, json_loaded, set_json_backend, str_decoded
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
+    from concurrent.futures import Executor
+    from typing import Any, TypeGuard
 
 __all__ = (
     "Box",
     "Cell",
     "CellType",
     "EtlOutput",
+    "EtlOutputCache",
+    "LazyEtlOutput",
     "load",
     "load_async",
+    "MappedEtlOutput",
+    "MappedText",
     "NULL_BOX",
     "NULL_CELL",
     "NULL_RANGE",
@@ -26,9 +39,11 @@ __all__ = (
     "NULL_TABLE",
     "NULL_TOKEN",
     "Range",
+    "set_json_backend",
     "Span",
     "Table",
     "Token",
+    "TokenColumns",
 )
 
 Loadable: TypeAlias = "dict[str, object] | list[object] | str | bytes"
@@ -43,6 +58,13 @@ def load(
     text: bool = True,
     tokens: bool = True,
     tables: bool = True,
+    executor: "Executor | None" = None,
+    max_workers: "int | None" = None,
+    decode_executor: "Executor | None" = None,
+    lazy: bool = False,
+    compact_tokens: bool = False,
+    cache: "EtlOutputCache | None" = None,
+    mmap: bool = False,
 ) -> EtlOutput:
     """
     Load `etl_output` as an `EtlOutput` dataclass.
@@ -54,15 +76,99 @@ def load(
 
     Use `text`, `tokens`, and `tables` to specify what not to load.
 
+    Use `executor` to read and parse pages concurrently in an existing
+    `concurrent.futures` executor, or `max_workers` to do so in a new thread pool
+    with that many workers. Pages are always assembled in order. By default, pages are
+    read one at a time. In a `ProcessPoolExecutor`, `reader` must be picklable.
+
+    Use `decode_executor` to parse and decode pages of tokens and tables in a
+    `concurrent.futures` executor, such as a `ProcessPoolExecutor` to use multiple
+    cores. Pages are read as usual and passed to it as JSON.
+
+    Use `lazy` to return a `LazyEtlOutput` that only reads and parses each page when
+    it's first accessed. This can't be combined with `executor`, `max_workers`, or
+    `decode_executor`.
+
+    Use `compact_tokens` to store tokens as `TokenColumns` instead of `Token`s,
+    which uses a fraction of the memory for documents with many tokens.
+
+    Use `cache` to store loaded etl outputs in an `EtlOutputCache` keyed by URI and
+    the `text`, `tokens`, `tables`, and `compact_tokens` options. A cache hit skips
+    reading and parsing entirely. Etl outputs not loaded from a URI aren't cached.
+    This can't be combined with `lazy`.
+
+    Use `mmap` with `cache` to return a `MappedEtlOutput` that memory-maps the cached
+    file rather than reading it into memory. Processes that load the same etl output
+    share one copy of its text and tokens.
+
     ```
     result = results.load(submission.result_file, reader=read_uri)
     etl_outputs = {
-        document: etloutput.load(document.etl_output_uri, reader=read_uri)
+        document: etloutput.load(
+            document.etl_output_uri, reader=read_uri, max_workers=16
+        )
         for document in result.documents
         if not document.failed
     }
     ```
     """
+    if executor is not None and max_workers is not None:
+        raise ValueError("specify either `executor` or `max_workers`, not both")
+
+    if lazy and (executor is not None or max_workers is not None):
+        raise ValueError("lazy loading can't use `executor` or `max_workers`")
+
+    if lazy and decode_executor is not None:
+        raise ValueError("lazy loading can't use `decode_executor`")
+
+    if lazy and cache is not None:
+        raise ValueError("lazy loading can't use `cache`")
+
+    if mmap and cache is None:
+        raise ValueError("memory mapping requires `cache`")
+
+    if cache is not None and _is_uri(etl_output):
+        key = cache.key(
+            etl_output,
+            text=text,
+            tokens=tokens,
+            tables=tables,
+            compact_tokens=compact_tokens,
+        )
+        cached = cache.get(key, mmap=mmap)
+
+        if cached is None:
+            cached = load(
+                etl_output,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                executor=executor,
+                max_workers=max_workers,
+                decode_executor=decode_executor,
+                compact_tokens=compact_tokens,
+            )
+            cache.put(key, cached)
+
+            if mmap:
+                cached = cache.get(key, mmap=True) or cached
+
+        return cached
+
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers) as executor:
+            return load(
+                etl_output,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                executor=executor,
+                decode_executor=decode_executor,
+                compact_tokens=compact_tokens,
+            )
+
     if not isinstance(etl_output, dict):
         if (isinstance(etl_output, str) and etl_output.startswith("{")) or (
             isinstance(etl_output, bytes) and etl_output.startswith(b"{")
@@ -71,30 +177,37 @@ def load(
         else:
             etl_output = json_loaded(reader(etl_output))  # type: ignore[arg-type]
 
-    pages = get(etl_output, list, "pages")
+    text_uris, token_uris, table_uris = _page_uris(etl_output, text, tokens, tables)
 
-    if text and has(pages, str, 0, "text"):
-        text_pages = map(
-            lambda page: str_decoded(reader(get(page, str, "text"))), pages  # type: ignore[arg-type]
+    if lazy:
+        return LazyEtlOutput.from_uris(
+            reader,
+            text_uris,
+            token_uris,
+            table_uris,
+            page_starts=_page_starts(etl_output),
+            compact_tokens=compact_tokens,
         )
-    else:
-        text_pages = ()  # type: ignore[assignment]
 
-    if tokens and has(pages, str, 0, "tokens"):
-        token_dict_pages = map(
-            lambda page: json_loaded(reader(get(page, str, "tokens"))), pages
-        )
-    else:
-        token_dict_pages = ()  # type: ignore[assignment]
+    # `Executor.map()` submits every read immediately and yields results in order,
+    # whereas builtin `map()` reads each page lazily as `from_pages()` consumes it.
+    mapper = executor.map if executor is not None else map
 
-    if tables and has(pages, str, 0, "tables"):
-        table_dict_pages = map(
-            lambda page: json_loaded(reader(get(page, str, "tables"))), pages
+    if decode_executor is not None:
+        return EtlOutput.from_pages(
+            mapper(partial(_read_text, reader), text_uris),
+            mapper(reader, token_uris),
+            mapper(reader, table_uris),
+            compact_tokens=compact_tokens,
+            executor=decode_executor,
         )
-    else:
-        table_dict_pages = ()  # type: ignore[assignment]
 
-    return EtlOutput.from_pages(text_pages, token_dict_pages, table_dict_pages)
+    return EtlOutput.from_pages(
+        mapper(partial(_read_text, reader), text_uris),
+        mapper(partial(_read_json, reader), token_uris),
+        mapper(partial(_read_json, reader), table_uris),
+        compact_tokens=compact_tokens,
+    )
 
 
 async def load_async(
@@ -104,6 +217,10 @@ async def load_async(
     text: bool = True,
     tokens: bool = True,
     tables: bool = True,
+    max_concurrency: "int | None" = None,
+    compact_tokens: bool = False,
+    cache: "EtlOutputCache | None" = None,
+    mmap: bool = False,
 ) -> EtlOutput:
     """
     Load `etl_output` as an `EtlOutput` dataclass.
@@ -115,15 +232,67 @@ async def load_async(
 
     Use `text`, `tokens`, and `tables` to specify what not to load.
 
+    Use `max_concurrency` to read the text, tokens, and tables of all pages
+    concurrently, with at most that many reads in progress at once. By default, pages
+    are read one at a time.
+
+    Use `compact_tokens` to store tokens as `TokenColumns` instead of `Token`s,
+    which uses a fraction of the memory for documents with many tokens.
+
+    Use `cache` to store loaded etl outputs in an `EtlOutputCache` keyed by URI and
+    the `text`, `tokens`, `tables`, and `compact_tokens` options. A cache hit skips
+    reading and parsing entirely. Etl outputs not loaded from a URI aren't cached.
+
+    Use `mmap` with `cache` to return a `MappedEtlOutput` that memory-maps the cached
+    file rather than reading it into memory. Processes that load the same etl output
+    share one copy of its text and tokens.
+
     ```
     result = await results.load_async(submission.result_file, reader=read_uri)
     etl_outputs = {
-        document: await etloutput.load_async(document.etl_output_uri, reader=read_uri)
+        document: await etloutput.load_async(
+            document.etl_output_uri, reader=read_uri, max_concurrency=16
+        )
         for document in result.documents
         if not document.failed
     }
     ```
     """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1")
+
+    if mmap and cache is None:
+        raise ValueError("memory mapping requires `cache`")
+
+    if cache is not None and _is_uri(etl_output):
+        key = cache.key(
+            etl_output,
+            text=text,
+            tokens=tokens,
+            tables=tables,
+            compact_tokens=compact_tokens,
+        )
+        # Cache reads and writes are file IO, so they're done in a thread to avoid
+        # blocking the event loop.
+        cached = await asyncio.to_thread(cache.get, key, mmap=mmap)
+
+        if cached is None:
+            cached = await load_async(
+                etl_output,
+                reader=reader,
+                text=text,
+                tokens=tokens,
+                tables=tables,
+                max_concurrency=max_concurrency,
+                compact_tokens=compact_tokens,
+            )
+            await asyncio.to_thread(cache.put, key, cached)
+
+            if mmap:
+                cached = await asyncio.to_thread(cache.get, key, mmap=True) or cached
+
+        return cached
+
     if not isinstance(etl_output, dict):
         if (isinstance(etl_output, str) and etl_output.startswith("{")) or (
             isinstance(etl_output, bytes) and etl_output.startswith(b"{")
@@ -132,27 +301,104 @@ async def load_async(
         else:
             etl_output = json_loaded(await reader(etl_output))  # type: ignore[arg-type]
 
+    text_uris, token_uris, table_uris = _page_uris(etl_output, text, tokens, tables)
+    loaded = await _read_async(
+        reader, (*text_uris, *token_uris, *table_uris), max_concurrency
+    )
+    text_count, token_count = len(text_uris), len(token_uris)
+
+    return EtlOutput.from_pages(
+        map(str_decoded, loaded[:text_count]),  # type: ignore[arg-type]
+        map(json_loaded, loaded[text_count : text_count + token_count]),
+        map(json_loaded, loaded[text_count + token_count :]),
+        compact_tokens=compact_tokens,
+    )
+
+
+def _read_text(reader: "Callable[[URI], Loadable]", uri: URI) -> str:
+    """
+    Read a page of text. Defined at module level to be picklable with `reader`.
+    """
+    return str_decoded(reader(uri))  # type: ignore[arg-type]
+
+
+def _read_json(reader: "Callable[[URI], Loadable]", uri: URI) -> "Any":
+    """
+    Read and parse a page of tokens or tables. Defined at module level to be
+    picklable with `reader`.
+    """
+    return json_loaded(reader(uri))
+
+
+def _is_uri(etl_output: object) -> "TypeGuard[URI]":
+    """
+    Return whether `etl_output` is a URI to be read rather than loadable JSON.
+    """
+    return isinstance(etl_output, str) and not etl_output.startswith("{")
+
+
+def _page_uris(
+    etl_output: object, text: bool, tokens: bool, tables: bool
+) -> "tuple[list[URI], list[URI], list[URI]]":
+    """
+    Return the text, token, and table URIs for every page of `etl_output`,
+    omitting those that weren't requested or aren't present.
+    """
     pages = get(etl_output, list, "pages")
 
     if text and has(pages, str, 0, "text"):
-        text_pages = [
-            str_decoded(await reader(get(page, str, "text"))) for page in pages  # type: ignore[arg-type]
-        ]
+        text_uris = [get(page, str, "text") for page in pages]
     else:
-        text_pages = ()  # type: ignore[assignment]
+        text_uris = []
 
     if tokens and has(pages, str, 0, "tokens"):
-        token_dict_pages = [
-            json_loaded(await reader(get(page, str, "tokens"))) for page in pages
-        ]
+        token_uris = [get(page, str, "tokens") for page in pages]
     else:
-        token_dict_pages = ()  # type: ignore[assignment]
+        token_uris = []
 
     if tables and has(pages, str, 0, "tables"):
-        table_dict_pages = [
-            json_loaded(await reader(get(page, str, "tables"))) for page in pages
-        ]
+        table_uris = [get(page, str, "tables") for page in pages]
     else:
-        table_dict_pages = ()  # type: ignore[assignment]
+        table_uris = []
+
+    return text_uris, token_uris, table_uris
+
+
+def _page_starts(etl_output: object) -> "tuple[int, ...] | None":
+    """
+    Return the document offset at which each page's text starts, if available.
+    """
+    pages = get(etl_output, list, "pages")
+
+    if all(has(page, int, "doc_offset", "start") for page in pages):
+        return tuple(get(page, int, "doc_offset", "start") for page in pages)
+    else:
+        return None
+
+
+async def _read_async(
+    reader: "Callable[[URI], Awaitable[Loadable]]",
+    uris: "Sequence[URI]",
+    max_concurrency: "int | None",
+) -> "list[Loadable]":
+    """
+    Read `uris` in order, or concurrently if `max_concurrency` is specified.
+    If any read fails, cancel those still in progress.
+    """
+    if max_concurrency is None:
+        return [await reader(uri) for uri in uris]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def read(uri: URI) -> "Loadable":
+        async with semaphore:
+            return await reader(uri)
+
+    reads = [asyncio.ensure_future(read(uri)) for uri in uris]
 
-    return EtlOutput.from_pages(text_pages, token_dict_pages, table_dict_pages)
+    try:
+        return await asyncio.gather(*reads)
+    except BaseException:
+        for pending_read in reads:
+            pending_read.cancel()
+        raise
@@ -0,0 +1,245 @@
+import io
+import pickle
+import re
+import struct
+import sys
+from array import array
+from itertools import starmap
+from typing import TYPE_CHECKING
+
+from .box import Box
+from .cell import Cell, CellType
+from .range import Range
+from .span import Span
+from .table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any
+
+    from typing_extensions import Buffer
+
+HEADER = struct.Struct("<4sHH")  # Magic number, format version, section count.
+SECTION = struct.Struct("<QQ")  # Section offset, section length.
+ALIGNMENT = 8
+TEXT_ENCODINGS = {1: "latin-1", 2: "utf-16-le", 4: "utf-32-le"}
+SURROGATES = re.compile("[\ud800-\udfff]")
+CELL_TYPES = {cell_type.value: cell_type for cell_type in CellType}
+
+
+def pack(magic: bytes, version: int, sections: "Sequence[Buffer]") -> bytes:
+    """
+    Frame `sections` behind a header identifying the format by `magic` and `version`
+    and a table of section offsets and lengths.
+
+    Sections are aligned to 8 bytes so integer columns can be cast in place.
+    """
+    views = [memoryview(section).cast("B") for section in sections]
+    offset = HEADER.size + SECTION.size * len(views)
+    bounds = []
+
+    for view in views:
+        offset += -offset % ALIGNMENT
+        bounds.append((offset, view.nbytes))
+        offset += view.nbytes
+
+    data = bytearray(offset)
+    HEADER.pack_into(data, 0, magic, version, len(views))
+
+    for index, ((start, length), view) in enumerate(zip(bounds, views)):
+        SECTION.pack_into(data, HEADER.size + SECTION.size * index, start, length)
+        data[start : start + length] = view
+
+    return bytes(data)
+
+
+def unpack(data: "Buffer", magic: bytes, version: int) -> "list[memoryview]":
+    """
+    Return zero-copy views of the sections framed by `pack()`.
+    Raise an error if `data` isn't in the format identified by `magic` and `version`.
+    """
+    view = memoryview(data).cast("B")
+
+    if view.nbytes < HEADER.size:
+        raise ValueError("data is too short to contain a header")
+
+    data_magic, data_version, count = HEADER.unpack_from(view)
+
+    if data_magic != magic:
+        raise ValueError(f"data doesn't start with magic number {magic!r}")
+
+    if data_version != version:
+        raise ValueError(f"unsupported format version `{data_version}`")
+
+    if view.nbytes < HEADER.size + SECTION.size * count:
+        raise ValueError("data is too short to contain its section table")
+
+    sections = []
+
+    for index in range(count):
+        start, length = SECTION.unpack_from(view, HEADER.size + SECTION.size * index)
+
+        if start + length > view.nbytes:
+            raise ValueError(f"section {index} extends past the end of data")
+
+        sections.append(view[start : start + length])
+
+    return sections
+
+
+class _ValuePickler(pickle.Pickler):
+    def reducer_override(self, obj: object) -> "Any":
+        raise TypeError(f"can't serialize value of type {type(obj)}")
+
+
+class _ValueUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> "Any":
+        raise pickle.UnpicklingError(f"can't load global `{module}.{name}`")
+
+
+def dump_values(values: object) -> bytes:
+    """
+    Serialize plain values: dicts, lists, tuples, sets, strings, numbers, and `None`.
+    """
+    buffer = io.BytesIO()
+    _ValuePickler(buffer, protocol=5).dump(values)
+    return buffer.getvalue()
+
+
+def load_values(section: "Buffer") -> "Any":
+    """
+    Deserialize plain values serialized by `dump_values()`. Anything else, including
+    arbitrary objects that would execute code when unpickled, is rejected.
+    """
+    return _ValueUnpickler(io.BytesIO(section)).load()
+
+
+def text_width(text: str) -> int:
+    """
+    Return the fewest bytes per character that can store every character of `text`,
+    such that it can be sliced by character offset without decoding.
+    """
+    if not text:
+        return 1
+
+    widest = max(text)
+
+    if widest <= "\xff":
+        return 1
+    elif widest <= "\uffff" and not SURROGATES.search(text):
+        return 2
+    else:
+        return 4
+
+
+def dump_text(text: str, width: int) -> bytes:
+    """
+    Encode `text` with `width` bytes per character.
+    """
+    return text.encode(TEXT_ENCODINGS[width], "surrogatepass")
+
+
+def load_text(section: "Buffer", width: int) -> str:
+    """
+    Decode text encoded with `width` bytes per character.
+    """
+    return str(section, TEXT_ENCODINGS[width], "surrogatepass")
+
+
+def dump_ints(values: "Iterable[int]") -> "array[int]":
+    """
+    Pack `values` as a little-endian 32-bit integer column.
+    """
+    column = array("i", values)
+
+    if sys.byteorder == "big":
+        column.byteswap()
+
+    return column
+
+
+def load_ints(section: memoryview) -> "Sequence[int]":
+    """
+    Return a view of a little-endian 32-bit integer column, copying it only on
+    big-endian platforms.
+    """
+    if sys.byteorder == "big":
+        column = array("i", section.tobytes())
+        column.byteswap()
+        return memoryview(column)
+
+    return section.cast("i")
+
+
+def box_row(box: Box) -> "tuple[int, int, int, int, int]":
+    return box.page, box.top, box.left, box.right, box.bottom
+
+
+def span_row(span: Span) -> "tuple[int, int, int]":
+    return span.page, span.start, span.end
+
+
+def cell_row(cell: Cell) -> "tuple[Any, ...]":
+    cell_range = cell.range
+
+    return (
+        cell.type.value,
+        cell.text,
+        box_row(cell.box),
+        (
+            cell_range.row,
+            cell_range.column,
+            cell_range.rowspan,
+            cell_range.columnspan,
+            cell_range.rows,
+            cell_range.columns,
+        ),
+        tuple(map(span_row, cell.spans)),
+    )
+
+
+def cell_from_row(row: "Sequence[Any]") -> Cell:
+    cell_type, text, box, cell_range, spans = row
+
+    return Cell(
+        CELL_TYPES[cell_type],
+        text,
+        Box(*box),
+        Range(*cell_range),
+        tuple(starmap(Span, spans)),
+    )
+
+
+def table_row(table: Table) -> "tuple[Any, ...]":
+    """
+    Rows and columns refer to cells by index so they're shared as they are in
+    `Table.from_dict()`. Cells that are equal to but not the same objects as those in
+    `cells`, such as in tables built by hand or copied, are found by value.
+    """
+    cell_indexes = {id(cell): index for index, cell in enumerate(table.cells)}
+
+    def cell_index(cell: Cell) -> int:
+        index = cell_indexes.get(id(cell))
+        return table.cells.index(cell) if index is None else index
+
+    return (
+        box_row(table.box),
+        tuple(map(span_row, table.spans)),
+        tuple(map(cell_row, table.cells)),
+        tuple(tuple(map(cell_index, row)) for row in table.rows),
+        tuple(tuple(map(cell_index, column)) for column in table.columns),
+    )
+
+
+def table_from_row(row: "Sequence[Any]") -> Table:
+    box, spans, cell_rows, rows, columns = row
+    cells = tuple(map(cell_from_row, cell_rows))
+    cell_at = cells.__getitem__
+
+    return Table(
+        Box(*box),
+        tuple(starmap(Span, spans)),
+        cells,
+        tuple(tuple(map(cell_at, row)) for row in rows),
+        tuple(tuple(map(cell_at, column)) for column in columns),
+    )
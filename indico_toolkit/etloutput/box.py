@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Final
 
+from .decoders import box_row
 from .utils import get
 
 
@@ -65,9 +66,18 @@ class Box:
         )
 
     @staticmethod
-    def from_dict(box: object) -> "Box":
+    def from_dict(box: object, page: "int | None" = None) -> "Box":
+        """
+        Create a `Box` from a position dictionary, on `page` if given rather than its
+        `page_num`. The dictionary isn't modified.
+        """
+        row = box_row(box, page)
+
+        if row is not None:
+            return Box(*row)
+
         return Box(
-            page=get(box, int, "page_num"),
+            page=get(box, int, "page_num") if page is None else page,
             top=get(box, int, "top"),
             left=get(box, int, "left"),
             right=get(box, int, "right"),
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import time
+from hashlib import sha256
+from pathlib import Path
+
+from .etloutput import EtlOutput
+from .mapped import MappedEtlOutput
+
+SUFFIX = ".etl"
+
+
+class EtlOutputCache:
+    """
+    A size-bounded cache of loaded `EtlOutput`s stored as files in a local directory.
+
+    When the total size of cached files exceeds `max_size` bytes, the least recently
+    used are evicted. Entries are written atomically, so multiple processes can share
+    the same directory.
+
+    ```
+    cache = EtlOutputCache("/tmp/etl_output_cache", max_size=2**30)
+    etl_output = etloutput.load(
+        document.etl_output_uri, reader=read_uri, cache=cache
+    )
+    ```
+    """
+
+    def __init__(self, directory: "Path | str", max_size: int = 2**30):
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+        uri: str,
+        *,
+        text: bool,
+        tokens: bool,
+        tables: bool,
+        compact_tokens: bool,
+    ) -> str:
+        """
+        Derive the cache key of the etl output at `uri` loaded with these options.
+        """
+        options = f"{text:d}{tokens:d}{tables:d}{compact_tokens:d}"
+        return sha256(f"{uri}\0{options}".encode()).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """
+        Return the total size in bytes of all cached etl outputs.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def get(self, key: str, *, mmap: bool = False) -> "EtlOutput | None":
+        """
+        Return the cached etl output for `key`, or `None` if it isn't cached.
+        Entries that can't be read are removed and treated as missing.
+
+        Use `mmap` to return a `MappedEtlOutput` of the cached file rather than reading
+        it into memory.
+        """
+        path = self._path(key)
+        etl_output: "EtlOutput"
+
+        try:
+            if mmap:
+                etl_output = MappedEtlOutput.open(path)
+            else:
+                etl_output = EtlOutput.from_bytes(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            _touch(path)
+        except FileNotFoundError:
+            pass
+
+        return etl_output
+
+    def put(self, key: str, etl_output: "EtlOutput") -> None:
+        """
+        Cache `etl_output` for `key` and evict the least recently used entries if the
+        cache is over `max_size`. Etl outputs larger than `max_size` aren't cached.
+        """
+        data = etl_output.to_bytes()
+
+        if len(data) > self.max_size:
+            return
+
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        )
+
+        try:
+            with temp_file:
+                temp_file.write(data)
+
+            _touch(Path(temp_file.name))
+            os.replace(temp_file.name, self._path(key))
+        except BaseException:
+            # Don't leave partially written files behind, which would never be
+            # evicted.
+            Path(temp_file.name).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all cached etl outputs.
+        """
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def _entries(self) -> "list[tuple[int, int, Path]]":
+        """
+        Return the last access time, size, and path of every cached etl output.
+        Entries removed concurrently by another process are skipped.
+        """
+        entries = []
+
+        for path in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        return entries
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used etl outputs until the cache fits `max_size`.
+        """
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+
+def _touch(path: Path) -> None:
+    """
+    Mark `path` as used now with nanosecond precision. Filesystems record implicit
+    modification times at a coarser resolution, which would make LRU order ambiguous.
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
@@ -47,17 +47,15 @@ class Cell:
         """
         Create a `Cell` from a cell dictionary.
         """
-        get(cell, dict, "position")["page_num"] = page
-
-        for doc_offset in get(cell, list, "doc_offsets"):
-            doc_offset["page_num"] = page
-
         return Cell(
             type=CellType(get(cell, str, "cell_type")),
             text=get(cell, str, "text"),
-            box=Box.from_dict(get(cell, dict, "position")),
+            box=Box.from_dict(get(cell, dict, "position"), page),
             range=Range.from_dict(cell),
-            spans=tuple(map(Span.from_dict, get(cell, list, "doc_offsets"))),
+            spans=tuple(
+                Span.from_dict(doc_offset, page)
+                for doc_offset in get(cell, list, "doc_offsets")
+            ),
         )
 
 
@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, TypeAlias
+
+    BoxRow: TypeAlias = "tuple[int, int, int, int, int]"
+    SpanRow: TypeAlias = "tuple[int, int, int]"
+    TokenRow: TypeAlias = "tuple[int, int, int, int, int, int, int, str]"
+
+# Dictionaries that appear in large numbers, such as tokens, are decoded by reading
+# every field at once and checking their types against a schema in one comparison
+# rather than checking each field with `get()`. Those that don't match are decoded
+# with `get()` instead, which raises the same descriptive errors it always has.
+#
+# Exact types are compared so that values `get()` might treat differently, such as
+# subclasses, are always decoded by `get()`.
+BOX_SCHEMA = (dict, int, int, int, int, int)
+SPAN_SCHEMA = (dict, int, int, int)
+TOKEN_SCHEMA = (dict, dict, dict, int, int, int, int, int, int, int, str)
+
+
+def box_row(box: "Any", page: "int | None" = None) -> "BoxRow | None":
+    """
+    Decode a position dictionary into page, top, left, right, and bottom, or return
+    `None` if it doesn't match `BOX_SCHEMA`. The page is read from `page_num` unless
+    it's given.
+    """
+    try:
+        values = (
+            box,
+            box["page_num"] if page is None else page,
+            box["top"],
+            box["left"],
+            box["right"],
+            box["bottom"],
+        )
+    except (KeyError, TypeError, IndexError):
+        return None
+
+    if tuple(map(type, values)) != BOX_SCHEMA:
+        return None
+
+    return values[1:]
+
+
+def span_row(span: "Any", page: "int | None" = None) -> "SpanRow | None":
+    """
+    Decode a doc offset dictionary into page, start, and end, or return `None` if it
+    doesn't match `SPAN_SCHEMA`. The page is read from `page_num` unless it's given.
+    """
+    try:
+        page = span["page_num"] if page is None else page
+        values = (span, page, span["start"], span["end"])
+    except (KeyError, TypeError, IndexError):
+        return None
+
+    if tuple(map(type, values)) != SPAN_SCHEMA:
+        return None
+
+    return values[1:]
+
+
+def token_row(token: "Any") -> "TokenRow | None":
+    """
+    Decode a token dictionary into page, start, end, top, left, right, bottom, and
+    text, or return `None` if it doesn't match `TOKEN_SCHEMA`.
+    """
+    try:
+        position = token["position"]
+        doc_offset = token["doc_offset"]
+        values = (
+            token,
+            position,
+            doc_offset,
+            token["page_num"],
+            doc_offset["start"],
+            doc_offset["end"],
+            position["top"],
+            position["left"],
+            position["right"],
+            position["bottom"],
+            token["text"],
+        )
+    except (KeyError, TypeError, IndexError):
+        return None
+
+    if tuple(map(type, values)) != TOKEN_SCHEMA:
+        return None
+
+    return values[3:]
@@ -1,108 +1,458 @@
 import itertools
+from array import array
 from bisect import bisect_left, bisect_right
 from collections import namedtuple
 from dataclasses import dataclass
 from functools import cached_property
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-from .box import Box
+from .binary import (
+    dump_ints,
+    dump_text,
+    dump_values,
+    load_ints,
+    load_text,
+    load_values,
+    pack,
+    table_from_row,
+    table_row,
+    text_width,
+    unpack,
+)
+from .box import NULL_BOX, Box
+from .columns import COLUMNS, TokenColumns
+from .grid import BoxGrid
+from .pages import LazyPages, Page, TextPages, TextView, page_starts_from_lengths
 from .table import Table
 from .token import NULL_TOKEN, Token
+from .utils import json_loaded
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor
+    from typing import Any
+
+    from typing_extensions import Buffer
 
     from .cell import Cell
     from .span import Span
 
 
+TableCellSpan = namedtuple("TableCellSpan", ["table", "cell", "span"])
+DerivedPage = TypeVar("DerivedPage")
+
+MAGIC = b"IETL"
+VERSION = 1
+
+
+def tokens_from_dicts(token_dicts: "Iterable[object]") -> "tuple[Token, ...]":
+    """
+    Create a page of `Token`s from token dictionaries, ordered by span.
+    """
+    return tuple(sorted(map(Token.from_dict, token_dicts), key=attrgetter("span")))
+
+
+def box_for(tokens: "Sequence[Token]", span: "Span") -> Box:
+    """
+    Return the bounding box of the `tokens` from a page that overlap with `span`
+    or `NULL_BOX` if there aren't any.
+    """
+    if isinstance(tokens, TokenColumns):
+        return tokens.box_for(span)
+
+    first = bisect_right(tokens, span.start, key=attrgetter("span.end"))
+    last = bisect_left(tokens, span.end, lo=first, key=attrgetter("span.start"))
+    tokens = tokens[first:last]
+
+    if not tokens:
+        return NULL_BOX
+
+    return Box(
+        page=span.page,
+        top=min(token.box.top for token in tokens),
+        left=min(token.box.left for token in tokens),
+        right=max(token.box.right for token in tokens),
+        bottom=max(token.box.bottom for token in tokens),
+    )
+
+
+def tables_from_dicts(table_dicts: "Iterable[object]") -> "tuple[Table, ...]":
+    """
+    Create a page of `Table`s from table dictionaries, ordered by bounding box.
+    """
+    return tuple(sorted(map(Table.from_dict, table_dicts), key=attrgetter("box")))
+
+
+def token_columns_from_page(token_dicts: "Iterable[object]") -> TokenColumns:
+    """
+    Create a page of `TokenColumns` from token dictionaries or their JSON, ordered by
+    span.
+    """
+    return TokenColumns.from_dicts(json_loaded(token_dicts))
+
+
+def table_rows_from_page(table_dicts: "Iterable[object]") -> "tuple[Any, ...]":
+    """
+    Create a page of table rows from table dictionaries or their JSON, ordered by
+    bounding box, that are recreated as `Table`s with `table_from_row()`.
+    """
+    return tuple(map(table_row, tables_from_dicts(json_loaded(table_dicts))))
+
+
+def table_cell_spans_from_tables(
+    tables: "Iterable[Table]",
+) -> "tuple[TableCellSpan, ...]":
+    """
+    Order the cells of a page of `Table`s by their spans such that they can be bisected.
+    """
+    return tuple(
+        sorted(
+            (
+                TableCellSpan(table, cell, span)
+                for table in tables
+                for cell in table.cells
+                for span in cell.spans
+                if span
+            ),
+            key=attrgetter("span"),
+        )
+    )
+
+
+def spans_by_page(spans: "Sequence[Span]") -> "Iterator[tuple[int, list[int]]]":
+    """
+    Yield each page of `spans` with the indexes of its spans ordered by start.
+    """
+    ordered = sorted(
+        range(len(spans)), key=lambda index: (spans[index].page, spans[index].start)
+    )
+
+    for page, indexes in itertools.groupby(
+        ordered, key=lambda index: spans[index].page
+    ):
+        yield page, list(indexes)
+
+
+def unpack_etl_output(
+    data: "Buffer",
+) -> "tuple[dict[str, Any], memoryview, memoryview, list[memoryview]]":
+    """
+    Return the values, page text, token text, and token column sections of an etl
+    output serialized with `EtlOutput.to_bytes()`.
+    """
+    values_section, text_section, token_text_section, *token_sections = unpack(
+        data, MAGIC, VERSION
+    )
+
+    values = load_values(values_section)
+
+    return values, text_section, token_text_section, token_sections
+
+
 @dataclass(frozen=True)
 class EtlOutput:
     text: str
-    text_on_page: "tuple[str, ...]"
+    text_on_page: "Sequence[str]"
 
-    tokens: "tuple[Token, ...]"
-    tokens_on_page: "tuple[tuple[Token, ...], ...]"
+    tokens: "Sequence[Token]"
+    tokens_on_page: "Sequence[Sequence[Token]]"
 
     tables: "tuple[Table, ...]"
-    tables_on_page: "tuple[tuple[Table, ...], ...]"
+    tables_on_page: "Sequence[tuple[Table, ...]]"
 
     @staticmethod
     def from_pages(
         text_pages: "Iterable[str]",
         token_dict_pages: "Iterable[Iterable[object]]",
         table_dict_pages: "Iterable[Iterable[object]]",
+        *,
+        compact_tokens: bool = False,
+        executor: "Executor | None" = None,
     ) -> "EtlOutput":
         """
-        Create an `EtlOutput` from pages of text, tokens, and tables.
+        Create an `EtlOutput` from pages of text, tokens, and tables. Pages of tokens
+        and tables can also be JSON strings or bytes.
+
+        Use `compact_tokens` to store tokens as `TokenColumns` instead of `Token`s.
+
+        Use `executor` to decode pages of tokens and tables concurrently in a
+        `concurrent.futures` executor, such as a `ProcessPoolExecutor` to use multiple
+        cores. Pages are always assembled in order. Pages passed as JSON are parsed by
+        the executor as well, which avoids sending their dictionaries to it.
+
+        Pages of text are joined into the document text once and sliced from it as
+        they're accessed rather than stored twice.
         """
         text_pages = tuple(text_pages)
-        token_pages = tuple(
-            tuple(sorted(map(Token.from_dict, token_dict_page), key=attrgetter("span")))
-            for token_dict_page in token_dict_pages
+        tokens: "Sequence[Token]"
+        token_pages: "Sequence[Sequence[Token]]"
+
+        if executor is None:
+            table_pages = tuple(
+                map(tables_from_dicts, map(json_loaded, table_dict_pages))
+            )
+
+            if compact_tokens:
+                column_pages = tuple(map(token_columns_from_page, token_dict_pages))
+            else:
+                token_pages = tuple(
+                    map(tokens_from_dicts, map(json_loaded, token_dict_pages))
+                )
+        else:
+            # Pages are decoded to token columns and table rows, which are a fraction
+            # of the size of the dataclasses they represent to send between processes.
+            column_results = executor.map(token_columns_from_page, token_dict_pages)
+            table_results = executor.map(table_rows_from_page, table_dict_pages)
+
+            column_pages = tuple(column_results)
+            table_pages = tuple(
+                tuple(map(table_from_row, page)) for page in table_results
+            )
+
+            if not compact_tokens:
+                token_pages = tuple(map(tuple, column_pages))
+
+        if compact_tokens:
+            tokens = TokenColumns.concatenate(column_pages)
+            token_pages = tokens.split(map(len, column_pages))
+        else:
+            tokens = tuple(itertools.chain.from_iterable(token_pages))
+
+        text = "\n".join(text_pages)
+
+        return EtlOutput(
+            text=text,
+            text_on_page=TextPages(text, map(len, text_pages)),
+            tokens=tokens,
+            tokens_on_page=token_pages,
+            tables=tuple(itertools.chain.from_iterable(table_pages)),
+            tables_on_page=table_pages,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a compact, versioned binary format loadable with `from_bytes()`.
+
+        Text is stored with a fixed number of bytes per character and tokens as packed
+        integer columns, so both can be read in place from a memory-mapped file.
+
+        Pages are stored as they're assembled by `from_pages()`: `tokens` and `tables`
+        are reassembled from `tokens_on_page` and `tables_on_page`.
+        """
+        if (
+            isinstance(self.text_on_page, TextPages)
+            and self.text_on_page.text is self.text
+        ):
+            page_text = self.text
+        else:
+            page_text = "\n".join(self.text_on_page)
+
+        token_pages = tuple(map(TokenColumns.from_tokens, self.tokens_on_page))
+        tokens = TokenColumns.concatenate(token_pages)
+        page_text_width = text_width(page_text)
+        token_text = str(tokens.text)
+        token_text_width = text_width(token_text)
+        values = {
+            "text": None if self.text == page_text else self.text,
+            "text_width": page_text_width,
+            "page_lengths": [len(page) for page in self.text_on_page],
+            "token_text_width": token_text_width,
+            "token_counts": [len(page) for page in token_pages],
+            "compact_tokens": isinstance(self.tokens, TokenColumns),
+            "tables": [list(map(table_row, page)) for page in self.tables_on_page],
+        }
+
+        return pack(
+            MAGIC,
+            VERSION,
+            [
+                dump_values(values),
+                dump_text(page_text, page_text_width),
+                dump_text(token_text, token_text_width),
+                dump_ints(tokens.text_offsets),
+                *(dump_ints(getattr(tokens, column)) for column in COLUMNS),
+            ],
+        )
+
+    @staticmethod
+    def from_bytes(data: "Buffer") -> "EtlOutput":
+        """
+        Load an `EtlOutput` serialized with `to_bytes()` without parsing JSON.
+
+        Compact tokens are views of `data` rather than copies of it. Loading is about
+        4-6x faster than creating an etl output from the JSON of its pages with compact
+        tokens, but only about 2x with `Token`s, since creating a `Token` for each
+        token takes most of the time.
+        """
+        values, text_section, token_text_section, token_sections = unpack_etl_output(
+            data
         )
+        page_text = load_text(text_section, values["text_width"])
+        columns = TokenColumns(
+            load_text(token_text_section, values["token_text_width"]),
+            *map(load_ints, token_sections),
+        )
+        tokens: "Sequence[Token]" = columns
+        token_pages: "Sequence[Sequence[Token]]" = columns.split(values["token_counts"])
+
+        if not values["compact_tokens"]:
+            token_pages = tuple(map(tuple, token_pages))
+            tokens = tuple(itertools.chain.from_iterable(token_pages))
+
         table_pages = tuple(
-            tuple(sorted(map(Table.from_dict, table_dict_page), key=attrgetter("box")))
-            for table_dict_page in table_dict_pages
+            tuple(map(table_from_row, page)) for page in values["tables"]
         )
 
         return EtlOutput(
-            text="\n".join(text_pages),
-            text_on_page=text_pages,
-            tokens=tuple(itertools.chain.from_iterable(token_pages)),
+            text=page_text if values["text"] is None else values["text"],
+            text_on_page=TextPages(page_text, values["page_lengths"]),
+            tokens=tokens,
             tokens_on_page=token_pages,
             tables=tuple(itertools.chain.from_iterable(table_pages)),
             tables_on_page=table_pages,
         )
 
+    @cached_property
+    def page_starts(self) -> "tuple[int, ...]":
+        """
+        Return the document offset at which each page's text starts.
+        """
+        if isinstance(self.text_on_page, TextPages):
+            return self.text_on_page.page_starts
+
+        return page_starts_from_lengths(map(len, self.text_on_page))
+
+    def page_for_offset(self, offset: int) -> int:
+        """
+        Return the page containing the character at document `offset`. The newline
+        that separates two pages belongs to the page before it.
+        """
+        page_starts = self.page_starts
+
+        if page_starts:
+            text_length = page_starts[-1] + len(self.text_on_page[-1])
+        else:
+            text_length = 0
+
+        if not 0 <= offset < text_length:
+            raise IndexError(f"offset {offset} out of range [0,{text_length})")
+
+        return bisect_right(page_starts, offset) - 1
+
+    def page_text_view(self, page: int) -> TextView:
+        """
+        Return a view of the text of `page` that's sliced by offsets relative to the
+        start of the page, copying only the characters requested.
+        """
+        if isinstance(self.text_on_page, TextPages):
+            return self.text_on_page.view(page)
+
+        text = self.text_on_page[page]
+        return TextView(text, 0, len(text))
+
     def token_for(self, span: "Span") -> Token:
         """
         Return a `Token` that contains every character from `span`
         or `NULL_TOKEN` if one doesn't exist.
         """
         try:
-            tokens = self.tokens_on_page[span.page]
-            first = bisect_right(tokens, span.start, key=attrgetter("span.end"))
-            last = bisect_left(tokens, span.end, lo=first, key=attrgetter("span.start"))
-            tokens = tokens[first:last]
-            assert tokens
-        except (AssertionError, IndexError, ValueError):
+            box = box_for(self.tokens_on_page[span.page], span)
+        except (IndexError, ValueError):
             return NULL_TOKEN
 
-        return Token(
-            text=self.text[span.slice],
-            box=Box(
-                page=span.page,
-                top=min(token.box.top for token in tokens),
-                left=min(token.box.left for token in tokens),
-                right=max(token.box.right for token in tokens),
-                bottom=max(token.box.bottom for token in tokens),
-            ),
-            span=span,
-        )
+        if not box:
+            return NULL_TOKEN
+
+        return Token(text=self._text_for(span), box=box, span=span)
+
+    def _text_for(self, span: "Span") -> str:
+        """
+        Return the document text covered by `span`.
+        """
+        return self.text[span.slice]
+
+    def tokens_for(self, spans: "Iterable[Span]") -> "list[Token]":
+        """
+        Return a `Token` for each span in `spans`, as `token_for()` would.
+
+        Spans are grouped by page once and bisected in the token columns of their
+        pages, which is much faster than calling `token_for()` for each of many spans.
+        Only the pages of `spans` have their tokens converted to columns.
+        """
+        spans = list(spans)
+        tokens = [NULL_TOKEN] * len(spans)
+
+        for page, indexes in spans_by_page(spans):
+            if not 0 <= page < len(self.tokens_on_page):
+                for index in indexes:
+                    tokens[index] = self.token_for(spans[index])
+                continue
 
-    _TableCellSpan = namedtuple("_TableCellSpan", ["table", "cell", "span"])
+            page_tokens = self._token_columns_on_page[page]
+
+            # Overlapping tokens' ends aren't necessarily in order, so each span is
+            # bisected from the start of the page rather than the previous result.
+            for index in indexes:
+                span = spans[index]
+                first, last = page_tokens.overlapping(span)
+
+                if first < last:
+                    tokens[index] = Token(
+                        text=self._text_for(span),
+                        box=page_tokens.bounding_box(first, last, page),
+                        span=span,
+                    )
+
+        return tokens
+
+    def _derived_pages(
+        self,
+        pages: "Sequence[Page]",
+        derive: "Callable[[Page], DerivedPage]",
+    ) -> "Sequence[DerivedPage]":
+        """
+        Derive a lookup structure for each page in `pages` as it's accessed, such that
+        only the pages that are looked up are derived.
+        """
+        return LazyPages(len(pages), lambda page: derive(pages[page]))
+
+    @cached_property
+    def _token_columns_on_page(self) -> "Sequence[TokenColumns]":
+        """
+        Store tokens on each page as columns such that they can be bisected without
+        key functions. Pages of compact tokens are already columns and aren't copied.
+        """
+        return self._derived_pages(self.tokens_on_page, TokenColumns.from_tokens)
 
     @cached_property
-    def _table_cell_spans_on_page(self) -> "tuple[tuple[_TableCellSpan, ...], ...]":
+    def _table_cell_spans_on_page(self) -> "Sequence[tuple[TableCellSpan, ...]]":
         """
         Order table cells on each page by their spans such that they can be bisected.
         """
-        return tuple(
-            tuple(
-                sorted(
+        return self._derived_pages(self.tables_on_page, table_cell_spans_from_tables)
+
+    @cached_property
+    def _table_cell_bounds_on_page(self) -> "Sequence[tuple[array[int], array[int]]]":
+        """
+        Store the starts and ends of table cell spans on each page such that they can
+        be bisected without key functions.
+        """
+        return self._derived_pages(
+            self._table_cell_spans_on_page,
+            lambda table_cell_spans: (
+                array(
+                    "i",
                     (
-                        self._TableCellSpan(table, cell, span)
-                        for table in page_tables
-                        for cell in table.cells
-                        for span in cell.spans
-                        if span
+                        table_cell_span.span.start
+                        for table_cell_span in table_cell_spans
                     ),
-                    key=attrgetter("span"),
-                )
-            )
-            for page_tables in self.tables_on_page
+                ),
+                array(
+                    "i",
+                    (table_cell_span.span.end for table_cell_span in table_cell_spans),
+                ),
+            ),
         )
 
     def table_cells_for(self, span: "Span") -> "Iterator[tuple[Table, Cell]]":
@@ -132,3 +482,111 @@ class EtlOutput:
 
         for table, cell, span in table_cell_spans:
             yield table, cell
+
+    def table_cells_for_many(
+        self, spans: "Iterable[Span]"
+    ) -> "list[list[tuple[Table, Cell]]]":
+        """
+        Return a list of the table cells that overlap with each span in `spans`,
+        as `table_cells_for()` would yield them.
+
+        Spans are grouped by page once and bisected in each page's table cell bounds,
+        which is much faster than calling `table_cells_for()` for each of many spans.
+        """
+        spans = list(spans)
+        table_cells: "list[list[tuple[Table, Cell]]]" = [[] for _ in spans]
+
+        for page, indexes in spans_by_page(spans):
+            if not 0 <= page < len(self._table_cell_spans_on_page):
+                for index in indexes:
+                    table_cells[index] = list(self.table_cells_for(spans[index]))
+                continue
+
+            page_table_cell_spans = self._table_cell_spans_on_page[page]
+            starts, ends = self._table_cell_bounds_on_page[page]
+
+            for index in indexes:
+                span = spans[index]
+                first = bisect_right(ends, span.start)
+                last = bisect_left(starts, span.end, lo=first)
+                table_cells[index] = [
+                    (table, cell)
+                    for table, cell, _ in page_table_cell_spans[first:last]
+                ]
+
+        return table_cells
+
+    @cached_property
+    def _token_grid_on_page(self) -> "Sequence[BoxGrid]":
+        """
+        Index the bounding boxes of tokens on each page in a grid such that they can
+        be found by position.
+        """
+        return self._derived_pages(
+            self._token_columns_on_page,
+            lambda columns: BoxGrid(
+                columns.top, columns.left, columns.right, columns.bottom
+            ),
+        )
+
+    @cached_property
+    def _table_cells_on_page(self) -> "Sequence[tuple[tuple[Table, Cell], ...]]":
+        return self._derived_pages(
+            self.tables_on_page,
+            lambda tables: tuple(
+                (table, cell) for table in tables for cell in table.cells
+            ),
+        )
+
+    @cached_property
+    def _table_cell_grid_on_page(self) -> "Sequence[BoxGrid]":
+        """
+        Index the bounding boxes of table cells on each page in a grid such that they
+        can be found by position.
+        """
+        return self._derived_pages(
+            self._table_cells_on_page,
+            lambda table_cells: BoxGrid.from_boxes(cell.box for _, cell in table_cells),
+        )
+
+    def tokens_in_box(self, box: Box, *, overlap: bool = True) -> "list[Token]":
+        """
+        Return the tokens, in order, that overlap with `box`. If `overlap` is false,
+        only return tokens that `box` fully contains.
+        """
+        if not 0 <= box.page < len(self.tokens_on_page):
+            return []
+
+        page_tokens = self.tokens_on_page[box.page]
+        indexes = self._token_grid_on_page[box.page].overlapping(
+            box, contained=not overlap
+        )
+        return [page_tokens[index] for index in indexes]
+
+    def cells_in_box(
+        self, box: Box, *, overlap: bool = True
+    ) -> "list[tuple[Table, Cell]]":
+        """
+        Return the table cells, in order, that overlap with `box`. If `overlap` is
+        false, only return table cells that `box` fully contains.
+        """
+        if not 0 <= box.page < len(self.tables_on_page):
+            return []
+
+        page_table_cells = self._table_cells_on_page[box.page]
+        indexes = self._table_cell_grid_on_page[box.page].overlapping(
+            box, contained=not overlap
+        )
+        return [page_table_cells[index] for index in indexes]
+
+    def nearest_tokens(self, box: Box, count: int = 1) -> "list[Token]":
+        """
+        Return the `count` tokens on the page of `box` that are nearest to it,
+        nearest first. Tokens that overlap with `box` are at distance 0.
+        """
+        if not 0 <= box.page < len(self.tokens_on_page):
+            return []
+
+        page_tokens = self.tokens_on_page[box.page]
+        indexes = self._token_grid_on_page[box.page].nearest(box, count)
+        return [page_tokens[index] for index in indexes]
@@ -0,0 +1,208 @@
+import heapq
+from math import hypot, isqrt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from .box import Box
+
+
+class BoxGrid:
+    """
+    A uniform grid over the bounding boxes of a page, such that the boxes overlapping
+    or nearest to a query box are found without checking every box on the page.
+
+    Boxes are referred to by their index in the columns the grid was built from.
+    Each box is listed in every grid cell it covers, and grid cells are sized to hold
+    about one box each on average.
+    """
+
+    def __init__(
+        self,
+        top: "Sequence[int]",
+        left: "Sequence[int]",
+        right: "Sequence[int]",
+        bottom: "Sequence[int]",
+    ):
+        self.top = top
+        self.left = left
+        self.right = right
+        self.bottom = bottom
+
+        count = len(top)
+        width = max(max(right, default=0), 1)
+        height = max(max(bottom, default=0), 1)
+        self.cell_size = max(isqrt(width * height // max(count, 1)), 1)
+        self.columns = width // self.cell_size + 1
+        self.rows = height // self.cell_size + 1
+        self.cells: "list[list[int]]" = [[] for _ in range(self.columns * self.rows)]
+
+        for index in range(count):
+            first_row, last_row, first_column, last_column = self._cell_range(
+                top[index], left[index], right[index], bottom[index]
+            )
+
+            for row in range(first_row, last_row + 1):
+                for column in range(first_column, last_column + 1):
+                    self.cells[row * self.columns + column].append(index)
+
+    @staticmethod
+    def from_boxes(boxes: "Iterable[Box]") -> "BoxGrid":
+        boxes = tuple(boxes)
+
+        return BoxGrid(
+            top=[box.top for box in boxes],
+            left=[box.left for box in boxes],
+            right=[box.right for box in boxes],
+            bottom=[box.bottom for box in boxes],
+        )
+
+    def __len__(self) -> int:
+        return len(self.top)
+
+    def _cell_range(
+        self, top: int, left: int, right: int, bottom: int
+    ) -> "tuple[int, int, int, int]":
+        """
+        Return the first and last rows and columns of the grid cells covered by a box.
+        Boxes that extend past the edges of the grid are clamped to it.
+        """
+        size = self.cell_size
+        last_row = self.rows - 1
+        last_column = self.columns - 1
+
+        return (
+            min(max(top // size, 0), last_row),
+            min(max(bottom // size, 0), last_row),
+            min(max(left // size, 0), last_column),
+            min(max(right // size, 0), last_column),
+        )
+
+    def overlapping(self, box: "Box", *, contained: bool = False) -> "list[int]":
+        """
+        Return the indexes, in order, of the boxes that overlap with `box` as
+        `Box.__and__()` defines it, or that `box` fully contains if `contained`.
+        """
+        if not self.top:
+            return []
+
+        first_row, last_row, first_column, last_column = self._cell_range(
+            box.top, box.left, box.right, box.bottom
+        )
+        candidates = set()
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                candidates.update(self.cells[row * self.columns + column])
+
+        top, left, right, bottom = self.top, self.left, self.right, self.bottom
+
+        if contained:
+            return sorted(
+                index
+                for index in candidates
+                if box.top <= top[index]
+                and box.left <= left[index]
+                and right[index] <= box.right
+                and bottom[index] <= box.bottom
+            )
+        else:
+            return sorted(
+                index
+                for index in candidates
+                if top[index] < box.bottom
+                and left[index] < box.right
+                and box.left < right[index]
+                and box.top < bottom[index]
+            )
+
+    def distance(self, index: int, box: "Box") -> float:
+        """
+        Return the distance between the closest edges of box `index` and `box`,
+        which is 0 if they overlap or touch.
+        """
+        dx = max(self.left[index] - box.right, box.left - self.right[index], 0)
+        dy = max(self.top[index] - box.bottom, box.top - self.bottom[index], 0)
+        return hypot(dx, dy)
+
+    def nearest(self, box: "Box", count: int) -> "list[int]":
+        """
+        Return the indexes of the `count` boxes nearest to `box`, nearest first.
+        Boxes at the same distance are ordered by index.
+
+        Grid cells are searched in rings of increasing distance around `box` until no
+        unsearched box could be nearer than those already found.
+        """
+        if count <= 0 or not self.top:
+            return []
+
+        first_row, last_row, first_column, last_column = self._cell_range(
+            box.top, box.left, box.right, box.bottom
+        )
+        size = self.cell_size
+        seen: "set[int]" = set()
+        found: "list[tuple[float, int]]" = []
+        ring = 0
+
+        while True:
+            for row, column in self._ring(
+                first_row, last_row, first_column, last_column, ring
+            ):
+                for index in self.cells[row * self.columns + column]:
+                    if index not in seen:
+                        seen.add(index)
+                        found.append((self.distance(index, box), index))
+
+            # Unsearched boxes lie entirely outside the rings searched so far, so
+            # they're at least as far away as the nearest edge of those rings that
+            # isn't also an edge of the grid.
+            bounds = []
+
+            if first_row - ring > 0:
+                bounds.append(box.top - (first_row - ring) * size)
+            if first_column - ring > 0:
+                bounds.append(box.left - (first_column - ring) * size)
+            if last_row + ring < self.rows - 1:
+                bounds.append((last_row + ring + 1) * size - box.bottom)
+            if last_column + ring < self.columns - 1:
+                bounds.append((last_column + ring + 1) * size - box.right)
+
+            if not bounds:
+                break
+
+            if len(found) >= count:
+                kth_distance = heapq.nsmallest(count, found)[-1][0]
+
+                if kth_distance <= min(bounds):
+                    break
+
+            ring += 1
+
+        return [index for _, index in heapq.nsmallest(count, found)]
+
+    def _ring(
+        self,
+        first_row: int,
+        last_row: int,
+        first_column: int,
+        last_column: int,
+        ring: int,
+    ) -> "Iterable[tuple[int, int]]":
+        """
+        Yield the grid cells exactly `ring` cells outside the given range of cells.
+        """
+        top, bottom = first_row - ring, last_row + ring
+        left, right = first_column - ring, last_column + ring
+
+        for row in range(max(top, 0), min(bottom, self.rows - 1) + 1):
+            if ring == 0 or row in (top, bottom):
+                columns: "Iterable[int]" = range(
+                    max(left, 0), min(right, self.columns - 1) + 1
+                )
+            else:
+                columns = (column for column in (left, right) if column >= 0)
+                columns = (column for column in columns if column < self.columns)
+
+            for column in columns:
+                yield row, column
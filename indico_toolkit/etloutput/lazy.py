@@ -0,0 +1,131 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import cached_property
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from .columns import TokenColumns
+from .etloutput import EtlOutput, tables_from_dicts, tokens_from_dicts
+from .pages import LazyPages
+from .utils import json_loaded, str_decoded
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .span import Span
+    from .table import Table
+    from .token import Token
+
+
+class LazyEtlOutput(EtlOutput):
+    """
+    An `EtlOutput` that reads and parses the text, tokens, and tables of each page
+    only when that page is first accessed through `text_on_page`, `tokens_on_page`,
+    or `tables_on_page`.
+
+    `token_for()` and `table_cells_for()` only load the page of the span they're
+    called with. Accessing `text`, `tokens`, or `tables` loads every page.
+    """
+
+    text_on_page: "LazyPages[str]"
+    tokens_on_page: "LazyPages[Sequence[Token]]"
+    tables_on_page: "LazyPages[tuple[Table, ...]]"
+    _page_starts: "tuple[int, ...] | None"
+
+    def __init__(
+        self,
+        text_on_page: "LazyPages[str]",
+        tokens_on_page: "LazyPages[Sequence[Token]]",
+        tables_on_page: "LazyPages[tuple[Table, ...]]",
+        page_starts: "tuple[int, ...] | None" = None,
+    ):
+        object.__setattr__(self, "text_on_page", text_on_page)
+        object.__setattr__(self, "tokens_on_page", tokens_on_page)
+        object.__setattr__(self, "tables_on_page", tables_on_page)
+        object.__setattr__(self, "_page_starts", page_starts)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"text_on_page={self.text_on_page.loaded!r}, "
+            f"tokens_on_page={self.tokens_on_page.loaded!r}, "
+            f"tables_on_page={self.tables_on_page.loaded!r})"
+        )
+
+    @cached_property
+    def text(self) -> str:
+        return "\n".join(self.text_on_page)
+
+    @cached_property
+    def page_starts(self) -> "tuple[int, ...]":
+        if self._page_starts is None:
+            return super().page_starts
+
+        return self._page_starts
+
+    @cached_property
+    def tokens(self) -> "Sequence[Token]":
+        token_pages = tuple(self.tokens_on_page)
+
+        if token_pages and all(isinstance(page, TokenColumns) for page in token_pages):
+            return TokenColumns.concatenate(token_pages)  # type: ignore[arg-type]
+        else:
+            return tuple(chain.from_iterable(token_pages))
+
+    @cached_property
+    def tables(self) -> "tuple[Table, ...]":
+        return tuple(chain.from_iterable(self.tables_on_page))
+
+    @staticmethod
+    def from_uris(
+        reader: "Callable[[str], object]",
+        text_uris: "Sequence[str]",
+        token_uris: "Sequence[str]",
+        table_uris: "Sequence[str]",
+        page_starts: "tuple[int, ...] | None" = None,
+        *,
+        compact_tokens: bool = False,
+    ) -> "LazyEtlOutput":
+        """
+        Create a `LazyEtlOutput` that reads pages from `text_uris`, `token_uris`,
+        and `table_uris` with `reader` as they're accessed.
+
+        `page_starts` are the document offsets at which each page's text starts. If
+        provided, `token_for()` only needs the text of the span's page.
+
+        Use `compact_tokens` to store tokens as `TokenColumns` instead of `Token`s.
+        """
+        tokens_from = TokenColumns.from_dicts if compact_tokens else tokens_from_dicts
+
+        return LazyEtlOutput(
+            text_on_page=LazyPages(
+                len(text_uris),
+                lambda page: str_decoded(reader(text_uris[page])),  # type: ignore[arg-type]
+            ),
+            tokens_on_page=LazyPages(
+                len(token_uris),
+                lambda page: tokens_from(json_loaded(reader(token_uris[page]))),
+            ),
+            tables_on_page=LazyPages(
+                len(table_uris),
+                lambda page: tables_from_dicts(json_loaded(reader(table_uris[page]))),
+            ),
+            page_starts=page_starts,
+        )
+
+    def _text_for(self, span: "Span") -> str:
+        """
+        Return the document text covered by `span`, reading only the pages it covers
+        if possible. Spans that continue past the end of their page are sliced from
+        the text of every page they cover, joined as `text` joins them.
+        """
+        page_starts = self._page_starts
+
+        if page_starts is None or not 0 <= span.page < len(page_starts):
+            return super()._text_for(span)
+
+        last_page = max(bisect_right(page_starts, span.end - 1) - 1, span.page)
+        page_start = page_starts[span.page]
+        return "\n".join(self.text_on_page[span.page : last_page + 1])[
+            span.start - page_start : span.end - page_start
+        ]
@@ -0,0 +1,176 @@
+import mmap
+from functools import cached_property
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, overload
+
+from .binary import TEXT_ENCODINGS, load_ints, load_text, table_from_row
+from .columns import TokenColumns
+from .etloutput import EtlOutput, unpack_etl_output
+from .pages import LazyPages, TextPages
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+    from .span import Span
+    from .table import Table
+
+
+class MappedText:
+    """
+    A read-only view of text stored with a fixed number of bytes per character, such
+    as in a memory-mapped file. Indexing and slicing decode only the characters
+    requested, so the text is never copied in full unless converted with `str()`.
+    """
+
+    __slots__ = ("buffer", "width")
+
+    def __init__(self, buffer: memoryview, width: int):
+        self.buffer = buffer
+        self.width = width
+
+    def __len__(self) -> int:
+        return self.buffer.nbytes // self.width
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> str: ...
+    def __getitem__(self, index: "int | slice") -> str:
+        width = self.width
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step != 1:
+                return str(self)[index]
+
+            stop = max(start, stop)
+            return str(
+                self.buffer[start * width : stop * width],
+                TEXT_ENCODINGS[width],
+                "surrogatepass",
+            )
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"character {index} out of range [0,{len(self)})")
+
+        index %= len(self)
+        return self[index : index + 1]
+
+    def __str__(self) -> str:
+        return load_text(self.buffer, self.width)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MappedText, str)):
+            return str(self) == str(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hash as the string it's equal to.
+        """
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} characters>)"
+
+
+class MappedEtlOutput(EtlOutput):
+    """
+    An `EtlOutput` serialized with `to_bytes()` to a file that's memory-mapped rather
+    than read into memory. Processes that map the same file share one copy of it in
+    the operating system's page cache.
+
+    Tokens are `TokenColumns` whose columns and text are views of the mapping, and
+    `text_view` is a view of the document text. `token_for()` and `tokens_for()`
+    slice text directly from the mapping. `text` and `text_on_page` are decoded from
+    the mapping when accessed, and tables are decoded a page at a time.
+    """
+
+    text_view: MappedText
+    text_on_page: TextPages
+    tokens: TokenColumns
+    tokens_on_page: "tuple[TokenColumns, ...]"
+    tables_on_page: "LazyPages[tuple[Table, ...]]"
+    _text: "str | None"
+
+    def __init__(
+        self,
+        text_view: MappedText,
+        text_on_page: TextPages,
+        tokens: TokenColumns,
+        tokens_on_page: "tuple[TokenColumns, ...]",
+        tables_on_page: "LazyPages[tuple[Table, ...]]",
+        text: "str | None" = None,
+    ):
+        object.__setattr__(self, "text_view", text_view)
+        object.__setattr__(self, "text_on_page", text_on_page)
+        object.__setattr__(self, "tokens", tokens)
+        object.__setattr__(self, "tokens_on_page", tokens_on_page)
+        object.__setattr__(self, "tables_on_page", tables_on_page)
+        object.__setattr__(self, "_text", text)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"text_view={self.text_view!r}, "
+            f"tokens={self.tokens!r}, "
+            f"tables_on_page={self.tables_on_page.loaded!r})"
+        )
+
+    @cached_property
+    def text(self) -> str:
+        return str(self.text_view) if self._text is None else self._text
+
+    @cached_property
+    def tables(self) -> "tuple[Table, ...]":
+        return tuple(chain.from_iterable(self.tables_on_page))
+
+    @staticmethod
+    def open(path: "Path | str") -> "MappedEtlOutput":
+        """
+        Memory-map the etl output serialized with `to_bytes()` to the file at `path`.
+        """
+        with Path(path).open("rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return MappedEtlOutput.from_buffer(mapping)
+
+    @staticmethod
+    def from_buffer(data: "Buffer") -> "MappedEtlOutput":
+        """
+        Create a `MappedEtlOutput` from a buffer in the `to_bytes()` format without
+        copying its text or tokens.
+        """
+        values, text_section, token_text_section, token_sections = unpack_etl_output(
+            data
+        )
+        text_view = MappedText(text_section, values["text_width"])
+        tokens = TokenColumns(
+            MappedText(token_text_section, values["token_text_width"]),
+            *map(load_ints, token_sections),
+        )
+        table_rows = values["tables"]
+
+        return MappedEtlOutput(
+            text_view=text_view,
+            text_on_page=TextPages(text_view, values["page_lengths"]),
+            tokens=tokens,
+            tokens_on_page=tokens.split(values["token_counts"]),
+            tables_on_page=LazyPages(
+                len(table_rows),
+                lambda page: tuple(map(table_from_row, table_rows[page])),
+            ),
+            text=values["text"],
+        )
+
+    def _text_for(self, span: "Span") -> str:
+        """
+        Return the document text covered by `span`, decoding only that text.
+        """
+        if self._text is not None:
+            return super()._text_for(span)
+
+        return self.text_view[span.slice]
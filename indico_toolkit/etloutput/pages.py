@@ -0,0 +1,186 @@
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import TYPE_CHECKING, Generic, Protocol, TypeVar, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+Page = TypeVar("Page")
+
+
+class Text(Protocol):
+    """
+    Text that can be sliced by character offset, such as `str` or `MappedText`.
+    """
+
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: slice, /) -> str: ...
+
+
+def page_starts_from_lengths(page_lengths: "Iterable[int]") -> "tuple[int, ...]":
+    """
+    Return the document offset at which each page starts when pages of these lengths
+    are joined with newlines.
+    """
+    page_lengths = tuple(page_lengths)
+    page_starts = accumulate((length + 1 for length in page_lengths), initial=0)
+    return tuple(page_starts)[: len(page_lengths)]
+
+
+class TextView:
+    """
+    A view of the characters of `text` from `start` to `stop`. Indexing and slicing
+    are relative to `start` and copy only the characters requested.
+    """
+
+    __slots__ = ("text", "start", "stop")
+
+    def __init__(self, text: "Text", start: int, stop: int):
+        self.text = text
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> str: ...
+    def __getitem__(self, index: "int | slice") -> str:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step != 1:
+                return str(self)[index]
+
+            stop = max(start, stop)
+            return self.text[self.start + start : self.start + stop]
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"character {index} out of range [0,{len(self)})")
+
+        index %= len(self)
+        return self[index : index + 1]
+
+    def __str__(self) -> str:
+        return self.text[self.start : self.stop]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TextView, str)):
+            return str(self) == str(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hash as the string it's equal to.
+        """
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} characters>)"
+
+
+class TextPages(Sequence[str]):
+    """
+    The text of each page as a slice of the document text, indexed by the offset at
+    which each page starts. Pages are sliced from `text` as they're accessed rather
+    than stored alongside it.
+    """
+
+    def __init__(self, text: "Text", page_lengths: "Iterable[int]"):
+        self.text = text
+        self.page_lengths = tuple(page_lengths)
+        self.page_starts = page_starts_from_lengths(self.page_lengths)
+
+    def __len__(self) -> int:
+        return len(self.page_lengths)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[str, ...]": ...
+    def __getitem__(self, index: "int | slice") -> "str | tuple[str, ...]":
+        if isinstance(index, slice):
+            return tuple(self[page] for page in range(*index.indices(len(self))))
+
+        return str(self.view(index))
+
+    def view(self, page: int) -> TextView:
+        """
+        Return a view of the text of `page` that doesn't copy it.
+        """
+        if not -len(self) <= page < len(self):
+            raise IndexError(f"page {page} out of range [0,{len(self)})")
+
+        page_start = self.page_starts[page]
+        return TextView(self.text, page_start, page_start + self.page_lengths[page])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return tuple(self) == tuple(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hash as the tuple of page text it's equal to.
+        """
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} pages>)"
+
+
+class LazyPages(Sequence[Page], Generic[Page]):
+    """
+    A sequence of pages that are each loaded on first access and then cached.
+    """
+
+    def __init__(self, count: int, load_page: "Callable[[int], Page]"):
+        self._load_page = load_page
+        self._pages: "list[Page | None]" = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    @overload
+    def __getitem__(self, index: int) -> Page: ...
+    @overload
+    def __getitem__(self, index: slice) -> "tuple[Page, ...]": ...
+    def __getitem__(self, index: "int | slice") -> "Page | tuple[Page, ...]":
+        if isinstance(index, slice):
+            return tuple(self[page] for page in range(*index.indices(len(self))))
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"page {index} out of range [0,{len(self)})")
+
+        index %= len(self)
+        page = self._pages[index]
+
+        if page is None:
+            page = self._pages[index] = self._load_page(index)
+
+        return page
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyPages, tuple)):
+            return tuple(self) == tuple(other)
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Hash as the tuple of pages it's equal to, loading every page.
+        """
+        return hash(tuple(self))
+
+    @property
+    def loaded(self) -> "tuple[int, ...]":
+        """
+        Return the indexes of the pages that have been loaded.
+        """
+        return tuple(
+            index for index, page in enumerate(self._pages) if page is not None
+        )
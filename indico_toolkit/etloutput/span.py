@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Final
 
+from .decoders import span_row
 from .utils import get
 
 
@@ -38,9 +39,18 @@ class Span:
             )
 
     @staticmethod
-    def from_dict(span: object) -> "Span":
+    def from_dict(span: object, page: "int | None" = None) -> "Span":
+        """
+        Create a `Span` from a doc offset dictionary, on `page` if given rather than
+        its `page_num`. The dictionary isn't modified.
+        """
+        row = span_row(span, page)
+
+        if row is not None:
+            return Span(*row)
+
         return Span(
-            page=get(span, int, "page_num"),
+            page=get(span, int, "page_num") if page is None else page,
             start=get(span, int, "start"),
             end=get(span, int, "end"),
         )
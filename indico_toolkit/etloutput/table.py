@@ -41,7 +41,6 @@ class Table:
         Create a `Table` from a table dictionary.
         """
         page = get(table, int, "page_num")
-        get(table, dict, "position")["page_num"] = page
         row_count = get(table, int, "num_rows")
         column_count = get(table, int, "num_columns")
 
@@ -72,12 +71,12 @@ class Table:
             for column in range(column_count)
         )  # fmt: skip
 
-        for doc_offset in get(table, list, "doc_offsets"):
-            doc_offset["page_num"] = page
-
         return Table(
-            box=Box.from_dict(get(table, dict, "position")),
-            spans=tuple(map(Span.from_dict, get(table, list, "doc_offsets"))),
+            box=Box.from_dict(get(table, dict, "position"), page),
+            spans=tuple(
+                Span.from_dict(doc_offset, page)
+                for doc_offset in get(table, list, "doc_offsets")
+            ),
             cells=cells,
             rows=rows,
             columns=columns,
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Final
 
 from .box import NULL_BOX, Box
+from .decoders import token_row
 from .span import NULL_SPAN, Span
 from .utils import get
 
@@ -20,13 +21,22 @@ class Token:
         """
         Create a `Token` from a token dictionary.
         """
-        get(token, dict, "position")["page_num"] = get(token, int, "page_num")
-        get(token, dict, "doc_offset")["page_num"] = get(token, int, "page_num")
+        row = token_row(token)
+
+        if row is not None:
+            page, start, end, top, left, right, bottom, text = row
+            return Token(
+                text,
+                Box(page, top, left, right, bottom),
+                Span(page, start, end),
+            )
+
+        page = get(token, int, "page_num")
 
         return Token(
             text=get(token, str, "text"),
-            box=Box.from_dict(get(token, dict, "position")),
-            span=Span.from_dict(get(token, dict, "doc_offset")),
+            box=Box.from_dict(get(token, dict, "position"), page),
+            span=Span.from_dict(get(token, dict, "doc_offset"), page),
         )
 
 
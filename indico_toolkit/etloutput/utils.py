@@ -1,7 +1,14 @@
 import json
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 Value = TypeVar("Value")
+JsonLoader: TypeAlias = "Callable[[str | bytes], Any]"
+
+JSON_BACKENDS = ("orjson", "msgspec", "ujson", "json")
+_json_loads: "JsonLoader" = json.loads
 
 
 def get(value: object, value_type: "type[Value]", *keys: "str | int") -> Value:
@@ -47,14 +54,75 @@ def has(value: object, value_type: "type[Value]", *keys: "str | int") -> bool:
     return isinstance(value, value_type)
 
 
+def json_loader(backend: str) -> "JsonLoader":
+    """
+    Return the function that decodes JSON strings and bytes with `backend`.
+    Raise an error if `backend` isn't installed.
+    """
+    if backend == "orjson":
+        import orjson
+
+        return orjson.loads
+    elif backend == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode  # type: ignore[no-any-return]
+    elif backend == "ujson":
+        import ujson
+
+        return ujson.loads  # type: ignore[no-any-return]
+    elif backend == "json":
+        return json.loads
+    else:
+        raise ValueError(f"unsupported JSON backend `{backend}`")
+
+
+def set_json_backend(backend: "str | JsonLoader | None" = None) -> None:
+    """
+    Decode JSON loaded by `results` and `etloutput` with `backend`: one of
+    "orjson", "msgspec", "ujson", or "json", or a function that decodes JSON strings
+    and bytes. If `backend` is `None`, use the first of those that's installed.
+
+    JSON that the backend can't decode is decoded with the standard library instead,
+    such that anything `json.loads()` accepts is still loaded and invalid JSON raises
+    the same errors.
+    """
+    global _json_loads
+
+    if callable(backend):
+        _json_loads = backend
+    elif backend is not None:
+        try:
+            _json_loads = json_loader(backend)
+        except ImportError as error:
+            raise ImportError(
+                f"the {backend} JSON backend requires additional dependencies: "
+                f"`pip install {backend}`"
+            ) from error
+    else:
+        for installed_backend in JSON_BACKENDS:
+            try:
+                _json_loads = json_loader(installed_backend)
+                break
+            except ImportError:
+                continue
+
+
 def json_loaded(value: "Any") -> "Any":
     """
     Ensure `value` has been loaded as JSON.
+
+    Bytes are decoded directly by the JSON backend rather than decoded to a string
+    first.
     """
-    value = str_decoded(value)
+    if isinstance(value, (str, bytes)):
+        try:
+            value = _json_loads(value)
+        except Exception:
+            if _json_loads is json.loads:
+                raise
 
-    if isinstance(value, str):
-        value = json.loads(value)
+            value = json.loads(value)
 
     return value
 
@@ -67,3 +135,6 @@ def str_decoded(value: str | bytes) -> str:
         value = value.decode()
 
     return value
+
+
+set_json_backend()
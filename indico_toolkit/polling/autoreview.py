@@ -1,6 +1,9 @@
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING
 
 from indico import AsyncIndicoClient, IndicoConfig
@@ -12,18 +15,28 @@ from indico.queries import (
 )
 
 from .. import etloutput, results
-from ..etloutput import EtlOutput
+from ..etloutput import EtlOutput, EtlOutputCache
 from ..results import Document, Result
 from ..retry import retry
-from .queries import SubmissionIdsPendingAutoReview
+from .queries import PendingSubmissionIds, SubmissionIdsPendingAutoReview
+from .scheduling import PollDelay, TokenBucket
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from concurrent.futures import Executor
     from typing import Any, NoReturn, TypeAlias
 
+    AutoReview: TypeAlias = Callable[
+        [Result, dict[Document, EtlOutput]], Awaitable["AutoReviewed"]
+    ]
+    SyncAutoReview: TypeAlias = Callable[
+        [Result, dict[Document, EtlOutput]], "AutoReviewed"
+    ]
     SubmissionId: TypeAlias = int
     Worker: TypeAlias = asyncio.Task[None]
     WorkerQueue: TypeAlias = asyncio.Queue[tuple[SubmissionId, Worker]]
+    StageQueue: TypeAlias = asyncio.Queue[tuple[SubmissionId, Any]]
+    Stage: TypeAlias = Callable[[SubmissionId, Any], Awaitable[Any]]
 
 logger = logging.getLogger(__name__)
 
@@ -39,36 +52,128 @@ class AutoReviewPoller:
     """
     Polls for submissions requiring auto review, processes them,
     and submits the review results concurrently.
+
+    Polls are `min_poll_delay` seconds apart while new submissions keep appearing,
+    backing off by a factor of `poll_backoff` up to `poll_delay` seconds while idle.
+    Workers are spawned at `spawn_rate` per second, in bursts of up to `spawn_burst`.
+
+    Polls page through every pending submission `poll_page_size` at a time. With
+    `poll_resync_delay`, they only request those after the highest submission ID seen,
+    except every `poll_resync_delay` seconds, when they request all of them. This makes
+    polls cheaper when many submissions are pending, but submissions that fail to
+    process, or become pending out of ID order, wait for the next resync rather than
+    the next poll.
+
+    By default, each of `worker_count` workers processes a submission from start to
+    finish. Use `pipeline` to instead process submissions in three stages: fetching
+    submissions, results, and etl outputs; applying `auto_review`; and submitting
+    changes. Each stage has its own number of workers and a queue of submissions
+    waiting for them of bounded size, such that auto review functions run back to
+    back while the submissions after them are fetched. `worker_count` is ignored when
+    pipelined.
+
+    `auto_review` is a coroutine function, unless `review_executor` is given, in which
+    case it's a regular function called in that `concurrent.futures` executor so that
+    CPU-bound review doesn't block polling or other workers. In a `ThreadPoolExecutor`,
+    it's called with the loaded result and etl outputs. In any other executor, such as
+    a `ProcessPoolExecutor`, it must be picklable, and they're sent to it with
+    `to_bytes()` and loaded with `from_bytes()` rather than pickled.
+
+    The etl outputs of a submission's documents are loaded concurrently, at most
+    `etl_output_concurrency` at a time. Storage objects are read by every worker with
+    at most `download_concurrency` reads in progress at once.
     """
 
     def __init__(  # type: ignore[no-any-unimported]
         self,
         config: IndicoConfig,
         workflow_id: int,
-        auto_review: "Callable[[Result, dict[Document, EtlOutput]], Awaitable[AutoReviewed]]",  # noqa: E501
+        auto_review: "AutoReview | SyncAutoReview",
         *,
         worker_count: int = 8,
         spawn_rate: float = 1,
+        spawn_burst: int = 8,
         poll_delay: float = 30,
+        min_poll_delay: float = 1,
+        poll_backoff: float = 2,
+        poll_page_size: int = 1000,
+        poll_resync_delay: "float | None" = None,
         load_etl_output: bool = True,
         load_text: bool = True,
         load_tokens: bool = True,
         load_tables: bool = True,
+        etl_output_cache: "EtlOutputCache | None" = None,
+        etl_output_concurrency: int = 8,
+        download_concurrency: int = 32,
         retry_count: int = 4,
         retry_wait: float = 1,
         retry_backoff: float = 4,
         retry_jitter: float = 0.5,
+        pipeline: bool = False,
+        fetch_worker_count: int = 8,
+        fetch_queue_size: int = 8,
+        review_worker_count: int = 1,
+        review_queue_size: int = 2,
+        submit_worker_count: int = 4,
+        submit_queue_size: int = 4,
+        review_executor: "Executor | None" = None,
     ):
+        if worker_count < 1:
+            raise ValueError("`worker_count` must be at least 1")
+
+        if etl_output_concurrency < 1:
+            raise ValueError("`etl_output_concurrency` must be at least 1")
+
+        if download_concurrency < 1:
+            raise ValueError("`download_concurrency` must be at least 1")
+
+        if fetch_worker_count < 1:
+            raise ValueError("`fetch_worker_count` must be at least 1")
+
+        if fetch_queue_size < 1:
+            raise ValueError("`fetch_queue_size` must be at least 1")
+
+        if review_worker_count < 1:
+            raise ValueError("`review_worker_count` must be at least 1")
+
+        if review_queue_size < 1:
+            raise ValueError("`review_queue_size` must be at least 1")
+
+        if submit_worker_count < 1:
+            raise ValueError("`submit_worker_count` must be at least 1")
+
+        if submit_queue_size < 1:
+            raise ValueError("`submit_queue_size` must be at least 1")
+
+        if review_executor is None and not iscoroutinefunction(auto_review):
+            raise TypeError(
+                "`auto_review` must be a coroutine function without `review_executor`"
+            )
+
+        if review_executor is not None and iscoroutinefunction(auto_review):
+            raise TypeError(
+                "`auto_review` must be a regular function with `review_executor`"
+            )
+
         self._config = config
         self._workflow_id = workflow_id
         self._auto_review = auto_review
         self._worker_count = worker_count
-        self._spawn_rate = spawn_rate
-        self._poll_delay = poll_delay
+        self._spawn_tokens = TokenBucket(spawn_rate, spawn_burst)
+        self._poll_delay = PollDelay(min_poll_delay, poll_delay, poll_backoff)
+        self._pending_submission_ids = PendingSubmissionIds(
+            SubmissionIdsPendingAutoReview,
+            workflow_id,
+            limit=poll_page_size,
+            resync_delay=poll_resync_delay,
+        )
         self._load_etl_output = load_etl_output
         self._load_text = load_text
         self._load_tokens = load_tokens
         self._load_tables = load_tables
+        self._etl_output_cache = etl_output_cache
+        self._etl_output_concurrency = etl_output_concurrency
+        self._download_slots = asyncio.Semaphore(download_concurrency)
 
         self._retry = retry(
             Exception,
@@ -81,63 +186,135 @@ class AutoReviewPoller:
         self._worker_queue: "WorkerQueue" = asyncio.Queue(1)
         self._processing_submission_ids: "set[SubmissionId]" = set()
 
+        self._pipeline = pipeline
+        self._fetch_worker_count = fetch_worker_count
+        self._review_worker_count = review_worker_count
+        self._submit_worker_count = submit_worker_count
+        self._fetch_queue: "StageQueue" = asyncio.Queue(fetch_queue_size)
+        self._review_queue: "StageQueue" = asyncio.Queue(review_queue_size)
+        self._submit_queue: "StageQueue" = asyncio.Queue(submit_queue_size)
+        self._review_executor = review_executor
+
     async def poll_forever(self) -> "NoReturn":  # type: ignore[misc]
+        if self._pipeline:
+            workers = (
+                f"fetch_worker_count={self._fetch_worker_count} "
+                f"review_worker_count={self._review_worker_count} "
+                f"submit_worker_count={self._submit_worker_count}"
+            )
+        else:
+            workers = f"worker_count={self._worker_count}"
+
         logger.info(
             "Starting auto review poller for: "
             f"host={self._config.host} "
             f"workflow_id={self._workflow_id} "
-            f"worker_count={self._worker_count}"
+            f"{workers}"
         )
 
         async with AsyncIndicoClient(self._config) as client:
             self._client_call = self._retry(client.call)
-            await asyncio.gather(
-                self._spawn_workers(),
-                *(self._reap_workers() for _ in range(self._worker_count)),
-            )
+
+            if self._pipeline:
+                await asyncio.gather(
+                    self._spawn_workers(),
+                    *(
+                        self._run_stage(
+                            self._fetch_queue,
+                            lambda submission_id, _: self._fetch(submission_id),
+                            self._review_queue,
+                        )
+                        for _ in range(self._fetch_worker_count)
+                    ),
+                    *(
+                        self._run_stage(
+                            self._review_queue,
+                            lambda submission_id, fetched: self._review(
+                                submission_id, *fetched
+                            ),
+                            self._submit_queue,
+                        )
+                        for _ in range(self._review_worker_count)
+                    ),
+                    *(
+                        self._run_stage(self._submit_queue, self._submit, None)
+                        for _ in range(self._submit_worker_count)
+                    ),
+                )
+            else:
+                await asyncio.gather(
+                    self._spawn_workers(),
+                    *(self._reap_workers() for _ in range(self._worker_count)),
+                )
 
     async def _retrieve_storage_object(self, uri: str) -> "Any":
-        return await self._client_call(RetrieveStorageObject(uri))
+        async with self._download_slots:
+            return await self._client_call(RetrieveStorageObject(uri))
 
     async def _spawn_workers(self) -> None:
         """
         Poll for submissions pending auto review and spawn workers to process them.
         `self._worker_slots` limits the number of workers that can run concurrently.
         Submission IDs in progress are tracked with `self._processing_submission_ids`.
+
+        When pipelined, submissions are queued for the fetch stage instead, which
+        waits while the queue is full.
+
+        `self._poll_delay` polls again sooner while new submissions keep appearing,
+        and `self._spawn_tokens` limits how quickly workers are spawned.
         """
         logger.info(
-            f"Polling submissions pending auto review every {self._poll_delay} seconds"
+            "Polling submissions pending auto review every "
+            f"{self._poll_delay.minimum} to {self._poll_delay.maximum} seconds"
         )
 
         while True:
             try:
-                submission_ids: "set[SubmissionId]" = await self._client_call(
-                    SubmissionIdsPendingAutoReview(self._workflow_id)
+                submission_ids = await self._pending_submission_ids.poll(
+                    self._client_call
                 )
             except Exception:
                 logger.exception("Error occurred while polling submissions")
-                await asyncio.sleep(self._poll_delay)
+                await self._poll_delay.sleep()
                 continue
 
             submission_ids -= self._processing_submission_ids
 
             if not submission_ids:
-                await asyncio.sleep(self._poll_delay)
+                await self._poll_delay.sleep()
                 continue
 
+            self._poll_delay.reset()
+
             for submission_id in submission_ids:
-                await self._worker_slots.acquire()
-                logger.info(f"Spawning worker for {submission_id=}")
-                self._processing_submission_ids.add(submission_id)
-                worker = asyncio.create_task(self._worker(submission_id))
-                await self._worker_queue.put((submission_id, worker))
-                await asyncio.sleep(1 / self._spawn_rate)
+                await self._spawn_tokens.acquire()
+
+                if self._pipeline:
+                    logger.info(f"Queueing {submission_id=}")
+                    self._processing_submission_ids.add(submission_id)
+                    await self._fetch_queue.put((submission_id, None))
+                else:
+                    await self._worker_slots.acquire()
+                    logger.info(f"Spawning worker for {submission_id=}")
+                    self._processing_submission_ids.add(submission_id)
+                    worker = asyncio.create_task(self._worker(submission_id))
+                    await self._worker_queue.put((submission_id, worker))
 
     async def _worker(self, submission_id: "SubmissionId") -> None:
         """
         Process a single submission by retrieving submission metadata, the result file,
         etl output, calling `self._auto_review`, and submitting changes.
         """
+        result, etl_outputs = await self._fetch(submission_id)
+        auto_reviewed = await self._review(submission_id, result, etl_outputs)
+        await self._submit(submission_id, auto_reviewed)
+
+    async def _fetch(
+        self, submission_id: "SubmissionId"
+    ) -> "tuple[Result, dict[Document, EtlOutput]]":
+        """
+        Retrieve the submission metadata, result file, and etl output of a submission.
+        """
         logger.info(f"Retrieving metadata for {submission_id=}")
         submission = await self._client_call(GetSubmission(submission_id))
 
@@ -149,24 +326,90 @@ class AutoReviewPoller:
 
         if self._load_etl_output:
             logger.info(f"Retrieving etl output for {submission_id=}")
-            etl_outputs = {
-                document: await etloutput.load_async(
+            documents = [
+                document for document in result.documents if not document.failed
+            ]
+            etl_outputs = dict(
+                zip(documents, await self._load_etl_outputs(submission_id, documents))
+            )
+        else:
+            logger.info(f"Skipping etl output for {submission_id=}")
+            etl_outputs = {}
+
+        return result, etl_outputs
+
+    async def _load_etl_outputs(
+        self, submission_id: "SubmissionId", documents: "list[Document]"
+    ) -> "list[EtlOutput]":
+        """
+        Load the etl output of each document concurrently, at most
+        `self._etl_output_concurrency` at a time, logging how long each took.
+        If any load fails, cancel those still in progress.
+        """
+        semaphore = asyncio.Semaphore(self._etl_output_concurrency)
+
+        async def load(document: Document) -> EtlOutput:
+            async with semaphore:
+                start = time.perf_counter()
+                etl_output = await etloutput.load_async(
                     document.etl_output_uri,
                     reader=self._retrieve_storage_object,
                     text=self._load_text,
                     tokens=self._load_tokens,
                     tables=self._load_tables,
+                    cache=self._etl_output_cache,
                 )
-                for document in result.documents
-                if not document.failed
-            }
-        else:
-            logger.info(f"Skipping etl output for {submission_id=}")
-            etl_outputs = {}
+                logger.info(
+                    f"Retrieved etl output for {submission_id=} "
+                    f"document_id={document.id} "
+                    f"in {time.perf_counter() - start:.3f} seconds"
+                )
+                return etl_output
+
+        loads = [asyncio.ensure_future(load(document)) for document in documents]
+
+        try:
+            return await asyncio.gather(*loads)
+        except BaseException:
+            for pending_load in loads:
+                pending_load.cancel()
+            raise
 
+    async def _review(
+        self,
+        submission_id: "SubmissionId",
+        result: Result,
+        etl_outputs: "dict[Document, EtlOutput]",
+    ) -> AutoReviewed:
         logger.info(f"Applying auto review for {submission_id=}")
-        auto_reviewed = await self._auto_review(result, etl_outputs)
+        # Whether `auto_review` is async depends on `self._review_executor`.
+        auto_review: "Any" = self._auto_review
+
+        if self._review_executor is None:
+            return await auto_review(result, etl_outputs)  # type: ignore[no-any-return]
+
+        loop = asyncio.get_running_loop()
+
+        if isinstance(self._review_executor, ThreadPoolExecutor):
+            return await loop.run_in_executor(
+                self._review_executor, auto_review, result, etl_outputs
+            )
 
+        # Serializing large results and etl outputs would block the event loop.
+        result_bytes, etl_output_bytes = await asyncio.to_thread(
+            _to_bytes, result, etl_outputs
+        )
+        return await loop.run_in_executor(
+            self._review_executor,
+            _auto_review_from_bytes,
+            auto_review,
+            result_bytes,
+            etl_output_bytes,
+        )
+
+    async def _submit(
+        self, submission_id: "SubmissionId", auto_reviewed: AutoReviewed
+    ) -> None:
         logger.info(f"Submitting auto review for {submission_id=}")
         job = await self._client_call(
             SubmitReview(
@@ -186,6 +429,33 @@ class AutoReviewPoller:
                 f"{job.status=!r} {job.result=!r}"
             )
 
+    async def _run_stage(
+        self,
+        inbox: "StageQueue",
+        stage: "Stage",
+        outbox: "StageQueue | None",
+    ) -> None:
+        """
+        Apply `stage` to each submission in `inbox` and queue its output in `outbox`,
+        waiting while it's full. Log errors for submissions that failed to process.
+        Remove their submission IDs, and those of submissions completing the last
+        stage, from `self._processing_submission_ids` to be retried.
+        """
+        while True:
+            submission_id, value = await inbox.get()
+
+            try:
+                value = await stage(submission_id, value)
+            except Exception:
+                logger.exception(f"Error occurred while processing {submission_id=}")
+                self._processing_submission_ids.discard(submission_id)
+                continue
+
+            if outbox is not None:
+                await outbox.put((submission_id, value))
+            else:
+                self._processing_submission_ids.discard(submission_id)
+
     async def _reap_workers(self) -> None:
         """
         Reap completed workers, releasing their slots for new tasks. Log errors for
@@ -202,3 +472,37 @@ class AutoReviewPoller:
 
             self._processing_submission_ids.remove(submission_id)
             self._worker_slots.release()
+
+
+def _to_bytes(
+    result: Result, etl_outputs: "dict[Document, EtlOutput]"
+) -> "tuple[bytes, dict[int, bytes]]":
+    """
+    Serialize a result and its etl outputs, keyed by document index, with
+    `to_bytes()` to send them to an executor process.
+    """
+    documents = {document: index for index, document in enumerate(result.documents)}
+    return result.to_bytes(), {
+        documents[document]: etl_output.to_bytes()
+        for document, etl_output in etl_outputs.items()
+    }
+
+
+def _auto_review_from_bytes(
+    auto_review: "SyncAutoReview",
+    result: bytes,
+    etl_outputs: "dict[int, bytes]",
+) -> AutoReviewed:
+    """
+    Load a result and its etl outputs, keyed by document index, serialized with
+    `to_bytes()` and apply `auto_review` to them in an executor process.
+    """
+    loaded = Result.from_bytes(result)
+
+    return auto_review(
+        loaded,
+        {
+            loaded.documents[index]: EtlOutput.from_bytes(etl_output)
+            for index, etl_output in etl_outputs.items()
+        },
+    )
@@ -10,7 +10,8 @@ from indico.queries import (
 from indico.types import Submission
 
 from ..retry import retry
-from .queries import SubmissionIdsPendingDownstream
+from .queries import PendingSubmissionIds, SubmissionIdsPendingDownstream
+from .scheduling import PollDelay, TokenBucket
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -27,6 +28,17 @@ class DownstreamPoller:
     """
     Polls for completed and failed submissions pending downstream egestion, processes
     them concurrently, and marks them as retrieved.
+
+    Polls are `min_poll_delay` seconds apart while new submissions keep appearing,
+    backing off by a factor of `poll_backoff` up to `poll_delay` seconds while idle.
+    Workers are spawned at `spawn_rate` per second, in bursts of up to `spawn_burst`.
+
+    Polls page through every pending submission `poll_page_size` at a time. With
+    `poll_resync_delay`, they only request those after the highest submission ID seen,
+    except every `poll_resync_delay` seconds, when they request all of them. This makes
+    polls cheaper when many submissions are pending, but submissions that fail to
+    process, or become pending out of ID order, wait for the next resync rather than
+    the next poll.
     """
 
     def __init__(  # type: ignore[no-any-unimported]
@@ -37,18 +49,32 @@ class DownstreamPoller:
         *,
         worker_count: int = 8,
         spawn_rate: float = 1,
+        spawn_burst: int = 8,
         poll_delay: float = 30,
+        min_poll_delay: float = 1,
+        poll_backoff: float = 2,
+        poll_page_size: int = 1000,
+        poll_resync_delay: "float | None" = None,
         retry_count: int = 4,
         retry_wait: float = 1,
         retry_backoff: float = 4,
         retry_jitter: float = 0.5,
     ):
+        if worker_count < 1:
+            raise ValueError("`worker_count` must be at least 1")
+
         self._config = config
         self._workflow_id = workflow_id
         self._downstream = downstream
         self._worker_count = worker_count
-        self._spawn_rate = spawn_rate
-        self._poll_delay = poll_delay
+        self._spawn_tokens = TokenBucket(spawn_rate, spawn_burst)
+        self._poll_delay = PollDelay(min_poll_delay, poll_delay, poll_backoff)
+        self._pending_submission_ids = PendingSubmissionIds(
+            SubmissionIdsPendingDownstream,
+            workflow_id,
+            limit=poll_page_size,
+            resync_delay=poll_resync_delay,
+        )
 
         self._retry = retry(
             Exception,
@@ -82,34 +108,40 @@ class DownstreamPoller:
         downstream. `self._worker_slots` limits the number of workers that can run
         concurrently. Submission IDs in progress are tracked with
         `self._processing_submission_ids`.
+
+        `self._poll_delay` polls again sooner while new submissions keep appearing,
+        and `self._spawn_tokens` limits how quickly workers are spawned.
         """
         logger.info(
-            f"Polling submissions pending downstream every {self._poll_delay} seconds"
+            "Polling submissions pending downstream every "
+            f"{self._poll_delay.minimum} to {self._poll_delay.maximum} seconds"
         )
 
         while True:
             try:
-                submission_ids: "set[SubmissionId]" = await self._client_call(
-                    SubmissionIdsPendingDownstream(self._workflow_id)
+                submission_ids = await self._pending_submission_ids.poll(
+                    self._client_call
                 )
             except Exception:
                 logger.exception("Error occurred while polling submissions")
-                await asyncio.sleep(self._poll_delay)
+                await self._poll_delay.sleep()
                 continue
 
             submission_ids -= self._processing_submission_ids
 
             if not submission_ids:
-                await asyncio.sleep(self._poll_delay)
+                await self._poll_delay.sleep()
                 continue
 
+            self._poll_delay.reset()
+
             for submission_id in submission_ids:
+                await self._spawn_tokens.acquire()
                 await self._worker_slots.acquire()
                 logger.info(f"Spawning worker for {submission_id=}")
                 self._processing_submission_ids.add(submission_id)
                 worker = asyncio.create_task(self._worker(submission_id))
                 await self._worker_queue.put((submission_id, worker))
-                await asyncio.sleep(1 / self._spawn_rate)
 
     async def _worker(self, submission_id: "SubmissionId") -> None:
         """
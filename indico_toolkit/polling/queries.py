@@ -1,14 +1,25 @@
+import time
 from typing import TYPE_CHECKING
 
-from indico.queries import GraphQLRequest
+from indico.queries import PagedRequest
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Awaitable, Callable
+    from typing import Any, TypeAlias
 
+    SubmissionId: TypeAlias = int
+    SubmissionIdsQuery: TypeAlias = (
+        "type[SubmissionIdsPendingAutoReview | SubmissionIdsPendingDownstream]"
+    )
 
-class SubmissionIdsPendingAutoReview(GraphQLRequest):  # type: ignore[misc, no-any-unimported]
+
+class SubmissionIdsPendingAutoReview(PagedRequest):  # type: ignore[misc, no-any-unimported]
     QUERY = """
-    query SubmissionIdsPendingAutoReview($workflowIds: [Int]) {
+    query SubmissionIdsPendingAutoReview(
+        $workflowIds: [Int]
+        $limit: Int
+        $after: Int
+    ) {
         submissions(
             desc: false
             filters: {
@@ -18,19 +29,27 @@ class SubmissionIdsPendingAutoReview(GraphQLRequest):  # type: ignore[misc, no-a
                     { retrieved: false }
                 ]
             }
-            limit: 1000
+            limit: $limit
             orderBy: ID
             workflowIds: $workflowIds
+            after: $after
         ) {
             submissions {
                 id
             }
+            pageInfo {
+                endCursor
+                hasNextPage
+            }
         }
     }
     """
 
-    def __init__(self, workflow_id: int):
-        super().__init__(self.QUERY, {"workflowIds": [workflow_id]})
+    def __init__(
+        self, workflow_id: int, *, after: "int | None" = None, limit: int = 1000
+    ):
+        super().__init__(self.QUERY, {"workflowIds": [workflow_id], "limit": limit})
+        self.variables["after"] = after
 
     def process_response(self, response: "Any") -> set[int]:
         response = super().process_response(response)
@@ -39,9 +58,13 @@ class SubmissionIdsPendingAutoReview(GraphQLRequest):  # type: ignore[misc, no-a
         }
 
 
-class SubmissionIdsPendingDownstream(GraphQLRequest):  # type: ignore[misc, no-any-unimported]
+class SubmissionIdsPendingDownstream(PagedRequest):  # type: ignore[misc, no-any-unimported]
     QUERY = """
-    query SubmissionIdsPendingDownstream($workflowIds: [Int]) {
+    query SubmissionIdsPendingDownstream(
+        $workflowIds: [Int]
+        $limit: Int
+        $after: Int
+    ) {
         submissions(
             desc: false
             filters: {
@@ -56,22 +79,92 @@ class SubmissionIdsPendingDownstream(GraphQLRequest):  # type: ignore[misc, no-a
                     { retrieved: false }
                 ]
             }
-            limit: 1000
+            limit: $limit
             orderBy: ID
             workflowIds: $workflowIds
+            after: $after
         ) {
             submissions {
                 id
             }
+            pageInfo {
+                endCursor
+                hasNextPage
+            }
         }
     }
     """
 
-    def __init__(self, workflow_id: int):
-        super().__init__(self.QUERY, {"workflowIds": [workflow_id]})
+    def __init__(
+        self, workflow_id: int, *, after: "int | None" = None, limit: int = 1000
+    ):
+        super().__init__(self.QUERY, {"workflowIds": [workflow_id], "limit": limit})
+        self.variables["after"] = after
 
     def process_response(self, response: "Any") -> set[int]:
         response = super().process_response(response)
         return {
             submission["id"] for submission in response["submissions"]["submissions"]
         }
+
+
+class PendingSubmissionIds:
+    """
+    Polls for the IDs of pending submissions with `query`, paging through them
+    `limit` at a time rather than stopping at the first page.
+
+    By default, every poll requests every pending submission. With `resync_delay`,
+    polls only request submissions after the highest ID seen so far, except every
+    `resync_delay` seconds, when they request every pending submission. This makes
+    polls cheaper when many submissions are pending, but submissions that become
+    pending out of ID order, or fail to process and are pending again, aren't found
+    until the next resync, up to `resync_delay` seconds later, rather than the next
+    poll. Incremental polls use the highest ID seen as the `after` cursor, which
+    assumes that page cursors are submission IDs, as they are when ordered by ID.
+    """
+
+    def __init__(
+        self,
+        query: "SubmissionIdsQuery",
+        workflow_id: int,
+        *,
+        limit: int = 1000,
+        resync_delay: "float | None" = None,
+    ):
+        self.query = query
+        self.workflow_id = workflow_id
+        self.limit = limit
+        self.resync_delay = resync_delay
+        self.highest_id: "SubmissionId | None" = None
+        self.resync_at = time.monotonic()
+
+    async def poll(
+        self, call: "Callable[[Any], Awaitable[set[SubmissionId]]]"
+    ) -> "set[SubmissionId]":
+        """
+        Call each page of `query` with `call` and return the IDs from every page.
+        """
+        now = time.monotonic()
+        resync = not self.resync_delay or now >= self.resync_at
+        request = self.query(
+            self.workflow_id,
+            after=None if resync else self.highest_id,
+            limit=self.limit,
+        )
+        submission_ids: "set[SubmissionId]" = set()
+
+        while request.has_next_page:
+            after = request.variables["after"]
+            submission_ids |= await call(request)
+
+            # A next page without a new cursor would request the same page forever.
+            if request.has_next_page and request.variables["after"] in (None, after):
+                break
+
+        if submission_ids:
+            self.highest_id = max(self.highest_id or 0, *submission_ids)
+
+        if resync and self.resync_delay:
+            self.resync_at = now + self.resync_delay
+
+        return submission_ids
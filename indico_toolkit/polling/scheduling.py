@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+
+class PollDelay:
+    """
+    An adaptive delay between polls that resets to `minimum` whenever a poll finds
+    new work and grows by a factor of `backoff` after each sleep, up to `maximum`,
+    such that pollers check often while submissions keep arriving and rarely while
+    idle.
+    """
+
+    def __init__(self, minimum: float, maximum: float, backoff: float = 2):
+        if not 0 < minimum <= maximum:
+            raise ValueError("poll delays must satisfy `0 < minimum <= maximum`")
+
+        if backoff < 1:
+            raise ValueError("poll delay backoff must be at least 1")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.current = minimum
+
+    def reset(self) -> None:
+        """
+        Return to the minimum delay after a poll finds new work.
+        """
+        self.current = self.minimum
+
+    async def sleep(self) -> None:
+        """
+        Sleep for the current delay, then back off for the next.
+        """
+        await asyncio.sleep(self.current)
+        self.current = min(self.current * self.backoff, self.maximum)
+
+
+class TokenBucket:
+    """
+    Limits events to `rate` per second on average while allowing bursts of up to
+    `burst` events at once. Tokens accrue continuously at `rate` while idle, up to
+    `burst`, and each event waits for and takes one token.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("token bucket rate must be positive")
+
+        if burst < 1:
+            raise ValueError("token bucket burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self.updated) * self.rate, self.burst)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """
+        Take a token, waiting until one is available.
+        """
+        self._refill()
+
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+
+        self.tokens -= 1
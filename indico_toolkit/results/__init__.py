@@ -17,11 +17,13 @@ from .predictions import (
 )
 from .result import Result
 from .review import Review, ReviewType
+from .streaming import iter_result_dict, iter_result_file, iter_result_json
 from .task import Task, TaskType
-from .utils import json_loaded
+from .utils import json_loaded, set_json_backend
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterator
+    from typing import BinaryIO
 
 
 __all__ = (
@@ -33,6 +35,7 @@ __all__ = (
     "FormExtraction",
     "FormExtractionType",
     "Group",
+    "iter_documents",
     "load",
     "load_async",
     "NULL_BOX",
@@ -43,6 +46,7 @@ __all__ = (
     "Result",
     "Review",
     "ReviewType",
+    "set_json_backend",
     "Span",
     "Summarization",
     "Task",
@@ -97,3 +101,47 @@ async def load_async(
         result = await reader(result)
 
     return Result.from_dict(json_loaded(result))
+
+
+@overload
+def iter_documents(
+    result: Loadable,
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]": ...
+@overload
+def iter_documents(
+    result: "BinaryIO",
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]": ...
+@overload
+def iter_documents(
+    result: Readable, *, reader: "Callable[[Readable], Loadable]"
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]": ...
+def iter_documents(
+    result: object, *, reader: "Callable[..., object] | None" = None
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]":
+    """
+    Yield each document of `result` with its predictions, one at a time, followed by
+    errored documents, which have no predictions. `result` can be a dict, JSON
+    string/bytes, or a seekable file opened in binary mode.
+
+    If `reader` is provided, it should read `result` to produce a loadable type.
+
+    Unlike `load()`, predictions are only created for one document at a time. When
+    `result` is a file, its documents are also only read and parsed one at a time,
+    so peak memory is proportional to the largest document rather than to the whole
+    submission. Dicts and JSON string/bytes are already in memory.
+
+    ```
+    with open(result_file, "rb") as file:
+        for document, predictions in results.iter_documents(file):
+            ...
+    ```
+    """
+    if reader:
+        result = reader(result)
+
+    if isinstance(result, (str, bytes)):
+        return iter_result_json(result)
+    elif hasattr(result, "read"):
+        return iter_result_file(result)  # type: ignore[arg-type]
+    else:
+        return iter_result_dict(result)
@@ -0,0 +1,255 @@
+from itertools import starmap
+from typing import TYPE_CHECKING
+
+from ..etloutput import Box, Span, Token
+from ..etloutput.binary import box_row, cell_from_row, cell_row, span_row
+from .document import Document
+from .predictions import (
+    Citation,
+    Classification,
+    DocumentExtraction,
+    FormExtraction,
+    FormExtractionType,
+    Group,
+    Summarization,
+    Unbundling,
+)
+from .review import Review, ReviewType
+from .task import Task, TaskType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any, TypeAlias
+
+    from ..etloutput import Table
+    from .predictions import Prediction
+
+    Row: TypeAlias = "tuple[Any, ...]"
+
+MAGIC = b"IRES"
+VERSION = 1
+
+FORM_EXTRACTION_TYPES = {type.value: type for type in FormExtractionType}
+REVIEW_TYPES = {type.value: type for type in ReviewType}
+TASK_TYPES = {type.value: type for type in TaskType}
+
+
+class Interned:
+    """
+    Assign indexes to objects in the order they're first seen, such that objects
+    shared by many predictions are only stored once.
+    """
+
+    def __init__(self, rows: "Callable[[Any], Row]"):
+        self._to_row = rows
+        self._indexes: "dict[int, int]" = {}
+        self._objects: "list[object]" = []
+        self.rows: "list[Row]" = []
+
+    def __call__(self, obj: object) -> int:
+        index = self._indexes.get(id(obj))
+
+        if index is None:
+            index = self._indexes[id(obj)] = len(self.rows)
+            self._objects.append(obj)  # Keep `obj` alive so its `id()` isn't reused.
+            self.rows.append(self._to_row(obj))
+
+        return index
+
+
+def document_row(document: Document) -> "Row":
+    return (
+        document.id,
+        document.name,
+        document.etl_output_uri,
+        document.failed,
+        document.error,
+        document.traceback,
+        tuple(sorted(document._model_ids)),
+        tuple(sorted(document._component_ids)),
+    )
+
+
+def document_from_row(row: "Sequence[Any]") -> Document:
+    id, name, etl_output_uri, failed, error, traceback, model_ids, component_ids = row
+    return Document(
+        id,
+        name,
+        etl_output_uri,
+        failed,
+        error,
+        traceback,
+        frozenset(model_ids),
+        frozenset(component_ids),
+    )
+
+
+def task_row(task: Task) -> "Row":
+    return task.id, task.name, task.type.value
+
+
+def task_from_row(row: "Sequence[Any]") -> Task:
+    id, name, type = row
+    return Task(id, name, TASK_TYPES[type])
+
+
+def review_row(review: Review) -> "Row":
+    return (
+        review.id,
+        review.reviewer_id,
+        review.notes,
+        review.rejected,
+        review.type.value,
+    )
+
+
+def review_from_row(row: "Sequence[Any]") -> Review:
+    id, reviewer_id, notes, rejected, type = row
+    return Review(id, reviewer_id, notes, rejected, REVIEW_TYPES[type])
+
+
+def token_row(token: Token) -> "Row":
+    return token.text, box_row(token.box), span_row(token.span)
+
+
+def token_from_row(row: "Sequence[Any]") -> Token:
+    text, box, span = row
+    return Token(text, Box(*box), Span(*span))
+
+
+def group_row(group: Group) -> "Row":
+    return group.id, group.name, group.index
+
+
+def citation_row(citation: Citation) -> "Row":
+    return citation.start, citation.end, span_row(citation.span)
+
+
+def citation_from_row(row: "Sequence[Any]") -> Citation:
+    start, end, span = row
+    return Citation(start, end, Span(*span))
+
+
+def prediction_row(
+    prediction: "Prediction",
+    documents: Interned,
+    tasks: Interned,
+    reviews: Interned,
+    tables: Interned,
+) -> "Row":
+    """
+    Encode `prediction` as a row of plain values, referring to its document, task,
+    review, and tables by index.
+    """
+    common = (
+        documents(prediction.document),
+        tasks(prediction.task),
+        -1 if prediction.review is None else reviews(prediction.review),
+        prediction.label,
+        prediction.confidences,
+        prediction.extras,
+    )
+
+    if type(prediction) is Classification:
+        return ("classification", *common)
+    elif type(prediction) is DocumentExtraction:
+        return (
+            "document_extraction",
+            *common,
+            prediction.text,
+            prediction.accepted,
+            prediction.rejected,
+            tuple(map(group_row, prediction.groups)),
+            tuple(map(span_row, prediction.spans)),
+            tuple(map(token_row, prediction.tokens)),
+            tuple(map(tables, prediction.tables)),
+            tuple(map(cell_row, prediction.cells)),
+        )
+    elif type(prediction) is FormExtraction:
+        return (
+            "form_extraction",
+            *common,
+            prediction.text,
+            prediction.accepted,
+            prediction.rejected,
+            prediction.type.value,
+            box_row(prediction.box),
+            prediction.checked,
+            prediction.signed,
+        )
+    elif type(prediction) is Summarization:
+        return (
+            "summarization",
+            *common,
+            prediction.text,
+            prediction.accepted,
+            prediction.rejected,
+            tuple(map(citation_row, prediction.citations)),
+        )
+    elif type(prediction) is Unbundling:
+        return ("unbundling", *common, tuple(map(span_row, prediction.spans)))
+    else:
+        raise TypeError(f"can't serialize prediction of type {type(prediction)}")
+
+
+def prediction_from_row(
+    row: "Sequence[Any]",
+    documents: "Sequence[Document]",
+    tasks: "Sequence[Task]",
+    reviews: "Sequence[Review]",
+    tables: "Sequence[Table]",
+) -> "Prediction":
+    """
+    Decode a prediction from a row created by `prediction_row()`.
+    """
+    kind, document, task, review, label, confidences, extras, *fields = row
+    common = (
+        documents[document],
+        tasks[task],
+        None if review == -1 else reviews[review],
+        label,
+        confidences,
+        extras,
+    )
+
+    if kind == "classification":
+        return Classification(*common)
+    elif kind == "document_extraction":
+        text, accepted, rejected, groups, spans, tokens, table_indexes, cells = fields
+        return DocumentExtraction(
+            *common,
+            text,
+            accepted,
+            rejected,
+            set(starmap(Group, groups)),
+            list(starmap(Span, spans)),
+            list(map(token_from_row, tokens)),
+            [tables[index] for index in table_indexes],
+            list(map(cell_from_row, cells)),
+        )
+    elif kind == "form_extraction":
+        text, accepted, rejected, form_type, box, checked, signed = fields
+        return FormExtraction(
+            *common,
+            text,
+            accepted,
+            rejected,
+            FORM_EXTRACTION_TYPES[form_type],
+            Box(*box),
+            checked,
+            signed,
+        )
+    elif kind == "summarization":
+        text, accepted, rejected, citations = fields
+        return Summarization(
+            *common,
+            text,
+            accepted,
+            rejected,
+            list(map(citation_from_row, citations)),
+        )
+    elif kind == "unbundling":
+        (spans,) = fields
+        return Unbundling(*common, list(starmap(Span, spans)))
+    else:
+        raise ValueError(f"unsupported prediction kind `{kind}`")
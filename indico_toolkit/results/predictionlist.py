@@ -1,8 +1,9 @@
 from collections import defaultdict
-from itertools import chain
+from itertools import chain, islice
 from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Final, List, SupportsIndex, TypeVar, overload
 
+from ..etloutput import Box
 from .predictions import (
     Classification,
     DocumentExtraction,
@@ -19,6 +20,8 @@ from .utils import nfilter
 if TYPE_CHECKING:
     from collections.abc import Callable, Collection, Container, Iterable, Mapping
 
+    import pandas as pd
+    import pyarrow as pa
     from typing_extensions import Self
 
     from ..etloutput import EtlOutput
@@ -35,8 +38,48 @@ REVIEW_UNSPECIFIED: Final = Review(
     id=None, reviewer_id=None, notes=None, rejected=None, type=None  # type: ignore[arg-type]
 )
 
+# The type of each column created by `PredictionList.to_columns()`, and how it's
+# represented in pandas and Arrow. Every column is nullable.
+COLUMN_TYPES: Final = {
+    "document_id": "int",
+    "task": "str",
+    "review_type": "str",
+    "label": "str",
+    "confidence": "float",
+    "text": "str",
+    "page": "int",
+    "start": "int",
+    "end": "int",
+    "top": "int",
+    "left": "int",
+    "right": "int",
+    "bottom": "int",
+    "accepted": "bool",
+    "rejected": "bool",
+}
+PANDAS_DTYPES: Final = {
+    "int": "Int64",
+    "float": "Float64",
+    "bool": "boolean",
+    "str": "string",
+}
+ARROW_TYPES: Final = {
+    "int": "int64",
+    "float": "float64",
+    "bool": "bool_",
+    "str": "string",
+}
+
 
 class PredictionList(List[PredictionType]):
+    """
+    A list of predictions with methods to filter, group, and modify them.
+
+    Filtering by document, task, review, label, or page looks predictions up in
+    indexes of their positions that are built on first use and rebuilt when the
+    values they index have changed.
+    """
+
     @property
     def classifications(self) -> "PredictionList[Classification]":
         return self.oftype(Classification)
@@ -75,6 +118,103 @@ class PredictionList(List[PredictionType]):
         else:
             return super().__getitem__(index)
 
+    def __setitem__(self, index: "Any", value: "Any", /) -> None:
+        self._invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: "SupportsIndex | slice", /) -> None:
+        self._invalidate()
+        super().__delitem__(index)
+
+    def __iadd__(  # type: ignore[override, misc]
+        self, values: "Iterable[PredictionType]", /
+    ) -> "Self":
+        self._invalidate()
+        return super().__iadd__(values)
+
+    def __imul__(self, count: "SupportsIndex", /) -> "Self":
+        self._invalidate()
+        return super().__imul__(count)
+
+    def append(self, value: PredictionType, /) -> None:
+        self._invalidate()
+        super().append(value)
+
+    def extend(self, values: "Iterable[PredictionType]", /) -> None:
+        self._invalidate()
+        super().extend(values)
+
+    def insert(self, index: "SupportsIndex", value: PredictionType, /) -> None:
+        self._invalidate()
+        super().insert(index, value)
+
+    def pop(self, index: "SupportsIndex" = -1, /) -> PredictionType:
+        self._invalidate()
+        return super().pop(index)
+
+    def remove(self, value: PredictionType, /) -> None:
+        self._invalidate()
+        super().remove(value)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def reverse(self) -> None:
+        self._invalidate()
+        super().reverse()
+
+    def sort(self, *args: "Any", **kwargs: "Any") -> None:
+        self._invalidate()
+        super().sort(*args, **kwargs)
+
+    def _invalidate(self) -> None:
+        self.__dict__.pop("_indexes", None)
+
+    def _index(
+        self, name: str, key: "Callable[[Any], Any] | None" = None
+    ) -> "dict[Any, list[int]]":
+        """
+        Return the positions of predictions by their value of `key`, which defaults to
+        the attribute `name`.
+
+        Indexes are built on first use and kept with the values they were built from.
+        They're rebuilt if any value has changed since, such as when an attribute of a
+        prediction is reassigned or the list is copied and modified, so that they're
+        never stale. Checking the values is much cheaper than filtering predictions.
+        """
+        values = list(map(key or attrgetter(name), self))
+        indexes: "dict[str, tuple[list[Any], dict[Any, list[int]]]]" = (
+            self.__dict__.setdefault("_indexes", {})
+        )
+
+        if name not in indexes or indexes[name][0] != values:
+            index: "dict[Any, list[int]]" = defaultdict(list)
+
+            for position, value in enumerate(values):
+                index[value].append(position)
+
+            indexes[name] = values, dict(index)
+
+        return indexes[name][1]
+
+    def _positions(
+        self,
+        name: str,
+        matches: "Callable[[Any], bool]",
+        key: "Callable[[Any], Any] | None" = None,
+    ) -> "set[int]":
+        """
+        Return the positions of predictions whose value of `key` `matches`. Only the
+        distinct values of `key` are checked.
+        """
+        return {
+            position
+            for value, positions in self._index(name, key).items()
+            if matches(value)
+            for position in positions
+        }
+
     def apply(self, function: "Callable[[PredictionType], None]") -> "Self":
         """
         Apply `function` to all predictions.
@@ -104,19 +244,25 @@ class PredictionList(List[PredictionType]):
 
         for document, extractions in extractions_by_document.items():
             etl_output = etl_outputs[document]
+            spans = [span for extraction in extractions for span in extraction.spans]
 
-            for extraction in extractions:
-                if tokens:
+            if tokens:
+                tokens_for_spans = iter(etl_output.tokens_for(spans))
+
+                for extraction in extractions:
                     extraction.tokens = list(
                         filter(
                             None,
-                            map(etl_output.token_for, extraction.spans),
+                            islice(tokens_for_spans, len(extraction.spans)),
                         )
                     )
 
-                if tables:
+            if tables:
+                table_cells_for_spans = iter(etl_output.table_cells_for_many(spans))
+
+                for extraction in extractions:
                     extraction.table_cells = chain.from_iterable(
-                        map(etl_output.table_cells_for, extraction.spans)
+                        islice(table_cells_for_spans, len(extraction.spans))
                     )
 
         return self
@@ -132,7 +278,9 @@ class PredictionList(List[PredictionType]):
         it's automatically converted to its hashable immutable variant (like frozenset).
         This makes it easy to group by linked labels or unbundling pages.
         """
-        grouped_predictions = defaultdict(type(self))  # type: ignore[var-annotated]
+        grouped_predictions: "defaultdict[KeyType, list[PredictionType]]" = defaultdict(
+            list
+        )
 
         for prediction in self:
             group_key = key(prediction)
@@ -144,7 +292,7 @@ class PredictionList(List[PredictionType]):
 
             grouped_predictions[group_key].append(prediction)
 
-        return grouped_predictions
+        return self._grouped(grouped_predictions)
 
     def groupbyiter(
         self, keys: "Callable[[PredictionType], Iterable[KeyType]]"
@@ -156,13 +304,30 @@ class PredictionList(List[PredictionType]):
         Each prediction is associated with every key in the iterable individually.
         If the iterable is empty, the prediction is not included in any group.
         """
-        grouped_predictions = defaultdict(type(self))  # type: ignore[var-annotated]
+        grouped_predictions: "defaultdict[KeyType, list[PredictionType]]" = defaultdict(
+            list
+        )
 
         for prediction in self:
             for group_key in keys(prediction):
                 grouped_predictions[group_key].append(prediction)
 
-        return grouped_predictions
+        return self._grouped(grouped_predictions)
+
+    def _grouped(
+        self, grouped_predictions: "dict[KeyType, list[PredictionType]]"
+    ) -> "defaultdict[KeyType, Self]":
+        """
+        Wrap each group of predictions in a prediction list once it's complete,
+        rather than appending to prediction lists one at a time. Missing keys return
+        empty prediction lists.
+        """
+        grouped: "defaultdict[KeyType, Self]" = defaultdict(type(self))
+        grouped.update(
+            (group_key, type(self)(predictions))
+            for group_key, predictions in grouped_predictions.items()
+        )
+        return grouped
 
     def oftype(self, type: "type[OfType]") -> "PredictionList[OfType]":
         """
@@ -225,79 +390,80 @@ class PredictionList(List[PredictionType]):
         signed: form extractions that are or aren't signed.
         """
         predicates = []
+        position_sets = []
 
         if predicate is not None:
             predicates.append(predicate)
 
         if document is not None:
-            predicates.append(lambda prediction: prediction.document == document)
+            position_sets.append(set(self._index("document").get(document, ())))
 
         if document_in is not None:
-            predicates.append(lambda prediction: prediction.document in document_in)
+            position_sets.append(
+                self._positions("document", lambda value: value in document_in)
+            )
 
         if task is not None:
-            predicates.append(
-                lambda prediction: (
-                    prediction.task == task
-                    or prediction.task.type == task
-                    or prediction.task.name == task
+            position_sets.append(
+                self._positions(
+                    "task",
+                    lambda value: (
+                        value == task or value.type == task or value.name == task
+                    ),
                 )
             )
 
         if task_in is not None:
-            predicates.append(
-                lambda prediction: (
-                    prediction.task in task_in
-                    or prediction.task.type in task_in
-                    or prediction.task.name in task_in
+            position_sets.append(
+                self._positions(
+                    "task",
+                    lambda value: (
+                        value in task_in
+                        or value.type in task_in
+                        or value.name in task_in
+                    ),
                 )
             )
 
         if review is not REVIEW_UNSPECIFIED:
-            predicates.append(
-                lambda prediction: (
-                    prediction.review == review
-                    or (
-                        prediction.review is not None
-                        and prediction.review.type == review
-                    )
+            position_sets.append(
+                self._positions(
+                    "review",
+                    lambda value: (
+                        value == review or (value is not None and value.type == review)
+                    ),
                 )
             )
 
         if review_in != {REVIEW_UNSPECIFIED}:
-            predicates.append(
-                lambda prediction: (
-                    prediction.review in review_in
-                    or (
-                        prediction.review is not None
-                        and prediction.review.type in review_in
-                    )
+            position_sets.append(
+                self._positions(
+                    "review",
+                    lambda value: (
+                        value in review_in
+                        or (value is not None and value.type in review_in)
+                    ),
                 )
             )
 
         if label is not None:
-            predicates.append(lambda prediction: prediction.label == label)
+            position_sets.append(set(self._index("label").get(label, ())))
 
         if label_in is not None:
-            predicates.append(lambda prediction: prediction.label in label_in)
+            position_sets.append(
+                self._positions("label", lambda value: value in label_in)
+            )
 
         if page is not None:
-            predicates.append(
-                lambda prediction: (
-                    (isinstance(prediction, Extraction) and prediction.page == page)
-                    or (isinstance(prediction, Unbundling) and page in prediction.pages)
-                )
+            position_sets.append(
+                self._positions("pages", lambda value: page in value, key=_pages)
             )
 
         if page_in is not None:
             page_in = set(page_in)
-            predicates.append(
-                lambda prediction: (
-                    (isinstance(prediction, Extraction) and prediction.page in page_in)
-                    or (
-                        isinstance(prediction, Unbundling)
-                        and bool(page_in & set(prediction.pages))
-                    )
+            position_sets.append(
+                self._positions(
+                    "pages", lambda value: not page_in.isdisjoint(value), key=_pages
                 )
             )
 
@@ -341,7 +507,13 @@ class PredictionList(List[PredictionType]):
                 )
             )
 
-        return type(self)(nfilter(predicates, self))
+        predictions: "Iterable[PredictionType]" = self
+
+        if position_sets:
+            positions = sorted(set.intersection(*position_sets))
+            predictions = map(super().__getitem__, positions)
+
+        return type(self)(nfilter(predicates, predictions))
 
     def accept(self) -> "Self":
         """
@@ -371,13 +543,196 @@ class PredictionList(List[PredictionType]):
         self.oftype(Extraction).apply(Extraction.unreject)
         return self
 
+    def threshold(
+        self,
+        *,
+        accept: "Mapping[str, float] | None" = None,
+        reject: "Mapping[str, float] | None" = None,
+    ) -> "Self":
+        """
+        Mark extractions as accepted or rejected for auto review by label in one pass.
+
+        accept: accept extractions with confidence >= the threshold for their label,
+        reject: reject extractions with confidence < the threshold for their label.
+
+        Extractions with labels that have no threshold, or with confidences between
+        their thresholds, are left unchanged. E.g.
+        `threshold(accept={"Name": 0.98}, reject={"Name": 0.5})`.
+        """
+        accept = accept or {}
+        reject = reject or {}
+
+        for label in accept.keys() & reject.keys():
+            if accept[label] < reject[label]:
+                raise ValueError(
+                    f"accept threshold {accept[label]} for {label!r} is below its "
+                    f"reject threshold {reject[label]}"
+                )
+
+        # Labels without an accept or reject threshold compare against values no
+        # confidence can reach.
+        thresholds = {
+            label: (accept.get(label, float("inf")), reject.get(label, float("-inf")))
+            for label in accept.keys() | reject.keys()
+        }
+
+        for prediction in self:
+            if not isinstance(prediction, Extraction):
+                continue
+
+            label = prediction.label
+
+            if label not in thresholds or label not in prediction.confidences:
+                continue
+
+            accept_threshold, reject_threshold = thresholds[label]
+            confidence = prediction.confidences[label]
+
+            if confidence >= accept_threshold:
+                prediction.accepted = True
+                prediction.rejected = False
+            elif confidence < reject_threshold:
+                prediction.accepted = False
+                prediction.rejected = True
+
+        return self
+
+    def to_columns(self) -> "dict[str, list[Any]]":
+        """
+        Create a dictionary of columns with one value per prediction, in order, for
+        tabular tools like pandas and Arrow. Columns are named in `COLUMN_TYPES`.
+
+        Values that don't apply to a prediction are `None`, such as the text of
+        classifications. Extractions and unbundlings have the page, start, and end of
+        their first span. Form extractions have the edges of their bounding box, and
+        document extractions those of the tokens assigned by `assign_ocr()`.
+        """
+        columns: "dict[str, list[Any]]" = {name: [] for name in COLUMN_TYPES}
+        (
+            document_id,
+            task,
+            review_type,
+            label,
+            confidence,
+            text,
+            page,
+            start,
+            end,
+            top,
+            left,
+            right,
+            bottom,
+            accepted,
+            rejected,
+        ) = (column.append for column in columns.values())
+
+        for prediction in self:
+            document_id(prediction.document.id)
+            task(prediction.task.name)
+            review_type(prediction.review.type.value if prediction.review else None)
+            label(prediction.label)
+            confidence(prediction.confidences.get(prediction.label))
+            span = None
+            box = None
+
+            if isinstance(prediction, Extraction):
+                text(prediction.text)
+                accepted(prediction.accepted)
+                rejected(prediction.rejected)
+
+                if isinstance(prediction, FormExtraction):
+                    box = prediction.box
+                elif isinstance(prediction, DocumentExtraction):
+                    span = prediction.span
+                    box = _bounding_box(prediction)
+                elif isinstance(prediction, Summarization):
+                    span = prediction.span
+            else:
+                text(None)
+                accepted(None)
+                rejected(None)
+
+                if isinstance(prediction, Unbundling) and prediction.spans:
+                    span = prediction.spans[0]
+
+            if span:
+                page(span.page)
+                start(span.start)
+                end(span.end)
+            else:
+                page(box.page if box else None)
+                start(None)
+                end(None)
+
+            if box:
+                top(box.top)
+                left(box.left)
+                right(box.right)
+                bottom(box.bottom)
+            else:
+                top(None)
+                left(None)
+                right(None)
+                bottom(None)
+
+        return columns
+
+    def to_pandas(self) -> "pd.DataFrame":  # type: ignore[no-any-unimported, unused-ignore]
+        """
+        Create a pandas `DataFrame` from `to_columns()` with nullable column types.
+        """
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise RuntimeError(
+                "`to_pandas()` requires additional dependencies: "
+                "`pip install indico-toolkit[predictions]`"
+            ) from error
+
+        return pd.DataFrame(
+            {
+                name: pd.array(values, dtype=PANDAS_DTYPES[COLUMN_TYPES[name]])
+                for name, values in self.to_columns().items()
+            }
+        )
+
+    def to_arrow(self) -> "pa.Table":  # type: ignore[no-any-unimported, unused-ignore]
+        """
+        Create an Arrow `Table` from `to_columns()`.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise RuntimeError(
+                "`to_arrow()` requires additional dependencies: `pip install pyarrow`"
+            ) from error
+
+        return pa.table(
+            {
+                name: pa.array(
+                    values, type=getattr(pa, ARROW_TYPES[COLUMN_TYPES[name]])()
+                )
+                for name, values in self.to_columns().items()
+            }
+        )
+
     def to_changes(self, result: "Result") -> "list[dict[str, Any]]":
         """
         Create a list for the `changes` argument of `SubmitReview` based on the
         predictions in this prediction list and the documents in `result`.
+
+        Predictions are grouped by document and task ID in a single pass.
         """
+        predictions_by_document: "dict[int, dict[int, list[PredictionType]]]" = (
+            defaultdict(lambda: defaultdict(list))
+        )
         changes: "list[dict[str, Any]]" = []
 
+        for prediction in self:
+            predictions_by_document[prediction.document.id][prediction.task.id].append(
+                prediction
+            )
+
         for document in result.documents:
             if document.failed:
                 continue
@@ -385,20 +740,14 @@ class PredictionList(List[PredictionType]):
             model_results: "dict[str, Any]" = {}
             component_results: "dict[str, Any]" = {}
 
-            predictions_by_task = self.where(
-                document=document,
-            ).groupby(
-                attrgetter("task"),
-            )
-
-            for task, predictions in predictions_by_task.items():
-                task_id = str(task.id)
+            for task_id, predictions in predictions_by_document[document.id].items():
+                task_id_str = str(task_id)
                 prediction_dicts = [prediction.to_dict() for prediction in predictions]
 
-                if task_id in document._model_ids:
-                    model_results[task_id] = prediction_dicts
-                elif task_id in document._component_ids:
-                    component_results[task_id] = prediction_dicts
+                if task_id_str in document._model_ids:
+                    model_results[task_id_str] = prediction_dicts
+                elif task_id_str in document._component_ids:
+                    component_results[task_id_str] = prediction_dicts
 
             for model_id in document._model_ids:
                 if model_id not in model_results:
@@ -417,3 +766,35 @@ class PredictionList(List[PredictionType]):
             )
 
         return changes
+
+
+def _bounding_box(extraction: DocumentExtraction) -> "Box | None":
+    """
+    Return the bounding box of the tokens assigned to `extraction` on the page of its
+    first span, or `None` if none are.
+    """
+    page = extraction.span.page
+    boxes = [token.box for token in extraction.tokens if token.box.page == page]
+
+    if not boxes:
+        return None
+
+    return Box(
+        page=page,
+        top=min(box.top for box in boxes),
+        left=min(box.left for box in boxes),
+        right=max(box.right for box in boxes),
+        bottom=max(box.bottom for box in boxes),
+    )
+
+
+def _pages(prediction: Prediction) -> "tuple[int, ...]":
+    """
+    Return the pages of an extraction or unbundling, or no pages for other predictions.
+    """
+    if isinstance(prediction, Extraction):
+        return (prediction.page,)
+    elif isinstance(prediction, Unbundling):
+        return prediction.pages
+    else:
+        return ()
@@ -4,7 +4,28 @@ from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 
+from ..etloutput.binary import (
+    dump_values,
+    load_values,
+    pack,
+    table_from_row,
+    table_row,
+    unpack,
+)
 from . import predictions as prediction
+from .binary import (
+    MAGIC,
+    VERSION,
+    Interned,
+    document_from_row,
+    document_row,
+    prediction_from_row,
+    prediction_row,
+    review_from_row,
+    review_row,
+    task_from_row,
+    task_row,
+)
 from .document import Document
 from .normalization import normalize_result_dict
 from .predictionlist import PredictionList
@@ -14,7 +35,88 @@ from .task import Task
 from .utils import get
 
 if TYPE_CHECKING:
-    from typing_extensions import Self
+    from collections.abc import Iterator
+
+    from typing_extensions import Buffer, Self
+
+
+def check_file_version(result: object) -> None:
+    """
+    Raise an error if `result` isn't a supported result file version.
+    """
+    file_version = get(result, int, "file_version")
+
+    if file_version != 3:
+        raise ValueError(f"unsupported result file version `{file_version}`")
+
+
+def tasks_from_result_dict(result: object) -> "list[Task]":
+    """
+    Create the tasks of a result file from its model group and static model
+    component metadata, in order.
+    """
+    modelgroup_metadata = get(result, dict, "modelgroup_metadata")
+    component_metadata = get(result, dict, "component_metadata")
+    static_model_components = filter(
+        lambda component: (
+            get(component, str, "component_type").casefold() == "static_model"
+        ),
+        component_metadata.values(),
+    )
+
+    return sorted(
+        chain(
+            map(Task.from_dict, modelgroup_metadata.values()),
+            map(Task.from_dict, static_model_components),
+        )
+    )
+
+
+def reviews_from_result_dict(result: object) -> "list[Review]":
+    """
+    Create the reviews of a result file, in order.
+    """
+    return sorted(map(Review.from_dict, get(result, dict, "reviews").values()))
+
+
+def predictions_from_document_dict(
+    document_dict: object,
+    document: Document,
+    tasks_by_id: "dict[int, Task]",
+    final_review: "Review | None",
+) -> "Iterator[Prediction]":
+    """
+    Yield the original predictions of a document, followed by its final predictions
+    if it has been reviewed.
+    """
+    model_results = get(document_dict, dict, "model_results")
+    component_results = get(document_dict, dict, "component_results")
+
+    # Parse original predictions (which don't have an associated review).
+    original_results = {
+        **get(model_results, dict, "ORIGINAL"),
+        **get(component_results, dict, "ORIGINAL"),
+    }
+
+    for task_id, task_predictions in original_results.items():
+        task = tasks_by_id[int(task_id)]
+        yield from map(
+            partial(prediction.from_dict, document, task, None), task_predictions
+        )
+
+    # Parse final predictions (associated with the most recent review).
+    if final_review is not None:
+        final_results = {
+            **get(model_results, dict, "FINAL"),
+            **get(component_results, dict, "FINAL"),
+        }
+
+        for task_id, task_predictions in final_results.items():
+            task = tasks_by_id[int(task_id)]
+            yield from map(
+                partial(prediction.from_dict, document, task, final_review),
+                task_predictions,
+            )
 
 
 @dataclass(frozen=True, order=True)
@@ -55,87 +157,108 @@ class Result:
         """
         return replace(self, predictions=deepcopy(self.predictions, memo))
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a compact, versioned binary format loadable with `from_bytes()`.
+
+        Documents, tasks, reviews, and OCR tables are stored once and referred to by
+        index from each prediction.
+        """
+        documents = Interned(document_row)
+        tasks = Interned(task_row)
+        reviews = Interned(review_row)
+        tables = Interned(table_row)
+
+        for document in self.documents:
+            documents(document)
+
+        for task in self.tasks:
+            tasks(task)
+
+        for review in self.reviews:
+            reviews(review)
+
+        predictions = [
+            prediction_row(prediction, documents, tasks, reviews, tables)
+            for prediction in self.predictions
+        ]
+        values = {
+            "submission_id": self.submission_id,
+            "documents": documents.rows,
+            "document_count": len(self.documents),
+            "tasks": tasks.rows,
+            "task_count": len(self.tasks),
+            "reviews": reviews.rows,
+            "review_count": len(self.reviews),
+            "tables": tables.rows,
+            "predictions": predictions,
+        }
+
+        return pack(MAGIC, VERSION, [dump_values(values)])
+
     @staticmethod
-    def from_dict(result: object) -> "Result":
+    def from_bytes(data: "Buffer") -> "Result":
         """
-        Create a `Result` from a result file dictionary.
+        Load a `Result` serialized with `to_bytes()` without parsing or normalizing
+        result file JSON.
         """
-        file_version = get(result, int, "file_version")
+        (values_section,) = unpack(data, MAGIC, VERSION)
+
+        values = load_values(values_section)
+        documents = tuple(map(document_from_row, values["documents"]))
+        tasks = tuple(map(task_from_row, values["tasks"]))
+        reviews = tuple(map(review_from_row, values["reviews"]))
+        tables = tuple(map(table_from_row, values["tables"]))
+        predictions: "PredictionList[Prediction]" = PredictionList(
+            prediction_from_row(row, documents, tasks, reviews, tables)
+            for row in values["predictions"]
+        )
 
-        if file_version != 3:
-            raise ValueError(f"unsupported result file version `{file_version}`")
+        return Result(
+            submission_id=values["submission_id"],
+            documents=documents[: values["document_count"]],
+            tasks=tasks[: values["task_count"]],
+            reviews=reviews[: values["review_count"]],
+            predictions=predictions,
+        )
 
+    @staticmethod
+    def from_dict(result: object) -> "Result":
+        """
+        Create a `Result` from a result file dictionary.
+        """
+        check_file_version(result)
         normalize_result_dict(result)
 
         submission_id = get(result, int, "submission_id")
         submission_results = get(result, list, "submission_results")
-        modelgroup_metadata = get(result, dict, "modelgroup_metadata")
-        component_metadata = get(result, dict, "component_metadata")
-        review_metadata = get(result, dict, "reviews")
         errored_files = get(result, dict, "errored_files").values()
 
-        static_model_components = filter(
-            lambda component: (
-                get(component, str, "component_type").casefold() == "static_model"
-            ),
-            component_metadata.values(),
-        )
-
+        submission_documents = list(map(Document.from_dict, submission_results))
         documents = sorted(
             chain(
-                map(Document.from_dict, submission_results),
+                submission_documents,
                 map(Document.from_errored_file_dict, errored_files),
             )
         )
-        tasks = sorted(
-            chain(
-                map(Task.from_dict, modelgroup_metadata.values()),
-                map(Task.from_dict, static_model_components),
-            )
-        )
-        reviews = sorted(map(Review.from_dict, review_metadata.values()))
+        tasks = tasks_from_result_dict(result)
+        reviews = reviews_from_result_dict(result)
 
-        predictions: "PredictionList[Prediction]" = PredictionList()
+        # Look up tasks by ID rather than searching for each task section, such that
+        # loading scales linearly with the number of documents and tasks.
+        tasks_by_id = {task.id: task for task in tasks}
+        final_review = reviews[-1] if reviews else None
 
-        for document_dict in submission_results:
-            document_id = get(document_dict, int, "submissionfile_id")
-            document = next(
-                filter(lambda document: document.id == document_id, documents)
-            )
-            model_results = get(document_dict, dict, "model_results")
-            component_results = get(document_dict, dict, "component_results")
-
-            # Parse original predictions (which don't have an associated review).
-            original_results = {
-                **get(model_results, dict, "ORIGINAL"),
-                **get(component_results, dict, "ORIGINAL"),
-            }
-
-            for task_id, task_predictions in original_results.items():
-                task = next(filter(lambda task: task.id == int(task_id), tasks))
-                predictions.extend(
-                    map(
-                        partial(prediction.from_dict, document, task, None),
-                        task_predictions,
-                    )
+        predictions: "PredictionList[Prediction]" = PredictionList(
+            chain.from_iterable(
+                predictions_from_document_dict(
+                    document_dict, document, tasks_by_id, final_review
                 )
-
-            # Parse final predictions (associated with the most recent review).
-            if reviews:
-                review = reviews[-1]
-                final_results = {
-                    **get(model_results, dict, "FINAL"),
-                    **get(component_results, dict, "FINAL"),
-                }
-
-                for task_id, task_predictions in final_results.items():
-                    task = next(filter(lambda task: task.id == int(task_id), tasks))
-                    predictions.extend(
-                        map(
-                            partial(prediction.from_dict, document, task, review),
-                            task_predictions,
-                        )
-                    )
+                for document_dict, document in zip(
+                    submission_results, submission_documents
+                )
+            )
+        )
 
         return Result(
             submission_id=submission_id,
@@ -0,0 +1,284 @@
+import io
+import re
+from typing import TYPE_CHECKING
+
+from .document import Document
+from .normalization import normalize_result_dict
+from .predictionlist import PredictionList
+from .result import (
+    check_file_version,
+    predictions_from_document_dict,
+    reviews_from_result_dict,
+    tasks_from_result_dict,
+)
+from .utils import get, json_loaded
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import BinaryIO
+
+    from .predictions import Prediction
+
+CHUNK_SIZE = 2**20
+NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to the next bracket, or the next string that doesn't end in the buffer.
+BEFORE_BRACKET = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+
+
+def iter_result_dict(
+    result: object,
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]":
+    """
+    Yield each document of a result file dictionary with its predictions, followed by
+    errored documents, which have no predictions.
+    """
+    yield from _iter_documents(result, iter(get(result, list, "submission_results")))
+
+
+def iter_result_json(
+    result: "str | bytes",
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]":
+    """
+    Yield each document of a result file JSON string with its predictions, followed
+    by errored documents, which have no predictions.
+
+    The JSON must already be in memory, so only predictions are created one document
+    at a time. Use `iter_result_file()` to read documents from a file as they're
+    yielded.
+    """
+    if isinstance(result, str):
+        result = result.encode()
+
+    yield from iter_result_file(io.BytesIO(result))
+
+
+def iter_result_file(
+    file: "BinaryIO", chunk_size: int = CHUNK_SIZE
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]":
+    """
+    Yield each document of a result file opened in binary mode with its predictions,
+    followed by errored documents, which have no predictions.
+
+    The file is read twice, so it must be seekable. The first pass reads it in chunks
+    of `chunk_size` bytes, parses every top-level section except
+    `submission_results`, and records where each of its documents starts and ends
+    without parsing them. The second pass reads and parses each document only as it's
+    yielded, such that only one document is held in memory at a time.
+    """
+    metadata, extents = _scan(JsonScanner(file, chunk_size))
+    yield from _iter_documents(metadata, _read_documents(file, extents))
+
+
+def _iter_documents(
+    metadata: object,
+    document_dicts: "Iterator[object]",
+) -> "Iterator[tuple[Document, PredictionList[Prediction]]]":
+    check_file_version(metadata)
+    normalize_result_dict(metadata)
+
+    tasks_by_id = {task.id: task for task in tasks_from_result_dict(metadata)}
+    reviews = reviews_from_result_dict(metadata)
+    final_review = reviews[-1] if reviews else None
+
+    for document_dict in document_dicts:
+        document = Document.from_dict(document_dict)
+
+        predictions: "PredictionList[Prediction]" = PredictionList(
+            predictions_from_document_dict(
+                document_dict, document, tasks_by_id, final_review
+            )
+        )
+
+        yield document, predictions
+
+    for errored_file in get(metadata, dict, "errored_files").values():
+        yield Document.from_errored_file_dict(errored_file), PredictionList()
+
+
+def _scan(scanner: "JsonScanner") -> "tuple[dict[str, object], list[tuple[int, int]]]":
+    """
+    Parse the top-level sections of a result file, except for `submission_results`,
+    for which return the start and end offsets of each document instead.
+    """
+    metadata: "dict[str, object]" = {}
+    extents: "list[tuple[int, int]]" = []
+    scanner.expect(b"{")
+
+    if scanner.peek() == b"}":
+        return metadata, extents
+
+    while True:
+        if scanner.peek() != b'"':
+            raise scanner.error("property name")
+
+        key = json_loaded(scanner.value())
+        scanner.expect(b":")
+
+        if key == "submission_results":
+            scanner.expect(b"[")
+
+            while scanner.peek() != b"]":
+                if extents:
+                    scanner.expect(b",")
+
+                extents.append(scanner.skip())
+
+            scanner.expect(b"]")
+        else:
+            metadata[key] = json_loaded(scanner.value())
+
+        if scanner.peek() == b"}":
+            return metadata, extents
+
+        scanner.expect(b",")
+
+
+def _read_documents(
+    file: "BinaryIO", extents: "list[tuple[int, int]]"
+) -> "Iterator[object]":
+    for start, end in extents:
+        file.seek(start)
+        yield json_loaded(file.read(end - start))
+
+
+class JsonScanner:
+    """
+    Finds where JSON values in a binary file start and end without parsing them,
+    reading the file in chunks of `chunk_size` bytes. Only the chunks spanning the
+    value being scanned are held in memory.
+
+    Values are only checked for balanced brackets and terminated strings. They're
+    fully validated when they're parsed.
+    """
+
+    def __init__(self, file: "BinaryIO", chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = b""
+        self.buffer_offset = file.tell()
+        self.index = 0
+
+    @property
+    def offset(self) -> int:
+        """
+        Return the file offset of the next byte to scan.
+        """
+        return self.buffer_offset + self.index
+
+    def error(self, expected: str) -> ValueError:
+        return ValueError(
+            f"invalid result file JSON: expecting {expected} at byte {self.offset}"
+        )
+
+    def peek(self) -> bytes:
+        """
+        Skip whitespace and return the next byte without scanning it.
+        """
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.index)
+
+            if match is not None:
+                self.index = match.start()
+                return match.group()
+
+            self.index = len(self.buffer)
+            self._read()
+
+    def expect(self, delimiter: bytes) -> None:
+        """
+        Scan `delimiter`, which must be the next byte after any whitespace.
+        """
+        if self.peek() != delimiter:
+            raise self.error(repr(delimiter.decode()))
+
+        self.index += 1
+
+    def value(self) -> bytes:
+        """
+        Scan the next JSON value and return its bytes.
+        """
+        length = self._length()
+        value = self.buffer[self.index : self.index + length]
+        self.index += length
+        return value
+
+    def skip(self) -> "tuple[int, int]":
+        """
+        Scan the next JSON value and return its start and end offsets in the file.
+        """
+        length = self._length()
+        start = self.offset
+        self.index += length
+        return start, start + length
+
+    def _read(self) -> None:
+        """
+        Read the next chunk, dropping the bytes that have already been scanned.
+        Positions relative to `index` are unchanged.
+        """
+        chunk = self.file.read(self.chunk_size)
+
+        if not chunk:
+            raise ValueError(
+                f"invalid result file JSON: unexpected end at byte {self.offset}"
+            )
+
+        self.buffer = self.buffer[self.index :] + chunk
+        self.buffer_offset += self.index
+        self.index = 0
+
+    def _length(self) -> int:
+        """
+        Return the length of the next JSON value, reading chunks until it's complete.
+        """
+        first = self.peek()
+
+        if first == b'"':
+            return self._string_length(1)
+
+        if first in (b"{", b"["):
+            depth = 0
+            position = 0
+
+            while True:
+                match = BEFORE_BRACKET.match(self.buffer, self.index + position)
+                position = match.end() if match else self.index + position
+                bracket = self.buffer[position : position + 1]
+                position -= self.index
+
+                if bracket in (b"", b'"'):
+                    self._read()
+                    continue
+
+                depth += 1 if bracket in (b"{", b"[") else -1
+                position += 1
+
+                if depth == 0:
+                    return position
+
+        if first in (b",", b":", b"]", b"}"):
+            raise self.error("value")
+
+        # Numbers, booleans, and null end at the next delimiter or whitespace.
+        while True:
+            match = SCALAR_END.search(self.buffer, self.index)
+
+            if match is not None:
+                return match.start() - self.index
+
+            self._read()
+
+    def _string_length(self, position: int) -> int:
+        """
+        Return the position after the end of the string whose contents start at
+        `position`, relative to `index`.
+        """
+        while True:
+            match = STRING_END.match(self.buffer, self.index + position)
+
+            if match is not None:
+                return match.end() - self.index
+
+            self._read()
@@ -1,7 +1,14 @@
 from collections.abc import Iterable, Iterator
 from typing import Callable
 
-from ..etloutput.utils import Value, get, has, json_loaded, str_decoded
+from ..etloutput.utils import (
+    Value,
+    get,
+    has,
+    json_loaded,
+    set_json_backend,
+    str_decoded,
+)
 
 __all__ = (
     "get",
@@ -9,6 +16,7 @@ __all__ = (
     "json_loaded",
     "nfilter",
     "omit",
+    "set_json_backend",
     "str_decoded",
 )
 
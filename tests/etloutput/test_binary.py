@@ -0,0 +1,133 @@
+import copy
+import pickle
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import EtlOutput, Span, TokenColumns
+from indico_toolkit.etloutput.binary import load_values, table_from_row, table_row
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_file = data_folder / "4725" / "111924" / "110239" / "etl_output.json"
+
+
+def read_uri(uri: str | Path) -> bytes:
+    uri = str(uri)
+    storage_folder_path = uri.split("/storage/submission/")[-1]
+    file_path = data_folder / storage_folder_path
+    return file_path.read_bytes()
+
+
+def assert_fields_equal(loaded: EtlOutput, etl_output: EtlOutput) -> None:
+    assert loaded.text == etl_output.text
+    assert tuple(loaded.text_on_page) == tuple(etl_output.text_on_page)
+    assert tuple(loaded.tokens) == tuple(etl_output.tokens)
+    assert tuple(map(tuple, loaded.tokens_on_page)) == tuple(
+        map(tuple, etl_output.tokens_on_page)
+    )
+    assert loaded.tables == etl_output.tables
+    assert tuple(loaded.tables_on_page) == tuple(etl_output.tables_on_page)
+
+
+@pytest.mark.parametrize(
+    "lazy, compact_tokens", [(False, False), (False, True), (True, False)]
+)
+def test_round_trip(lazy: bool, compact_tokens: bool) -> None:
+    etl_output = etloutput.load(
+        etl_output_file, reader=read_uri, lazy=lazy, compact_tokens=compact_tokens
+    )
+    loaded = EtlOutput.from_bytes(etl_output.to_bytes())
+
+    assert_fields_equal(loaded, etl_output)
+    assert isinstance(loaded.tokens, TokenColumns) == compact_tokens
+    assert loaded.token_for(Span(1, 1281, 1285)) == etl_output.token_for(
+        Span(1, 1281, 1285)
+    )
+
+
+def test_round_trip_tables_shared() -> None:
+    etl_output = etloutput.load(etl_output_file, reader=read_uri)
+    loaded = EtlOutput.from_bytes(etl_output.to_bytes())
+    table = loaded.tables[-1]
+
+    assert loaded.tables_on_page[-1][-1] is table
+    assert table.rows[1][1] is table.columns[1][1]
+
+
+def test_round_trip_tables_not_shared() -> None:
+    etl_output = etloutput.load(etl_output_file, reader=read_uri)
+    table = etl_output.tables[-1]
+    copied = replace(
+        table,
+        rows=tuple(tuple(map(copy.copy, row)) for row in table.rows),
+        columns=tuple(tuple(map(copy.copy, column)) for column in table.columns),
+    )
+    loaded = table_from_row(table_row(copied))
+
+    assert loaded == table
+    assert loaded.rows[1][1] is loaded.columns[1][1]
+
+
+def test_round_trip_no_tokens_tables() -> None:
+    etl_output = etloutput.load(
+        etl_output_file, reader=read_uri, tokens=False, tables=False
+    )
+    loaded = EtlOutput.from_bytes(etl_output.to_bytes())
+
+    assert loaded == etl_output
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["ascii", "latin-1 é", "ucs-2 €", "astral 😀", "surrogate \ud800"],
+)
+def test_round_trip_text(text: str) -> None:
+    etl_output = EtlOutput.from_pages([text, "", f"{text}\n{text}"], [], [])
+    loaded = EtlOutput.from_bytes(etl_output.to_bytes())
+
+    assert loaded == etl_output
+
+
+def test_round_trip_text_not_joined() -> None:
+    etl_output = EtlOutput(
+        text="different",
+        text_on_page=("page",),
+        tokens=(),
+        tokens_on_page=(),
+        tables=(),
+        tables_on_page=(),
+    )
+    loaded = EtlOutput.from_bytes(etl_output.to_bytes())
+
+    assert loaded == etl_output
+
+
+def test_from_bytes_memoryview() -> None:
+    etl_output = etloutput.load(etl_output_file, reader=read_uri, compact_tokens=True)
+    data = bytearray(etl_output.to_bytes())
+    loaded = EtlOutput.from_bytes(memoryview(data))
+
+    assert loaded == etl_output
+
+
+def test_invalid_data() -> None:
+    data = etloutput.load(etl_output_file, reader=read_uri).to_bytes()
+
+    with pytest.raises(ValueError, match="magic number"):
+        EtlOutput.from_bytes(b"JUNK" + data[4:])
+
+    with pytest.raises(ValueError, match="unsupported format version"):
+        EtlOutput.from_bytes(data[:4] + b"\xff\xff" + data[6:])
+
+    with pytest.raises(ValueError):
+        EtlOutput.from_bytes(data[:100])
+
+    with pytest.raises(ValueError):
+        EtlOutput.from_bytes(b"")
+
+
+def test_values_reject_objects() -> None:
+    with pytest.raises(pickle.UnpicklingError):
+        load_values(pickle.dumps(Span(0, 1, 2)))
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import EtlOutput, EtlOutputCache, TokenColumns
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_uri = str(data_folder / "4725" / "111924" / "110239" / "etl_output.json")
+
+
+class CountingReader:
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def __call__(self, uri: str | Path) -> bytes:
+        self.reads += 1
+        storage_folder_path = str(uri).split("/storage/submission/")[-1]
+        return (data_folder / storage_folder_path).read_bytes()
+
+    async def read_async(self, uri: str | Path) -> bytes:
+        return self(uri)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EtlOutputCache:
+    return EtlOutputCache(tmp_path / "cache")
+
+
+def test_cache_hit(cache: EtlOutputCache) -> None:
+    reader = CountingReader()
+    loaded = etloutput.load(etl_output_uri, reader=reader, cache=cache)
+    reads = reader.reads
+    cached = etloutput.load(etl_output_uri, reader=reader, cache=cache)
+
+    assert reads > 0
+    assert reader.reads == reads
+    assert len(cache) == 1
+    assert cached == loaded
+
+
+def test_cache_hit_async(cache: EtlOutputCache) -> None:
+    reader = CountingReader()
+    loaded = asyncio.run(
+        etloutput.load_async(etl_output_uri, reader=reader.read_async, cache=cache)
+    )
+    reads = reader.reads
+    cached = etloutput.load(etl_output_uri, reader=reader, cache=cache)
+
+    assert reader.reads == reads
+    assert cached == loaded
+
+
+async def test_cache_async_off_loop(tmp_path: Path) -> None:
+    loop_thread = threading.get_ident()
+    threads = []
+
+    class ThreadRecordingCache(EtlOutputCache):
+        def get(self, key: str, *, mmap: bool = False) -> "EtlOutput | None":
+            threads.append(threading.get_ident())
+            return super().get(key, mmap=mmap)
+
+        def put(self, key: str, etl_output: EtlOutput) -> None:
+            threads.append(threading.get_ident())
+            super().put(key, etl_output)
+
+    cache = ThreadRecordingCache(tmp_path / "cache")
+    reader = CountingReader()
+    await etloutput.load_async(etl_output_uri, reader=reader.read_async, cache=cache)
+    await etloutput.load_async(
+        etl_output_uri, reader=reader.read_async, cache=cache, mmap=True
+    )
+
+    assert len(threads) == 3
+    assert loop_thread not in threads
+
+
+def test_cache_keyed_by_options(cache: EtlOutputCache) -> None:
+    reader = CountingReader()
+    etloutput.load(etl_output_uri, reader=reader, cache=cache)
+    no_tables = etloutput.load(etl_output_uri, reader=reader, tables=False, cache=cache)
+    compact = etloutput.load(
+        etl_output_uri, reader=reader, compact_tokens=True, cache=cache
+    )
+    cached_compact = etloutput.load(
+        etl_output_uri, reader=reader, compact_tokens=True, cache=cache
+    )
+
+    assert len(cache) == 3
+    assert not no_tables.tables
+    assert isinstance(cached_compact.tokens, TokenColumns)
+    assert cached_compact.tokens == compact.tokens
+
+
+def test_cache_eviction(tmp_path: Path) -> None:
+    reader = CountingReader()
+    etl_output = etloutput.load(etl_output_uri, reader=reader)
+    cache = EtlOutputCache(tmp_path)
+    cache.put("first", etl_output)
+    entry_size = cache.size
+    cache = EtlOutputCache(tmp_path, max_size=entry_size * 2)
+    cache.put("second", etl_output)
+    cache.get("first")
+    cache.put("third", etl_output)
+
+    assert "first" in cache
+    assert "second" not in cache
+    assert "third" in cache
+    assert cache.size <= cache.max_size
+
+
+def test_cache_too_large(tmp_path: Path) -> None:
+    etl_output = etloutput.load(etl_output_uri, reader=CountingReader())
+    cache = EtlOutputCache(tmp_path, max_size=1)
+    cache.put("key", etl_output)
+
+    assert "key" not in cache
+    assert cache.get("key") is None
+
+
+def test_cache_failed_put(
+    cache: EtlOutputCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    etl_output = etloutput.load(etl_output_uri, reader=CountingReader())
+
+    def fail(*args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        cache.put("key", etl_output)
+
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_cache_corrupt_entry(cache: EtlOutputCache) -> None:
+    reader = CountingReader()
+    key = EtlOutputCache.key(
+        etl_output_uri, text=True, tokens=True, tables=True, compact_tokens=False
+    )
+    (cache.directory / f"{key}.etl").write_bytes(b"corrupt")
+    etl_output = etloutput.load(etl_output_uri, reader=reader, cache=cache)
+
+    assert reader.reads > 0
+    assert isinstance(cache.get(key), EtlOutput)
+    assert cache.get(key) == etl_output
+
+
+def test_cache_clear(cache: EtlOutputCache) -> None:
+    etloutput.load(etl_output_uri, reader=CountingReader(), cache=cache)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_lazy(cache: EtlOutputCache) -> None:
+    with pytest.raises(ValueError):
+        etloutput.load(etl_output_uri, reader=CountingReader(), lazy=True, cache=cache)
@@ -0,0 +1,104 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import (
+    NULL_SPAN,
+    NULL_TOKEN,
+    EtlOutput,
+    Span,
+    TokenColumns,
+)
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_file = data_folder / "4725" / "111924" / "110239" / "etl_output.json"
+
+
+def read_uri(uri: str | Path) -> bytes:
+    uri = str(uri)
+    storage_folder_path = uri.split("/storage/submission/")[-1]
+    file_path = data_folder / storage_folder_path
+    return file_path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_file, reader=read_uri)
+
+
+@pytest.fixture(scope="module")
+def compact_etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_file, reader=read_uri, compact_tokens=True)
+
+
+def test_columns(compact_etl_output: EtlOutput) -> None:
+    assert isinstance(compact_etl_output.tokens, TokenColumns)
+
+    for page in compact_etl_output.tokens_on_page:
+        assert isinstance(page, TokenColumns)
+
+
+def test_equivalent(etl_output: EtlOutput, compact_etl_output: EtlOutput) -> None:
+    assert compact_etl_output.tokens == etl_output.tokens
+    assert compact_etl_output.tokens_on_page == etl_output.tokens_on_page
+    assert list(compact_etl_output.tokens) == list(etl_output.tokens)
+    assert compact_etl_output.tokens[-1] == etl_output.tokens[-1]
+
+
+@pytest.mark.parametrize(
+    "span",
+    [
+        Span(page=1, start=1281, end=1285),
+        Span(page=1, start=1311, end=1344),
+        Span(page=0, start=10, end=200),
+        Span(page=1, start=1056, end=1067),
+        Span(page=1, start=0, end=1),
+        Span(page=3, start=1281, end=1285),
+        NULL_SPAN,
+    ],
+)
+def test_token_for(
+    etl_output: EtlOutput, compact_etl_output: EtlOutput, span: Span
+) -> None:
+    assert compact_etl_output.token_for(span) == etl_output.token_for(span)
+
+
+def test_token_not_found(compact_etl_output: EtlOutput) -> None:
+    assert compact_etl_output.token_for(Span(page=1, start=0, end=1)) == NULL_TOKEN
+
+
+def test_slice(compact_etl_output: EtlOutput) -> None:
+    tokens = compact_etl_output.tokens_on_page[1]
+    view = tokens[10:20]
+
+    assert isinstance(view, TokenColumns)
+    assert list(view) == list(tokens)[10:20]
+    assert not tokens[20:10]
+
+    with pytest.raises(ValueError):
+        tokens[::2]
+
+    with pytest.raises(IndexError):
+        tokens[len(tokens)]
+
+
+def test_pickle(compact_etl_output: EtlOutput) -> None:
+    tokens = compact_etl_output.tokens
+    page_tokens = compact_etl_output.tokens_on_page[1]
+    unpickled_tokens = pickle.loads(pickle.dumps(page_tokens))
+
+    assert isinstance(tokens, TokenColumns)
+    assert isinstance(unpickled_tokens, TokenColumns)
+    assert unpickled_tokens == page_tokens
+    assert len(unpickled_tokens.text) < len(tokens.text)
+
+
+def test_lazy(compact_etl_output: EtlOutput) -> None:
+    lazy_etl_output = etloutput.load(
+        etl_output_file, reader=read_uri, lazy=True, compact_tokens=True
+    )
+
+    assert isinstance(lazy_etl_output.tokens_on_page[1], TokenColumns)
+    assert lazy_etl_output.tokens == compact_etl_output.tokens
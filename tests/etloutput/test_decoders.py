@@ -0,0 +1,103 @@
+import json
+import re
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit.etloutput import Box, Span, Table, Token, TokenColumns
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+tables_file = data_folder / "4725" / "111924" / "110239" / "tables_0.json"
+
+
+@pytest.fixture
+def token() -> "dict[str, object]":
+    return {
+        "page_num": 1,
+        "text": "COST",
+        "position": {"top": 10, "left": 20, "right": 30, "bottom": 40},
+        "doc_offset": {"start": 1281, "end": 1285},
+    }
+
+
+def test_token_from_dict(token: "dict[str, object]") -> None:
+    assert Token.from_dict(token) == Token(
+        "COST", Box(1, 10, 20, 30, 40), Span(1, 1281, 1285)
+    )
+    assert tuple(TokenColumns.from_dicts([token])) == (Token.from_dict(token),)
+
+
+def test_bool_fields(token: "dict[str, object]") -> None:
+    token["page_num"] = True
+
+    assert Token.from_dict(token).span.page is True
+
+
+def test_token_not_mutated(token: "dict[str, object]") -> None:
+    token["page_num"] = True  # Decoded with `get()` rather than the fast path.
+    snapshot = deepcopy(token)
+    Token.from_dict(token)
+
+    assert token == snapshot
+
+
+def test_tables_not_mutated() -> None:
+    tables = json.loads(tables_file.read_text())
+    snapshot = deepcopy(tables)
+    decoded = [Table.from_dict(table) for table in tables]
+
+    assert tables == snapshot
+    assert all(
+        span.page == table_dict["page_num"]
+        for table, table_dict in zip(decoded, tables)
+        for cell in table.cells
+        for span in cell.spans
+    )
+
+
+def test_page_override() -> None:
+    position = {"page_num": 1, "top": 10, "left": 20, "right": 30, "bottom": 40}
+    doc_offset = {"start": 1281, "end": 1285}
+
+    assert Box.from_dict(position, 2) == Box(2, 10, 20, 30, 40)
+    assert Box.from_dict(position) == Box(1, 10, 20, 30, 40)
+    assert Span.from_dict(doc_offset, 2) == Span(2, 1281, 1285)
+    assert "page_num" not in doc_offset
+
+    with pytest.raises(KeyError, match="'page_num' not in"):
+        Span.from_dict(doc_offset)
+
+
+@pytest.mark.parametrize(
+    "path, value, error, message",
+    [
+        (("text",), None, KeyError, "'text' not in"),
+        (("page_num",), "1", TypeError, "value `'1'` doesn't have type <class 'int'>"),
+        (("position", "top"), 1.5, TypeError, "value `1.5` doesn't have type"),
+        (("doc_offset",), [1281, 1285], TypeError, "doesn't have type <class 'dict'>"),
+        (("doc_offset", "end"), None, KeyError, "'end' not in"),
+    ],
+)
+def test_malformed_errors(
+    token: "dict[str, object]",
+    path: "tuple[str, ...]",
+    value: object,
+    error: "type[Exception]",
+    message: str,
+) -> None:
+    parent: "dict[str, object]" = token
+
+    for key in path[:-1]:
+        parent = parent[key]  # type: ignore[assignment]
+
+    if value is None:
+        del parent[path[-1]]
+    else:
+        parent[path[-1]] = value
+
+    with pytest.raises(error, match=re.escape(message)):
+        Token.from_dict(token)
+
+    with pytest.raises(error, match=re.escape(message)):
+        TokenColumns.from_dicts([token])
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -84,3 +86,108 @@ async def test_file_load_disable_values_async(etl_output_file: Path) -> None:
     assert char_count == 0
     assert token_count == 0
     assert table_count == 0
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+async def test_file_load_async_concurrent(etl_output_file: Path) -> None:
+    etl_output = await etloutput.load_async(etl_output_file, reader=read_uri_async)
+    concurrent_etl_output = await etloutput.load_async(
+        etl_output_file, reader=read_uri_async, max_concurrency=4
+    )
+
+    assert concurrent_etl_output == etl_output
+
+
+async def test_file_load_async_max_concurrency() -> None:
+    etl_output_file = next(data_folder.rglob("etl_output.json"))
+    reading = 0
+    max_reading = 0
+
+    async def read_uri_counting(uri: str | Path) -> str:
+        nonlocal reading, max_reading
+        reading += 1
+        max_reading = max(max_reading, reading)
+        await asyncio.sleep(0)
+        reading -= 1
+        return read_uri(uri)
+
+    await etloutput.load_async(
+        etl_output_file, reader=read_uri_counting, max_concurrency=2
+    )
+
+    assert max_reading == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_file_load_async_invalid_max_concurrency(max_concurrency: int) -> None:
+    etl_output_file = next(data_folder.rglob("etl_output.json"))
+
+    with pytest.raises(ValueError):
+        await etloutput.load_async(
+            etl_output_file, reader=read_uri_async, max_concurrency=max_concurrency
+        )
+
+
+@pytest.mark.parametrize("etl_output_file", list(data_folder.rglob("etl_output.json")))
+def test_file_load_threaded(etl_output_file: Path) -> None:
+    etl_output = etloutput.load(etl_output_file, reader=read_uri)
+    threaded_etl_output = etloutput.load(
+        etl_output_file, reader=read_uri, max_workers=4
+    )
+
+    with ThreadPoolExecutor(4) as executor:
+        executor_etl_output = etloutput.load(
+            etl_output_file, reader=read_uri, executor=executor
+        )
+
+    assert threaded_etl_output == etl_output
+    assert executor_etl_output == etl_output
+
+
+def test_file_load_process_pool_executor() -> None:
+    etl_output_file = next(data_folder.rglob("etl_output.json"))
+    etl_output = etloutput.load(etl_output_file, reader=read_uri)
+
+    with ProcessPoolExecutor(2) as executor:
+        pooled_etl_output = etloutput.load(
+            etl_output_file, reader=read_uri, executor=executor
+        )
+
+    assert pooled_etl_output == etl_output
+
+
+@pytest.mark.parametrize("compact_tokens", [False, True])
+def test_file_load_process_pool(compact_tokens: bool) -> None:
+    etl_output_files = list(data_folder.rglob("etl_output.json"))
+
+    with ProcessPoolExecutor(2) as executor:
+        for etl_output_file in etl_output_files:
+            etl_output = etloutput.load(
+                etl_output_file, reader=read_uri, compact_tokens=compact_tokens
+            )
+            pooled_etl_output = etloutput.load(
+                etl_output_file,
+                reader=read_uri,
+                decode_executor=executor,
+                compact_tokens=compact_tokens,
+            )
+
+            assert pooled_etl_output == etl_output
+
+
+def test_file_load_lazy_decode_executor() -> None:
+    etl_output_file = next(data_folder.rglob("etl_output.json"))
+
+    with ThreadPoolExecutor(4) as executor, pytest.raises(ValueError):
+        etloutput.load(
+            etl_output_file, reader=read_uri, lazy=True, decode_executor=executor
+        )
+
+
+def test_file_load_executor_and_max_workers() -> None:
+    etl_output_file = next(data_folder.rglob("etl_output.json"))
+
+    with ThreadPoolExecutor(4) as executor, pytest.raises(ValueError):
+        etloutput.load(
+            etl_output_file, reader=read_uri, executor=executor, max_workers=4
+        )
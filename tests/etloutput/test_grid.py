@@ -0,0 +1,115 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import NULL_BOX, Box, EtlOutput, Token
+from indico_toolkit.etloutput.grid import BoxGrid
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_file = data_folder / "4725" / "111924" / "110239" / "etl_output.json"
+
+
+def read_uri(uri: str | Path) -> bytes:
+    uri = str(uri)
+    storage_folder_path = uri.split("/storage/submission/")[-1]
+    file_path = data_folder / storage_folder_path
+    return file_path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_file, reader=read_uri)
+
+
+@pytest.fixture(scope="module")
+def boxes(etl_output: EtlOutput) -> list[Box]:
+    rng = random.Random(0)
+    boxes = [NULL_BOX, Box(page=5, top=0, left=0, right=100, bottom=100)]
+
+    for page, page_tokens in enumerate(etl_output.tokens_on_page):
+        right = max(token.box.right for token in page_tokens)
+        bottom = max(token.box.bottom for token in page_tokens)
+
+        for _ in range(50):
+            top = rng.randint(-100, bottom + 100)
+            left = rng.randint(-100, right + 100)
+            height = rng.randint(0, bottom // 4)
+            width = rng.randint(0, right // 4)
+            boxes.append(Box(page, top, left, left + width, top + height))
+
+        boxes.extend(token.box for token in page_tokens[::20])
+
+    return boxes
+
+
+def distance(token: Token, box: Box) -> float:
+    return BoxGrid.from_boxes([token.box]).distance(0, box)
+
+
+@pytest.mark.parametrize(
+    "lazy, compact_tokens", [(False, False), (False, True), (True, False)]
+)
+def test_tokens_in_box(
+    etl_output: EtlOutput, boxes: list[Box], lazy: bool, compact_tokens: bool
+) -> None:
+    loaded = etloutput.load(
+        etl_output_file, reader=read_uri, lazy=lazy, compact_tokens=compact_tokens
+    )
+
+    for box in boxes:
+        overlapping = [token for token in etl_output.tokens if token.box & box]
+        contained = [
+            token
+            for token in etl_output.tokens
+            if token.box.page == box.page
+            and box.top <= token.box.top
+            and box.left <= token.box.left
+            and token.box.right <= box.right
+            and token.box.bottom <= box.bottom
+        ]
+
+        assert loaded.tokens_in_box(box) == overlapping
+        assert loaded.tokens_in_box(box, overlap=False) == contained
+
+
+def test_cells_in_box(etl_output: EtlOutput, boxes: list[Box]) -> None:
+    table_cells = [(table, cell) for table in etl_output.tables for cell in table.cells]
+
+    for box in boxes:
+        overlapping = [(table, cell) for table, cell in table_cells if cell.box & box]
+
+        assert etl_output.cells_in_box(box) == overlapping
+
+    table = etl_output.tables[-1]
+
+    assert etl_output.cells_in_box(table.box, overlap=False) == [
+        (table, cell) for cell in table.cells
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 5, 40])
+def test_nearest_tokens(etl_output: EtlOutput, boxes: list[Box], count: int) -> None:
+    for box in boxes:
+        page_tokens = (
+            etl_output.tokens_on_page[box.page]
+            if 0 <= box.page < len(etl_output.tokens_on_page)
+            else ()
+        )
+        ordered = sorted(
+            range(len(page_tokens)),
+            key=lambda index: (distance(page_tokens[index], box), index),
+        )
+
+        assert etl_output.nearest_tokens(box, count) == [
+            page_tokens[index] for index in ordered[:count]
+        ]
+
+
+def test_empty_grid() -> None:
+    grid = BoxGrid([], [], [], [])
+    box = Box(page=0, top=0, left=0, right=10, bottom=10)
+
+    assert grid.overlapping(box) == []
+    assert grid.nearest(box, 3) == []
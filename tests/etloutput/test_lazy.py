@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import EtlOutput, LazyEtlOutput, Span
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_file = data_folder / "4725" / "111924" / "110239" / "etl_output.json"
+
+
+def read_uri(uri: str | Path) -> bytes:
+    uri = str(uri)
+    storage_folder_path = uri.split("/storage/submission/")[-1]
+    file_path = data_folder / storage_folder_path
+    return file_path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_file, reader=read_uri)
+
+
+@pytest.fixture
+def read_uris() -> "list[str]":
+    return []
+
+
+@pytest.fixture
+def lazy_etl_output(read_uris: "list[str]") -> LazyEtlOutput:
+    def read_uri_tracked(uri: str | Path) -> bytes:
+        read_uris.append(str(uri))
+        return read_uri(uri)
+
+    lazy_etl_output = etloutput.load(
+        etl_output_file, reader=read_uri_tracked, lazy=True
+    )
+    assert isinstance(lazy_etl_output, LazyEtlOutput)
+    return lazy_etl_output
+
+
+def test_nothing_read(lazy_etl_output: LazyEtlOutput, read_uris: "list[str]") -> None:
+    assert len(lazy_etl_output.text_on_page) == 2
+    assert len(lazy_etl_output.tokens_on_page) == 2
+    assert len(lazy_etl_output.tables_on_page) == 2
+    assert read_uris == [str(etl_output_file)]
+
+
+def test_equivalent(etl_output: EtlOutput, lazy_etl_output: LazyEtlOutput) -> None:
+    assert lazy_etl_output.text == etl_output.text
+    assert lazy_etl_output.text_on_page == etl_output.text_on_page
+    assert lazy_etl_output.tokens == etl_output.tokens
+    assert lazy_etl_output.tokens_on_page == etl_output.tokens_on_page
+    assert lazy_etl_output.tables == etl_output.tables
+    assert lazy_etl_output.tables_on_page == etl_output.tables_on_page
+
+
+def test_token_for(
+    etl_output: EtlOutput, lazy_etl_output: LazyEtlOutput, read_uris: "list[str]"
+) -> None:
+    span = Span(page=1, start=1281, end=1285)
+
+    assert lazy_etl_output.token_for(span) == etl_output.token_for(span)
+    assert lazy_etl_output.text_on_page.loaded == (1,)
+    assert lazy_etl_output.tokens_on_page.loaded == (1,)
+    assert lazy_etl_output.tables_on_page.loaded == ()
+    assert not any("page_0" in uri for uri in read_uris)
+
+
+def test_token_for_across_pages(
+    etl_output: EtlOutput, lazy_etl_output: LazyEtlOutput
+) -> None:
+    next_page_start = etl_output.page_starts[1]
+    span = Span(page=0, start=next_page_start - 5, end=next_page_start + 5)
+
+    assert lazy_etl_output.token_for(span) == etl_output.token_for(span)
+    assert lazy_etl_output.token_for(span).text == etl_output.text[span.slice]
+
+
+def test_table_cells_for(
+    etl_output: EtlOutput, lazy_etl_output: LazyEtlOutput, read_uris: "list[str]"
+) -> None:
+    span = Span(page=1, start=1311, end=1344)
+
+    assert list(lazy_etl_output.table_cells_for(span)) == list(
+        etl_output.table_cells_for(span)
+    )
+    assert lazy_etl_output.tables_on_page.loaded == (1,)
+    assert not any("tables_0" in uri for uri in read_uris)
+
+
+def test_page_out_of_range(lazy_etl_output: LazyEtlOutput) -> None:
+    with pytest.raises(IndexError):
+        lazy_etl_output.tokens_on_page[2]
+
+    assert not lazy_etl_output.token_for(Span(page=2, start=0, end=1))
+    assert not tuple(lazy_etl_output.table_cells_for(Span(page=2, start=0, end=1)))
+
+
+def test_lazy_executor() -> None:
+    with pytest.raises(ValueError):
+        etloutput.load(etl_output_file, reader=read_uri, lazy=True, max_workers=4)
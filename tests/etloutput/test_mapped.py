@@ -0,0 +1,118 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import (
+    EtlOutput,
+    EtlOutputCache,
+    MappedEtlOutput,
+    MappedText,
+    Span,
+)
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_uri = str(data_folder / "4725" / "111924" / "110239" / "etl_output.json")
+
+
+def read_uri(uri: str | Path) -> bytes:
+    storage_folder_path = str(uri).split("/storage/submission/")[-1]
+    return (data_folder / storage_folder_path).read_bytes()
+
+
+async def read_uri_async(uri: str | Path) -> bytes:
+    return read_uri(uri)
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_uri, reader=read_uri)
+
+
+@pytest.fixture
+def mapped(etl_output: EtlOutput, tmp_path: Path) -> MappedEtlOutput:
+    path = tmp_path / "etl_output.etl"
+    path.write_bytes(etl_output.to_bytes())
+    return MappedEtlOutput.open(path)
+
+
+def test_fields(mapped: MappedEtlOutput, etl_output: EtlOutput) -> None:
+    assert mapped.text == etl_output.text
+    assert tuple(mapped.text_on_page) == tuple(etl_output.text_on_page)
+    assert tuple(mapped.tokens) == tuple(etl_output.tokens)
+    assert tuple(map(tuple, mapped.tokens_on_page)) == tuple(
+        map(tuple, etl_output.tokens_on_page)
+    )
+    assert mapped.tables == etl_output.tables
+    assert tuple(mapped.tables_on_page) == tuple(etl_output.tables_on_page)
+
+
+def test_tokens(mapped: MappedEtlOutput, etl_output: EtlOutput) -> None:
+    span = Span(1, 1281, 1285)
+    spans = [Span(0, 0, 20), span, Span(1, 1281, 1300)]
+
+    assert mapped.token_for(span) == etl_output.token_for(span)
+    assert mapped.tokens_for(spans) == etl_output.tokens_for(spans)
+
+
+def test_lazy(mapped: MappedEtlOutput) -> None:
+    assert "text" not in vars(mapped)
+    assert not mapped.tables_on_page.loaded
+
+    mapped.tables_on_page[1]
+
+    assert mapped.tables_on_page.loaded == (1,)
+    assert "text" not in vars(mapped)
+
+
+def test_text_view(mapped: MappedEtlOutput, etl_output: EtlOutput) -> None:
+    text_view = mapped.text_view
+
+    assert isinstance(text_view, MappedText)
+    assert len(text_view) == len(etl_output.text)
+    assert text_view[10:50] == etl_output.text[10:50]
+    assert text_view[-20:] == etl_output.text[-20:]
+    assert text_view[5] == etl_output.text[5]
+    assert text_view[-1] == etl_output.text[-1]
+    assert text_view[::7] == etl_output.text[::7]
+
+    with pytest.raises(IndexError):
+        text_view[len(text_view)]
+
+
+@pytest.mark.parametrize("text", ["abc\xe9", "ab中文", "ab\U0001f600c\ud800"])
+def test_text_widths(text: str) -> None:
+    etl_output = EtlOutput(text, (text,), (), ((),), (), ((),))
+    mapped = MappedEtlOutput.from_buffer(etl_output.to_bytes())
+
+    assert mapped.text_view == text
+    assert mapped.text_view[1:-1] == text[1:-1]
+    assert mapped.text_on_page[0] == text
+    assert mapped.text == text
+
+
+def test_load_mmap(tmp_path: Path, etl_output: EtlOutput) -> None:
+    cache = EtlOutputCache(tmp_path)
+    loaded = etloutput.load(etl_output_uri, reader=read_uri, cache=cache, mmap=True)
+    cached = etloutput.load(etl_output_uri, reader=read_uri, cache=cache, mmap=True)
+
+    assert isinstance(loaded, MappedEtlOutput)
+    assert isinstance(cached, MappedEtlOutput)
+    assert cached.text == etl_output.text
+
+
+def test_load_async_mmap(tmp_path: Path) -> None:
+    cache = EtlOutputCache(tmp_path)
+    loaded = asyncio.run(
+        etloutput.load_async(
+            etl_output_uri, reader=read_uri_async, cache=cache, mmap=True
+        )
+    )
+
+    assert isinstance(loaded, MappedEtlOutput)
+
+
+def test_mmap_requires_cache() -> None:
+    with pytest.raises(ValueError):
+        etloutput.load(etl_output_uri, reader=read_uri, mmap=True)
@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import EtlOutput, LazyEtlOutput, MappedEtlOutput
+from indico_toolkit.etloutput.pages import TextPages
+
+data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+etl_output_file = data_folder / "4725" / "111924" / "110239" / "etl_output.json"
+
+
+def read_uri(uri: str | Path) -> bytes:
+    uri = str(uri)
+    storage_folder_path = uri.split("/storage/submission/")[-1]
+    file_path = data_folder / storage_folder_path
+    return file_path.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def etl_output() -> EtlOutput:
+    return etloutput.load(etl_output_file, reader=read_uri)
+
+
+@pytest.fixture(params=["eager", "lazy", "bytes", "mapped"])
+def any_etl_output(request: pytest.FixtureRequest, etl_output: EtlOutput) -> EtlOutput:
+    if request.param == "lazy":
+        return etloutput.load(etl_output_file, reader=read_uri, lazy=True)
+    elif request.param == "bytes":
+        return EtlOutput.from_bytes(etl_output.to_bytes())
+    elif request.param == "mapped":
+        return MappedEtlOutput.from_buffer(etl_output.to_bytes())
+    else:
+        return etl_output
+
+
+def test_text_on_page_not_stored(etl_output: EtlOutput) -> None:
+    assert isinstance(etl_output.text_on_page, TextPages)
+    assert etl_output.text_on_page.text is etl_output.text
+    assert "\n".join(etl_output.text_on_page) == etl_output.text
+
+
+@pytest.mark.parametrize("compact_tokens", [False, True])
+def test_hashable(any_etl_output: EtlOutput, compact_tokens: bool) -> None:
+    etl_output = etloutput.load(
+        etl_output_file, reader=read_uri, compact_tokens=compact_tokens
+    )
+
+    assert hash(any_etl_output) == hash(etl_output)
+    assert any_etl_output in {any_etl_output}
+
+
+def test_page_starts(any_etl_output: EtlOutput) -> None:
+    for page, page_start in enumerate(any_etl_output.page_starts):
+        page_text = any_etl_output.text_on_page[page]
+        assert any_etl_output.text[page_start : page_start + len(page_text)] == (
+            page_text
+        )
+
+
+def test_page_for_offset(any_etl_output: EtlOutput) -> None:
+    first_page, second_page = any_etl_output.text_on_page
+    second_start = len(first_page) + 1
+
+    assert any_etl_output.page_for_offset(0) == 0
+    assert any_etl_output.page_for_offset(second_start - 1) == 0
+    assert any_etl_output.page_for_offset(second_start) == 1
+    assert any_etl_output.page_for_offset(second_start + len(second_page) - 1) == 1
+
+    with pytest.raises(IndexError):
+        any_etl_output.page_for_offset(-1)
+
+    with pytest.raises(IndexError):
+        any_etl_output.page_for_offset(second_start + len(second_page))
+
+
+def test_page_text_view(any_etl_output: EtlOutput) -> None:
+    page_text = any_etl_output.text_on_page[1]
+    view = any_etl_output.page_text_view(1)
+
+    assert len(view) == len(page_text)
+    assert view == page_text
+    assert view[10:40] == page_text[10:40]
+    assert view[-5:] == page_text[-5:]
+    assert view[3] == page_text[3]
+    assert view[::3] == page_text[::3]
+
+    with pytest.raises(IndexError):
+        view[len(page_text)]
+
+    with pytest.raises(IndexError):
+        any_etl_output.page_text_view(2)
+
+
+def test_lazy_page_text_view() -> None:
+    lazy_etl_output = etloutput.load(etl_output_file, reader=read_uri, lazy=True)
+    assert isinstance(lazy_etl_output, LazyEtlOutput)
+
+    lazy_etl_output.page_for_offset(0)
+    lazy_etl_output.page_text_view(0)
+
+    assert lazy_etl_output.text_on_page.loaded == (0, 1)
+    assert "text" not in vars(lazy_etl_output)
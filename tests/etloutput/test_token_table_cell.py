@@ -1,5 +1,6 @@
 from dataclasses import replace
 from pathlib import Path
+from random import Random
 
 import pytest
 
@@ -137,3 +138,97 @@ def test_empty_cell(etl_output: EtlOutput) -> None:
     assert filled_cell.span
     assert not empty_cell.span
     assert empty_cell.span == NULL_SPAN
+
+
+@pytest.fixture(scope="module")
+def many_spans(etl_output: EtlOutput) -> list[Span]:
+    token_spans = [token.span for token in etl_output.tokens]
+    phrase_spans = [
+        replace(first, end=last.end)
+        for first, last in zip(token_spans[::3], token_spans[2::3])
+        if first.page == last.page
+    ]
+    return [
+        *reversed(token_spans),
+        *phrase_spans,
+        Span(page=1, start=1217, end=1299),
+        Span(page=1, start=1056, end=1067),
+        Span(page=3, start=1281, end=1285),
+        Span(page=-1, start=-1, end=-1),
+        NULL_SPAN,
+    ]
+
+
+@pytest.mark.parametrize(
+    "lazy, compact_tokens", [(False, False), (False, True), (True, False)]
+)
+def test_tokens_for(
+    etl_output: EtlOutput, many_spans: list[Span], lazy: bool, compact_tokens: bool
+) -> None:
+    loaded = etloutput.load(
+        etl_output_file, reader=read_uri, lazy=lazy, compact_tokens=compact_tokens
+    )
+    assert loaded.tokens_for(many_spans) == list(map(etl_output.token_for, many_spans))
+
+
+@pytest.mark.parametrize("compact_tokens", [False, True])
+def test_tokens_for_derives_pages_used(
+    content_span: Span, compact_tokens: bool
+) -> None:
+    loaded = etloutput.load(
+        etl_output_file, reader=read_uri, compact_tokens=compact_tokens
+    )
+    loaded.tokens_for([content_span])
+
+    # Only the page of the span has its tokens converted to columns, if they aren't
+    # columns already.
+    assert loaded._token_columns_on_page.loaded == (1,)  # type: ignore[attr-defined]
+
+    if compact_tokens:
+        assert loaded._token_columns_on_page[1] is loaded.tokens_on_page[1]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_table_cells_for_many(
+    etl_output: EtlOutput, many_spans: list[Span], lazy: bool
+) -> None:
+    loaded = etloutput.load(etl_output_file, reader=read_uri, lazy=lazy)
+    assert loaded.table_cells_for_many(many_spans) == [
+        list(etl_output.table_cells_for(span)) for span in many_spans
+    ]
+
+
+def test_no_tokens_tables_for_many(
+    etl_output_no_tokens_tables: EtlOutput, header_span: Span
+) -> None:
+    spans = [header_span, NULL_SPAN]
+    assert etl_output_no_tokens_tables.tokens_for(spans) == [NULL_TOKEN, NULL_TOKEN]
+    assert etl_output_no_tokens_tables.table_cells_for_many(spans) == [[], []]
+
+
+def test_tokens_for_overlapping_tokens() -> None:
+    # Overlapping tokens leave token ends out of order.
+    random = Random(0)
+    text = "x" * 200
+    token_dicts = []
+
+    for _ in range(60):
+        start = random.randrange(190)
+        end = start + random.randint(1, 40)
+        token_dicts.append(
+            {
+                "page_num": 0,
+                "doc_offset": {"start": start, "end": end},
+                "position": {"top": 0, "left": start, "right": end, "bottom": 10},
+                "text": text[start:end],
+            }
+        )
+
+    etl_output = EtlOutput.from_pages([text], [token_dicts], [[]])
+    spans = []
+
+    for _ in range(300):
+        start = random.randrange(200)
+        spans.append(Span(page=0, start=start, end=start + random.randint(1, 10)))
+
+    assert etl_output.tokens_for(spans) == list(map(etl_output.token_for, spans))
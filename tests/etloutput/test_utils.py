@@ -1,6 +1,10 @@
+import json
+import sys
+from collections.abc import Iterator
+
 import pytest
 
-from indico_toolkit.etloutput.utils import get, has
+from indico_toolkit.etloutput.utils import get, has, json_loaded, set_json_backend
 
 
 @pytest.fixture
@@ -52,3 +56,46 @@ def test_get_has_not(cell: object) -> None:
     assert not has(cell, int, "doc_offsets", -1, "start")
     with pytest.raises(IndexError):
         get(cell, int, "doc_offsets", 1, "start")
+
+
+@pytest.fixture
+def json_backend() -> "Iterator[None]":
+    yield
+    set_json_backend()
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_json_backends(json_backend: None, backend: str) -> None:
+    pytest.importorskip(backend)
+    set_json_backend(backend)
+
+    assert json_loaded('{"text": "Item", "rows": [0]}') == {"text": "Item", "rows": [0]}
+    assert json_loaded(b'{"text": "It\\u00e9m"}') == {"text": "Itém"}
+    assert json_loaded({"text": "Item"}) == {"text": "Item"}
+
+    with pytest.raises(json.JSONDecodeError, match="Expecting property name"):
+        json_loaded("{")
+
+
+def test_json_backend_fallback(json_backend: None) -> None:
+    def rejecting_loads(value: "str | bytes") -> object:
+        raise ValueError("unsupported")
+
+    set_json_backend(rejecting_loads)
+
+    assert json_loaded('{"text": "\\ud800", "nan": NaN}')["text"] == "\ud800"
+
+    with pytest.raises(json.JSONDecodeError):
+        json_loaded("{")
+
+
+def test_json_backend_unsupported() -> None:
+    with pytest.raises(ValueError, match="unsupported JSON backend"):
+        set_json_backend("yaml")
+
+
+def test_json_backend_not_installed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "ujson", None)
+
+    with pytest.raises(ImportError, match="pip install ujson"):
+        set_json_backend("ujson")
@@ -0,0 +1,443 @@
+import asyncio
+import json
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from indico import IndicoConfig
+from indico.queries import GetSubmission, JobStatus, RetrieveStorageObject, SubmitReview
+
+from indico_toolkit import etloutput, results
+from indico_toolkit.polling import AutoReviewed, AutoReviewPoller
+from indico_toolkit.polling.autoreview import _auto_review_from_bytes, _to_bytes
+from indico_toolkit.polling.queries import SubmissionIdsPendingAutoReview
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from indico_toolkit.etloutput import EtlOutput
+    from indico_toolkit.results import Document, Result
+
+data_folder = Path(__file__).parent.parent / "data"
+result_file = data_folder / "results" / "classify_extract_accepted.json"
+# The etl outputs of the result file's documents aren't in the test data.
+etl_output_folders = {
+    "5120/97717/95508": "4723/111922/110237",
+    "5120/97717/95510": "4724/111923/110238",
+    "5120/97717/95511": "4725/111924/110239",
+}
+
+
+class FakeClient:
+    """
+    Answers the queries of an auto review poller for the submissions in `pending`,
+    each of which has a copy of the same result file. Submissions in `failing` fail
+    to be retrieved. Each query takes `delay` seconds, and the most of each kind in
+    progress at once are recorded.
+    """
+
+    def __init__(self, pending: "set[int]", failing: "set[int]" = set()):
+        self.pending = pending
+        self.failing = failing
+        self.delay = 0.0
+        self.in_progress: "Counter[str]" = Counter()
+        self.most_in_progress: "Counter[str]" = Counter()
+        self.submitted: "dict[int, dict[str, Any]]" = {}
+
+    async def __aenter__(self) -> "FakeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    async def call(self, request: "Any") -> "Any":
+        if isinstance(request, SubmissionIdsPendingAutoReview):
+            return request.process_response(
+                {
+                    "data": {
+                        "submissions": {
+                            "submissions": [{"id": id} for id in self.pending],
+                            "pageInfo": {"endCursor": None, "hasNextPage": False},
+                        }
+                    }
+                }
+            )
+
+        kind = type(request).__name__
+        self.in_progress[kind] += 1
+        self.most_in_progress[kind] = max(
+            self.most_in_progress[kind], self.in_progress[kind]
+        )
+
+        try:
+            await asyncio.sleep(self.delay)
+            return self.respond(request)
+        finally:
+            self.in_progress[kind] -= 1
+
+    def respond(self, request: "Any") -> "Any":
+        if isinstance(request, GetSubmission):
+            submission_id = request.variables["submissionId"]  # type: ignore[index]
+
+            if submission_id in self.failing:
+                raise RuntimeError(f"failed to retrieve {submission_id=}")
+
+            return SimpleNamespace(
+                id=submission_id,
+                result_file=(
+                    f"indico-file:///storage/submission/{submission_id}/result.json"
+                ),
+            )
+
+        if isinstance(request, RetrieveStorageObject):
+            path = request.path.split("/storage/submission/")[-1]
+
+            if path.endswith("/result.json"):
+                result = json.loads(result_file.read_text())
+                result["submission_id"] = int(path.split("/")[0])
+                return json.dumps(result).encode()
+
+            folder, file = path.rsplit("/", 1)
+            folder = etl_output_folders.get(folder, folder)
+            return (data_folder / "etloutput" / folder / file).read_bytes()
+
+        if isinstance(request, SubmitReview):
+            submission_id = request.variables["submissionId"]  # type: ignore[index]
+            self.submitted[submission_id] = request.variables  # type: ignore[assignment]
+            self.pending.discard(submission_id)
+            return SimpleNamespace(id=submission_id)
+
+        if isinstance(request, JobStatus):
+            return SimpleNamespace(status="SUCCESS", result=None)
+
+        raise NotImplementedError(type(request))
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
+    client = FakeClient(set())
+    monkeypatch.setattr(
+        "indico_toolkit.polling.autoreview.AsyncIndicoClient", lambda config: client
+    )
+    return client
+
+
+def poller(auto_review: "Any", **kwargs: "Any") -> AutoReviewPoller:
+    """
+    Create a poller that spawns workers immediately, doesn't retry, and polls once
+    unless a test runs for a minute.
+    """
+    kwargs = {
+        "spawn_rate": 1000,
+        "spawn_burst": 1000,
+        "poll_delay": 60,
+        "min_poll_delay": 60,
+        "retry_count": 0,
+        "load_etl_output": False,
+        **kwargs,
+    }
+    return AutoReviewPoller(
+        IndicoConfig(host="indico.local", api_token="token"),
+        1,
+        auto_review,
+        **kwargs,
+    )
+
+
+async def poll_until(
+    poller: AutoReviewPoller, done: "Callable[[], bool]", timeout: float = 10
+) -> None:
+    """
+    Run `poller` until `done()`, failing the test after `timeout` seconds.
+    """
+    task = asyncio.create_task(poller.poll_forever())
+
+    try:
+        await asyncio.wait_for(_wait_for(done), timeout)
+    finally:
+        task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def _wait_for(done: "Callable[[], bool]") -> None:
+    while not done():
+        await asyncio.sleep(0.01)
+
+
+async def accept(
+    result: "Result", etl_outputs: "dict[Document, EtlOutput]"
+) -> AutoReviewed:
+    return AutoReviewed(changes=[{"submission": result.submission_id}])
+
+
+async def test_pipeline(client: FakeClient) -> None:
+    client.pending = set(range(1, 7))
+    auto_review_poller = poller(accept, pipeline=True)
+
+    await poll_until(
+        auto_review_poller,
+        lambda: len(client.submitted) == 6
+        and not auto_review_poller._processing_submission_ids,
+    )
+
+    assert client.pending == set()
+    assert all(
+        variables["changes"] == json.dumps([{"submission": submission_id}])
+        for submission_id, variables in client.submitted.items()
+    )
+
+
+async def test_pipeline_stage_failure(
+    client: FakeClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    client.pending = {1, 2, 3}
+    client.failing = {3}
+
+    async def auto_review(
+        result: "Result", etl_outputs: "dict[Document, EtlOutput]"
+    ) -> AutoReviewed:
+        if result.submission_id == 2:
+            raise ValueError("failed to review submission 2")
+
+        return await accept(result, etl_outputs)
+
+    auto_review_poller = poller(auto_review, pipeline=True)
+
+    await poll_until(
+        auto_review_poller,
+        lambda: 1 in client.submitted
+        and not auto_review_poller._processing_submission_ids,
+    )
+
+    # Failed submissions are no longer processing and are retried by the next poll.
+    assert set(client.submitted) == {1}
+    assert client.pending == {2, 3}
+    assert "Error occurred while processing submission_id=2" in caplog.text
+    assert "Error occurred while processing submission_id=3" in caplog.text
+
+
+async def test_run_stage_backpressure() -> None:
+    auto_review_poller = poller(accept)
+    inbox: "asyncio.Queue[tuple[int, Any]]" = asyncio.Queue()
+    outbox: "asyncio.Queue[tuple[int, Any]]" = asyncio.Queue(1)
+    processed = []
+
+    for submission_id in (1, 2, 3):
+        inbox.put_nowait((submission_id, None))
+
+    async def stage(submission_id: int, value: "Any") -> "Any":
+        processed.append(submission_id)
+        return value
+
+    task = asyncio.create_task(auto_review_poller._run_stage(inbox, stage, outbox))
+
+    try:
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # The stage waits with its second output while the outbox is full.
+        assert processed == [1, 2]
+        assert inbox.qsize() == 1
+
+        assert outbox.get_nowait() == (1, None)
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert processed == [1, 2, 3]
+        assert outbox.get_nowait() == (2, None)
+    finally:
+        task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def test_pipeline_ignores_worker_count(client: FakeClient) -> None:
+    client.pending = set(range(1, 7))
+    client.delay = 0.05
+    auto_review_poller = poller(
+        accept, pipeline=True, worker_count=1, fetch_worker_count=3
+    )
+
+    await poll_until(auto_review_poller, lambda: len(client.submitted) == 6)
+
+    assert client.most_in_progress["GetSubmission"] == 3
+
+
+async def test_review_thread_pool_executor(client: FakeClient) -> None:
+    client.pending = {1}
+    reviewed: "list[tuple[Result, dict[Document, EtlOutput]]]" = []
+    threads = set()
+
+    def auto_review(
+        result: "Result", etl_outputs: "dict[Document, EtlOutput]"
+    ) -> AutoReviewed:
+        reviewed.append((result, etl_outputs))
+        threads.add(threading.get_ident())
+        return AutoReviewed(changes=[{"submission": result.submission_id}])
+
+    with ThreadPoolExecutor(1) as executor:
+        await poll_until(
+            poller(auto_review, load_etl_output=True, review_executor=executor),
+            lambda: 1 in client.submitted,
+        )
+
+    [(result, etl_outputs)] = reviewed
+    assert threads.isdisjoint({threading.get_ident()})
+    assert list(etl_outputs) == [
+        document for document in result.documents if not document.failed
+    ]
+    assert "Purchase Order" in etl_outputs[result.documents[-1]].text
+
+
+async def test_auto_review_from_bytes(client: FakeClient) -> None:
+    result = await results.load_async(
+        "indico-file:///storage/submission/1/result.json",
+        reader=lambda uri: client.call(RetrieveStorageObject(uri)),
+    )
+    # Skip the first and failed documents so etl outputs don't line up with them.
+    etl_outputs = {
+        document: await etloutput.load_async(
+            document.etl_output_uri,
+            reader=lambda uri: client.call(RetrieveStorageObject(uri)),
+        )
+        for document in result.documents[1:]
+        if not document.failed
+    }
+    assert len(etl_outputs) == 2
+
+    def auto_review(
+        result: "Result", etl_outputs: "dict[Document, EtlOutput]"
+    ) -> AutoReviewed:
+        return AutoReviewed(
+            changes=[
+                {"document": document.id, "text": etl_output.text}
+                for document, etl_output in etl_outputs.items()
+            ]
+        )
+
+    assert _auto_review_from_bytes(
+        auto_review, *_to_bytes(result, etl_outputs)
+    ) == auto_review(result, etl_outputs)
+
+
+async def load_documents(client: FakeClient) -> "list[Document]":
+    result = await results.load_async(
+        "indico-file:///storage/submission/1/result.json",
+        reader=lambda uri: client.call(RetrieveStorageObject(uri)),
+    )
+    return [document for document in result.documents if not document.failed]
+
+
+async def test_load_etl_outputs_in_order(client: FakeClient) -> None:
+    documents = await load_documents(client)
+    auto_review_poller = poller(accept)
+    read = []
+
+    async def call(request: "Any") -> "Any":
+        # The first document's etl output is the slowest to read.
+        if "95508" in request.path:
+            await asyncio.sleep(0.05)
+
+        response = await client.call(request)
+        read.append(request.path)
+        return response
+
+    auto_review_poller._client_call = call
+    etl_outputs = await auto_review_poller._load_etl_outputs(1, documents)
+
+    assert [
+        path.split("/")[-2] for path in read if path.endswith("etl_output.json")
+    ] == ["95510", "95511", "95508"]
+    assert [etl_output.text for etl_output in etl_outputs] == [
+        (
+            await etloutput.load_async(
+                document.etl_output_uri,
+                reader=lambda uri: client.call(RetrieveStorageObject(uri)),
+            )
+        ).text
+        for document in documents
+    ]
+
+
+async def test_load_etl_outputs_failure(client: FakeClient) -> None:
+    documents = await load_documents(client)
+    auto_review_poller = poller(accept)
+    cancelled = []
+
+    async def call(request: "Any") -> "Any":
+        if "95510" in request.path:
+            raise RuntimeError("failed to retrieve etl output")
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request.path.split("/")[-2])
+            raise
+
+        return await client.call(request)
+
+    auto_review_poller._client_call = call
+
+    with pytest.raises(RuntimeError):
+        await auto_review_poller._load_etl_outputs(1, documents)
+
+    await asyncio.sleep(0)
+    assert sorted(cancelled) == ["95508", "95511"]
+
+
+async def test_download_concurrency(client: FakeClient) -> None:
+    documents = await load_documents(client)
+    client.delay = 0.01
+    auto_review_poller = poller(accept, download_concurrency=2)
+    auto_review_poller._client_call = client.call
+
+    # Reads are limited across every submission, not per submission.
+    await asyncio.gather(
+        auto_review_poller._load_etl_outputs(1, documents),
+        auto_review_poller._load_etl_outputs(2, documents),
+    )
+
+    assert client.most_in_progress["RetrieveStorageObject"] == 2
+
+
+@pytest.mark.parametrize(
+    "argument",
+    [
+        "worker_count",
+        "etl_output_concurrency",
+        "download_concurrency",
+        "fetch_worker_count",
+        "fetch_queue_size",
+        "review_worker_count",
+        "review_queue_size",
+        "submit_worker_count",
+        "submit_queue_size",
+    ],
+)
+def test_invalid_concurrency(argument: str) -> None:
+    with pytest.raises(ValueError):
+        poller(accept, **{argument: 0})
+
+
+def test_invalid_auto_review() -> None:
+    def sync_accept(
+        result: "Result", etl_outputs: "dict[Document, EtlOutput]"
+    ) -> AutoReviewed:
+        return AutoReviewed(changes=[])
+
+    with pytest.raises(TypeError, match="coroutine function"):
+        poller(sync_accept)
+
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(TypeError, match="regular function"):
+            poller(accept, review_executor=executor)
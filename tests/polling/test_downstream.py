@@ -0,0 +1,18 @@
+import pytest
+from indico import IndicoConfig
+
+from indico_toolkit.polling import DownstreamPoller
+
+
+async def downstream(submission: object) -> None:
+    pass
+
+
+def test_invalid_worker_count() -> None:
+    with pytest.raises(ValueError):
+        DownstreamPoller(
+            IndicoConfig(host="indico.local", api_token="token"),
+            1,
+            downstream,
+            worker_count=0,
+        )
@@ -0,0 +1,136 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from indico_toolkit.polling.queries import (
+    PendingSubmissionIds,
+    SubmissionIdsPendingAutoReview,
+)
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class FakeServer:
+    """
+    Answers submission ID queries from `pending` a page at a time, ordered by ID.
+    """
+
+    def __init__(self, pending: "set[int]"):
+        self.pending = pending
+        self.requests: "list[dict[str, Any]]" = []
+
+    async def call(self, request: "Any") -> "set[int]":
+        self.requests.append(dict(request.variables))
+        after = request.variables["after"] or 0
+        limit = request.variables["limit"]
+        later = sorted(id for id in self.pending if id > after)
+        page = later[:limit]
+
+        return request.process_response(  # type: ignore[no-any-return]
+            {
+                "data": {
+                    "submissions": {
+                        "submissions": [{"id": id} for id in page],
+                        "pageInfo": {
+                            "endCursor": page[-1] if page else None,
+                            "hasNextPage": len(later) > limit,
+                        },
+                    }
+                }
+            }
+        )
+
+
+async def test_pages() -> None:
+    server = FakeServer(set(range(1, 26)))
+    pending_submission_ids = PendingSubmissionIds(
+        SubmissionIdsPendingAutoReview, 1, limit=10
+    )
+
+    assert await pending_submission_ids.poll(server.call) == set(range(1, 26))
+    assert [request["after"] for request in server.requests] == [None, 10, 20]
+
+
+@pytest.mark.parametrize("resync_delay", [None, 0])
+async def test_out_of_order(resync_delay: "float | None") -> None:
+    server = FakeServer({3, 5})
+    pending_submission_ids = PendingSubmissionIds(
+        SubmissionIdsPendingAutoReview, 1, resync_delay=resync_delay
+    )
+
+    assert await pending_submission_ids.poll(server.call) == {3, 5}
+
+    # Without incremental polling, submissions pending out of ID order are found by
+    # the next poll.
+    server.pending |= {1, 7}
+    assert await pending_submission_ids.poll(server.call) == {1, 3, 5, 7}
+    assert [request["after"] for request in server.requests] == [None, None]
+
+
+async def test_incremental(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = 0.0
+    monkeypatch.setattr("time.monotonic", lambda: clock)
+    server = FakeServer({3, 5})
+    pending_submission_ids = PendingSubmissionIds(
+        SubmissionIdsPendingAutoReview, 1, resync_delay=60
+    )
+
+    assert await pending_submission_ids.poll(server.call) == {3, 5}
+
+    # Only submissions after the highest ID seen are requested between resyncs.
+    server.pending |= {1, 7}
+    clock = 30
+    assert await pending_submission_ids.poll(server.call) == {7}
+
+    clock = 60
+    assert await pending_submission_ids.poll(server.call) == {1, 3, 5, 7}
+    assert [request["after"] for request in server.requests] == [None, 5, None]
+
+
+async def test_failed_resync(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = FakeServer({1})
+    pending_submission_ids = PendingSubmissionIds(
+        SubmissionIdsPendingAutoReview, 1, resync_delay=60
+    )
+
+    async def fail(request: "Any") -> "set[int]":
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        await pending_submission_ids.poll(fail)
+
+    # A failed resync is attempted again on the next poll.
+    await pending_submission_ids.poll(server.call)
+    assert server.requests[0]["after"] is None
+
+
+@pytest.mark.parametrize(
+    "end_cursor, afters",
+    [
+        (None, [None]),
+        (10, [None, 10]),
+    ],
+)
+async def test_stuck_cursor(
+    end_cursor: "int | None", afters: "list[int | None]"
+) -> None:
+    requests: "list[dict[str, Any]]" = []
+    pending_submission_ids = PendingSubmissionIds(SubmissionIdsPendingAutoReview, 1)
+
+    async def call(request: "Any") -> "set[int]":
+        requests.append(dict(request.variables))
+        return request.process_response(  # type: ignore[no-any-return]
+            {
+                "data": {
+                    "submissions": {
+                        "submissions": [{"id": 10}],
+                        "pageInfo": {"endCursor": end_cursor, "hasNextPage": True},
+                    }
+                }
+            }
+        )
+
+    # A next page without a new cursor stops paging rather than repeating the page.
+    assert await pending_submission_ids.poll(call) == {10}
+    assert [request["after"] for request in requests] == afters
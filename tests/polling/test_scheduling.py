@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from indico_toolkit.polling.scheduling import PollDelay, TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> "list[float]":
+    """
+    Record sleeps and advance a fake monotonic clock instead of waiting for them.
+    """
+    recorded: "list[float]" = []
+    clock = 0.0
+
+    async def sleep(delay: float) -> None:
+        nonlocal clock
+        recorded.append(delay)
+        clock += delay
+
+    monkeypatch.setattr("asyncio.sleep", sleep)
+    monkeypatch.setattr("time.monotonic", lambda: clock)
+    return recorded
+
+
+async def test_poll_delay_backoff(sleeps: "list[float]") -> None:
+    poll_delay = PollDelay(1, 10, backoff=2)
+
+    for _ in range(6):
+        await poll_delay.sleep()
+
+    poll_delay.reset()
+    await poll_delay.sleep()
+
+    assert sleeps == [1, 2, 4, 8, 10, 10, 1]
+
+
+def test_poll_delay_invalid() -> None:
+    with pytest.raises(ValueError):
+        PollDelay(10, 1)
+
+    with pytest.raises(ValueError):
+        PollDelay(0, 1)
+
+    with pytest.raises(ValueError):
+        PollDelay(1, 10, backoff=0.5)
+
+
+async def test_token_bucket_burst(sleeps: "list[float]") -> None:
+    token_bucket = TokenBucket(rate=2, burst=4)
+
+    for _ in range(4):
+        await token_bucket.acquire()
+
+    assert sleeps == []
+
+    await token_bucket.acquire()
+    await token_bucket.acquire()
+    assert sleeps == [0.5, 0.5]
+
+
+async def test_token_bucket_refill(sleeps: "list[float]") -> None:
+    token_bucket = TokenBucket(rate=2, burst=4)
+
+    for _ in range(4):
+        await token_bucket.acquire()
+
+    # Idling for 1.25 seconds accrues 2.5 tokens.
+    await asyncio.sleep(1.25)
+    await token_bucket.acquire()
+    await token_bucket.acquire()
+    assert sleeps == [1.25]
+
+    await token_bucket.acquire()
+    assert sleeps == [1.25, 0.25]
+
+    # Tokens never accrue past the burst size.
+    await asyncio.sleep(10)
+
+    for _ in range(4):
+        await token_bucket.acquire()
+
+    assert sleeps == [1.25, 0.25, 10]
+
+
+def test_token_bucket_invalid() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
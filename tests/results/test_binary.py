@@ -0,0 +1,70 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import etloutput, results
+from indico_toolkit.results import DocumentExtraction, Prediction, Result
+
+data_folder = Path(__file__).parent.parent / "data"
+
+
+@pytest.mark.parametrize("result_file", list(data_folder.glob("results/*.json")))
+def test_round_trip(result_file: Path) -> None:
+    result = results.load(result_file, reader=Path.read_text)
+    loaded = Result.from_bytes(result.to_bytes())
+
+    assert loaded == result
+    assert loaded.pre_review.to_changes(loaded) == result.pre_review.to_changes(result)
+
+
+def test_round_trip_ocr() -> None:
+    result = results.load(
+        data_folder / "results" / "classify_extract_accepted.json",
+        reader=Path.read_text,
+    )
+    etl_output = etloutput.load(
+        data_folder / "etloutput" / "4725" / "111924" / "110239" / "etl_output.json",
+        reader=lambda uri: (
+            data_folder / "etloutput" / str(uri).split("/storage/submission/")[-1]
+        ).read_bytes(),
+    )
+
+    for extraction in result.predictions.oftype(DocumentExtraction):
+        extraction.tokens = list(etl_output.tokens[:3])
+        extraction.table_cells = [
+            (table, cell) for table in etl_output.tables[:2] for cell in table.cells
+        ]
+
+    loaded = Result.from_bytes(result.to_bytes())
+    extraction, *_ = loaded.predictions.oftype(DocumentExtraction)
+
+    assert loaded == result
+    assert (
+        extraction.tables[0]
+        is loaded.predictions.oftype(DocumentExtraction)[-1].tables[0]
+    )
+
+
+def test_unsupported_prediction() -> None:
+    result = results.load(
+        data_folder / "results" / "classify_extract_accepted.json",
+        reader=Path.read_text,
+    )
+    document, task = result.documents[0], result.tasks[0]
+    prediction = Prediction(document, task, None, "label", {"label": 1.0}, {})
+    result = replace(result, predictions=results.PredictionList([prediction]))
+
+    with pytest.raises(TypeError):
+        result.to_bytes()
+
+
+def test_unsupported_version() -> None:
+    result = results.load(
+        data_folder / "results" / "classify_extract_accepted.json",
+        reader=Path.read_text,
+    )
+    data = result.to_bytes()
+
+    with pytest.raises(ValueError):
+        Result.from_bytes(data[:4] + b"\x02\x00" + data[6:])
@@ -1,8 +1,14 @@
+from copy import copy
+from dataclasses import replace
 from operator import attrgetter
+from pathlib import Path
 
 import pytest
 
+from indico_toolkit import etloutput
+from indico_toolkit.etloutput import Token
 from indico_toolkit.results import (
+    Box,
     Classification,
     Document,
     DocumentExtraction,
@@ -166,6 +172,16 @@ def test_groupbyiter(
     }
 
 
+def test_groupby_missing_key(predictions: "PredictionList[Prediction]") -> None:
+    predictions_by_label = predictions.groupby(attrgetter("label"))
+    predictions_by_group = predictions.extractions.groupbyiter(attrgetter("groups"))
+
+    assert predictions_by_label["Missing"] == []
+    assert isinstance(predictions_by_label["Missing"], PredictionList)
+    assert predictions_by_group[None] == []
+    assert isinstance(predictions_by_group[None], PredictionList)
+
+
 def test_orderby(predictions: "PredictionList[Prediction]") -> None:
     classification, first_name, last_name = predictions
     predictions = predictions.orderby(attrgetter("confidence"), reverse=True)
@@ -262,6 +278,90 @@ def test_where_page_in(predictions: "PredictionList[Prediction]") -> None:
     assert predictions.where(page_in=(0, 1)) == [first_name, last_name]
 
 
+def test_where_combined(
+    predictions: "PredictionList[Prediction]", auto_review: Review
+) -> None:
+    first_name, last_name = predictions.extractions
+    assert predictions.where(
+        task=TaskType.DOCUMENT_EXTRACTION, review_in={auto_review, None}
+    ) == [first_name]
+    assert predictions.where(
+        task=TaskType.DOCUMENT_EXTRACTION, min_confidence=0.85
+    ) == [last_name]
+
+
+def test_where_after_modification(
+    predictions: "PredictionList[Prediction]", auto_review: Review
+) -> None:
+    classification, first_name, last_name = predictions
+    assert predictions.where(review=None) == [classification]
+
+    predictions.reverse()
+    assert predictions.where(review_in={None, auto_review}) == [
+        first_name,
+        classification,
+    ]
+
+    predictions.append(classification)
+    assert predictions.where(review=None) == [classification, classification]
+
+    del predictions[-1]
+    predictions[0] = first_name
+    assert predictions.where(review=auto_review) == [first_name, first_name]
+
+    predictions.sort(key=attrgetter("confidence"))
+    assert predictions.where(review_in={None, auto_review}) == [
+        classification,
+        first_name,
+        first_name,
+    ]
+
+    predictions.clear()
+    assert predictions.where(review=auto_review) == []
+
+
+def test_where_after_reassignment(
+    predictions: "PredictionList[Prediction]",
+    document: Document,
+    auto_review: Review,
+) -> None:
+    classification, first_name, last_name = predictions
+    assert predictions.where(document=document) == predictions
+    assert predictions.where(review=None) == [classification]
+    assert predictions.where(label="First Name") == [first_name]
+    assert predictions.where(page=0) == [first_name]
+
+    assert isinstance(first_name, DocumentExtraction)
+    other_document = replace(document, id=2923)
+    last_name.document = other_document
+    classification.review = auto_review
+    first_name.label = "Given Name"
+    first_name.span = Span(page=1, start=352, end=356)
+
+    assert predictions.where(document=document) == [classification, first_name]
+    assert predictions.where(document=other_document) == [last_name]
+    assert predictions.where(review=None) == []
+    assert predictions.where(review=auto_review) == [classification, first_name]
+    assert predictions.where(label="First Name") == []
+    assert predictions.where(label_in={"Given Name"}) == [first_name]
+    assert predictions.where(page=0) == []
+    assert predictions.where(page_in={1}) == [first_name, last_name]
+
+
+def test_where_after_copy(predictions: "PredictionList[Prediction]") -> None:
+    classification, first_name, last_name = predictions
+    assert predictions.where(label="1040") == [classification]
+
+    copied = copy(predictions)
+    copied.reverse()
+    assert copied.where(label="1040") == [classification]
+    assert predictions.where(label="1040") == [classification]
+
+    copied[0].label = "1040"
+    assert copied.where(label="1040") == [last_name, classification]
+    assert predictions.where(label="1040") == [classification, last_name]
+
+
 def test_where_accepted(predictions: "PredictionList[Prediction]") -> None:
     first_name, last_name = predictions.extractions
     predictions.unaccept()
@@ -286,3 +386,120 @@ def test_where_rejected(predictions: "PredictionList[Prediction]") -> None:
 
     assert predictions.where(rejected=False) == []
     assert predictions.where(rejected=True) == [first_name, last_name]
+
+
+def test_threshold(predictions: "PredictionList[Prediction]") -> None:
+    first_name, last_name = predictions.extractions
+    predictions.unaccept().unreject()
+    predictions.threshold(
+        accept={"First Name": 0.8, "Last Name": 0.95, "1040": 0.5},
+        reject={"Last Name": 0.95},
+    )
+
+    assert (first_name.accepted, first_name.rejected) == (True, False)
+    assert (last_name.accepted, last_name.rejected) == (False, True)
+
+    predictions.threshold(accept={"Last Name": 0.9}, reject={"First Name": 0.5})
+
+    assert (first_name.accepted, first_name.rejected) == (True, False)
+    assert (last_name.accepted, last_name.rejected) == (True, False)
+
+
+def test_threshold_overlapping(predictions: "PredictionList[Prediction]") -> None:
+    with pytest.raises(ValueError, match="below its reject threshold"):
+        predictions.threshold(accept={"First Name": 0.5}, reject={"First Name": 0.6})
+
+
+def test_to_columns(predictions: "PredictionList[Prediction]") -> None:
+    first_name, _ = predictions.document_extractions
+    first_name.tokens = [
+        Token("Jo", Box(page=0, top=10, left=20, right=30, bottom=40), first_name.span),
+        Token("hn", Box(page=0, top=12, left=30, right=45, bottom=38), first_name.span),
+    ]
+    columns = predictions.to_columns()
+
+    assert columns == {
+        "document_id": [2922, 2922, 2922],
+        "task": [
+            "Tax Classification",
+            "1040 Document Extraction",
+            "1040 Document Extraction",
+        ],
+        "review_type": [None, "auto", "manual"],
+        "label": ["1040", "First Name", "Last Name"],
+        "confidence": [0.7, 0.8, 0.9],
+        "text": [None, "John", "Doe"],
+        "page": [None, 0, 1],
+        "start": [None, 352, 357],
+        "end": [None, 356, 360],
+        "top": [None, 10, None],
+        "left": [None, 20, None],
+        "right": [None, 45, None],
+        "bottom": [None, 40, None],
+        "accepted": [None, False, False],
+        "rejected": [None, False, False],
+    }
+    assert PredictionList().to_columns() == {name: [] for name in columns}
+
+
+def test_to_pandas(predictions: "PredictionList[Prediction]") -> None:
+    pytest.importorskip("pandas")
+    data_frame = predictions.to_pandas()
+
+    assert list(data_frame.columns) == list(predictions.to_columns())
+    assert data_frame["page"].dtype == "Int64"
+    assert data_frame["page"].isna().tolist() == [True, False, False]
+
+
+def test_to_arrow(predictions: "PredictionList[Prediction]") -> None:
+    pytest.importorskip("pyarrow")
+    table = predictions.to_arrow()
+
+    assert table.to_pydict() == predictions.to_columns()
+    assert str(table.schema.field("page").type) == "int64"
+    assert str(PredictionList().to_arrow().schema.field("page").type) == "int64"
+
+
+def test_assign_ocr(
+    document: Document, extraction_task: Task, manual_review: Review
+) -> None:
+    data_folder = Path(__file__).parent.parent / "data" / "etloutput"
+    etl_output = etloutput.load(
+        data_folder / "4725" / "111924" / "110239" / "etl_output.json",
+        reader=lambda uri: (
+            data_folder / str(uri).split("/storage/submission/")[-1]
+        ).read_bytes(),
+    )
+    spans = [
+        [Span(page=1, start=1281, end=1285), Span(page=1, start=1343, end=1349)],
+        [Span(page=1, start=1311, end=1344)],
+        [Span(page=1, start=1056, end=1067), Span(page=3, start=1281, end=1285)],
+    ]
+    predictions = PredictionList(
+        DocumentExtraction(
+            document=document,
+            task=extraction_task,
+            review=manual_review,
+            label="Label",
+            confidences={"Label": 0.9},
+            extras={},
+            text="",
+            accepted=False,
+            rejected=False,
+            groups=set(),
+            spans=extraction_spans,
+        )
+        for extraction_spans in spans
+    )
+
+    predictions.assign_ocr({document: etl_output})
+
+    for extraction, extraction_spans in zip(predictions, spans):
+        assert extraction.tokens == list(
+            filter(None, map(etl_output.token_for, extraction_spans))
+        )
+        assert extraction.cells == [
+            cell
+            for span in extraction_spans
+            for _, cell in etl_output.table_cells_for(span)
+        ]
@@ -0,0 +1,134 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from indico_toolkit import results
+from indico_toolkit.results import Document, PredictionList, Result
+from indico_toolkit.results.streaming import iter_result_file
+
+data_folder = Path(__file__).parent.parent / "data"
+result_files = list(data_folder.glob("results/*.json"))
+
+
+def streamed(
+    pairs: "list[tuple[Document, PredictionList[results.Prediction]]]",
+) -> "tuple[list[Document], list[results.Prediction]]":
+    documents = sorted(document for document, _ in pairs)
+    predictions = [
+        prediction
+        for _, document_predictions in pairs
+        for prediction in document_predictions
+    ]
+    return documents, predictions
+
+
+@pytest.mark.parametrize("result_file", result_files)
+def test_equivalent(result_file: Path) -> None:
+    result = results.load(result_file, reader=Path.read_text)
+    pairs = list(results.iter_documents(result_file, reader=Path.read_text))
+    documents, predictions = streamed(pairs)
+
+    assert documents == list(result.documents)
+    assert predictions == list(result.predictions)
+
+    for document, document_predictions in pairs:
+        assert all(
+            prediction.document == document for prediction in document_predictions
+        )
+
+
+@pytest.mark.parametrize("result_file", result_files)
+def test_dict_and_bytes(result_file: Path) -> None:
+    text = result_file.read_text()
+    from_text = list(results.iter_documents(text))
+    from_bytes = list(results.iter_documents(text.encode()))
+    from_dict = list(results.iter_documents(json.loads(text)))
+    from_indented = list(results.iter_documents(json.dumps(json.loads(text), indent=4)))
+
+    assert from_text == from_bytes == from_dict == from_indented
+
+
+@pytest.mark.parametrize("result_file", result_files)
+def test_file(result_file: Path) -> None:
+    from_text = list(results.iter_documents(result_file.read_text()))
+
+    with result_file.open("rb") as file:
+        from_file = list(results.iter_documents(file))
+
+    assert from_file == from_text
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_chunk_size(chunk_size: int) -> None:
+    result_file = data_folder / "results" / "classify_extract_accepted.json"
+    result_dict = json.loads(result_file.read_text())
+    # Strings with escapes, quotes, and brackets must not end values early.
+    result_dict["submission_results"][0]["input_filename"] = 'a "[{" \\ ]}\\'
+    text = json.dumps(result_dict, indent=2)
+
+    from_text = list(results.iter_documents(json.loads(text)))
+    from_chunks = list(iter_result_file(io.BytesIO(text.encode()), chunk_size))
+
+    assert from_chunks == from_text
+
+
+def test_decoded_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    result_file = data_folder / "results" / "classify_extract_accepted.json"
+    data = result_file.read_bytes()
+    decoded: "list[bytes]" = []
+    json_loaded = results.utils.json_loaded
+
+    def recording_json_loaded(value: bytes) -> object:
+        decoded.append(value)
+        return json_loaded(value)
+
+    monkeypatch.setattr(
+        "indico_toolkit.results.streaming.json_loaded", recording_json_loaded
+    )
+    list(iter_result_file(io.BytesIO(data), chunk_size=64))
+
+    document_dicts = [
+        value
+        for value in map(json.loads, decoded)
+        if isinstance(value, dict) and "submissionfile_id" in value
+    ]
+
+    assert document_dicts == json.loads(data)["submission_results"]
+    assert sum(map(len, decoded)) < len(data)
+
+
+def test_empty_submission_results() -> None:
+    result_dict = json.loads(
+        (data_folder / "results" / "classify_extract_accepted.json").read_text()
+    )
+    result_dict["submission_results"] = []
+    result_dict["errored_files"] = {}
+
+    assert list(results.iter_documents(json.dumps(result_dict))) == []
+    assert Result.from_dict(result_dict).documents == ()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[]",
+        '{"file_version": 3 "submission_id": 1}',
+        '{"submission_results": [{}, ]}',
+        '{"submission_results": [{}',
+        '{"file_version": 3,',
+    ],
+)
+def test_invalid_json(text: str) -> None:
+    with pytest.raises(ValueError):
+        list(results.iter_documents(text))
+
+    with pytest.raises(ValueError):
+        list(iter_result_file(io.BytesIO(text.encode()), chunk_size=1))
+
+
+def test_unsupported_version() -> None:
+    with pytest.raises(ValueError, match="unsupported result file version"):
+        list(results.iter_documents('{"file_version": 1, "submission_results": []}'))